@@ -0,0 +1,28 @@
+from .batch import BatchedMixin, InterpolationBatch, batchable
+from .bench import SUITE, bench_scene, compare, run_suite
+from .coalesce import CoalescingMixin, CoalescingRenderer
+from .compact import Float32Array, Float32Mixin, float32_storage
+from .compose import ComposedScene, collect, compose
+from .cow import CopyOnWriteMixin, CowArray, copy_on_write
+from .culling import CullingCamera, CullingMixin, CullingRenderer
+from .damage import DamageMixin, DamageRenderer
+from .depthsort import DepthSortMixin, IncrementalSortCamera
+from .family import FamilyCacheMixin, TrackedList, cached_families
+from .hooks import TexRecorder, count_tex_cache, peak_rss_bytes, rss_bytes
+from .layers import StaticLayerMixin, StaticLayerRenderer
+from .loader import default_camera_class, instrument, load_module, load_scenes, scene_classes
+from .lod import Impostor, LevelOfDetailMixin, LodCamera, convex_hull
+from .memory import MemoryMixin, MemoryRecord, live_mobjects, measure_memory, referrer_chain
+from .micro import SWEEPS, Sweep, SweepResult, fit_scaling, run_sweep
+from .partial import PartialPathMixin, PartialPaths, partial_curves, partial_drawing
+from .profiler import PlayProfile, Profiler, ProfilerMixin, profile_scene, to_folded, to_speedscope
+from .reactive import ReactiveMixin, ReactiveRenderer, depends_on, member_key, state_key, updater_inputs
+from .rects import RectFillCamera, RectFillMixin, blit_rect, device_rect
+from .render import FEATURES, with_features
+from .shading import ShadingCacheCamera, ShadingCacheMixin, shading_indices
+from .simplify import SimplifiedPathsMixin, douglas_peucker, fit_cubic, no_simplification, simplified_paths, simplify
+from .stats import CacheStats, cache_stats
+from .templates import ARC_TEMPLATES, TemplateMixin, polygon_points, primitive_templates
+from .tessellation import TESSELLATIONS, TessellationMixin, cached_tessellations, clone_face
+from .tiles import TiledCamera, TiledMixin
+from .timeline import DryRunRenderer, PlayRecord, TimelineMixin, dry_run
@@ -0,0 +1,23 @@
+import argparse
+import os
+
+from . import bench, memory, micro, profiler, render, timeline
+
+# `python -m perf <tool> ...` from the repository root.
+TOOLS = [timeline, profiler, memory, bench, micro, render]
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "python -m perf", description = "Performance tooling for the manim projects in this repository.")
+    subparsers = parser.add_subparsers(dest = "tool", required = True)
+    for tool in TOOLS:
+        tool.register(subparsers)
+    args = parser.parse_args(argv)
+
+    # Loading a project chdirs into its folder, so pin paths down first
+    for name in getattr(args, "path_args", []):
+        if getattr(args, name, None):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
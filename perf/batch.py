@@ -0,0 +1,158 @@
+import weakref
+
+import numpy as np
+from manim import *
+from manim.utils.paths import straight_path
+
+from .stats import cache_stats
+
+# Batched interpolation: the families of all plain Transforms in a play
+# (ReplacementTransform, .animate, FadeIn/FadeOut, ...) are packed into one
+# contiguous array per attribute, with every submobject's points and colours
+# turned into views of it. Each frame is then one vectorised interpolation
+# per attribute instead of a Python loop over animations and submobjects.
+
+# Per-submobject arrays interpolated in the batch
+BATCHED_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+# Interpolated by VMobject.interpolate_color too; batched submobjects must have them constant
+CONSTANT_ATTRS = ("stroke_width", "background_stroke_width", "sheen_factor")
+
+# id -> every packed buffer still alive, so others can tell views into one apart
+PACKED_BUFFERS = weakref.WeakValueDictionary()
+
+def is_packed(array):
+    """Whether array is a view into the packed buffer of a live batch."""
+    base = getattr(array, "base", None)
+    return base is not None and PACKED_BUFFERS.get(id(base)) is base
+
+def batchable(animation):
+    """True for Transforms interpolating straight, without lag, through the stock methods."""
+    cls = type(animation)
+    return (
+        isinstance(animation, Transform)
+        and cls.interpolate is Animation.interpolate
+        and cls.interpolate_mobject is Animation.interpolate_mobject
+        and cls.get_sub_alpha is Animation.get_sub_alpha
+        and cls.interpolate_submobject is Transform.interpolate_submobject
+        and animation.path_func is straight_path()
+        and animation.lag_ratio == 0
+    )
+
+def _fast(sub, start, target):
+    """Whether a zipped (submobject, start, target) triple can be interpolated in the batch."""
+    if not all(isinstance(m, VMobject) for m in (sub, start, target)):
+        return False
+    for attr in BATCHED_ARRAYS:
+        if getattr(start, attr).shape != getattr(target, attr).shape:
+            return False
+    return (
+        all(getattr(start, attr) == getattr(target, attr) for attr in CONSTANT_ATTRS)
+        and np.array_equal(start.sheen_direction, target.sheen_direction)
+    )
+
+class InterpolationBatch():
+    """
+    The batchable animations of one play, packed for vectorised interpolation.
+
+    Animations sharing a rate function and run time share one alpha per frame.
+    Submobjects whose start and target cannot be packed (different array
+    shapes or stroke widths, non-VMobjects) are interpolated one by one as
+    usual. finish() interpolates every animation the normal way, which gives
+    each submobject its own arrays back.
+    """
+    def __init__(self, animations):
+        self.animations = [a for a in animations if batchable(a)]
+        self.ids = {id(a) for a in self.animations}
+        # Starting and target copies only need updating if anything in them has updaters
+        self.to_update = [
+            a for a in self.animations
+            if any(m.updaters for mob in a.get_all_mobjects_to_update() for m in mob.get_family())
+        ]
+
+        groups, group_of = [], {}
+        rows = {attr: ([], [], []) for attr in BATCHED_ARRAYS}
+        fast, self.slow = [], []
+        for animation in self.animations:
+            key = (animation.rate_func, animation.run_time, animation.reverse_rate_function)
+            if key not in group_of:
+                group_of[key] = len(groups)
+                groups.append(animation)
+            group = group_of[key]
+            for sub, start, target in animation.get_all_families_zipped():
+                if not _fast(sub, start, target):
+                    self.slow.append((animation, sub, start, target))
+                    continue
+                fast.append((sub, start))
+                for attr in BATCHED_ARRAYS:
+                    starts, ends, owners = rows[attr]
+                    starts.append(getattr(start, attr))
+                    ends.append(getattr(target, attr))
+                    owners.append(np.full(len(starts[-1]), group))
+        self.groups = groups
+        cache_stats("batched submobjects").hit(len(fast))
+        cache_stats("batched submobjects").miss(len(self.slow))
+
+        self.arrays = []
+        if not fast:
+            return
+        for attr in BATCHED_ARRAYS:
+            starts, ends, owners = rows[attr]
+            start = np.concatenate(starts).astype(float)
+            buffer = start.copy()
+            PACKED_BUFFERS[id(buffer)] = buffer
+            self.arrays.append((buffer, start, np.concatenate(ends) - start, np.concatenate(owners)))
+            offset = 0
+            for (sub, _), part in zip(fast, starts):
+                setattr(sub, attr, buffer[offset:offset + len(part)])
+                offset += len(part)
+        for sub, start in fast:
+            for attr in CONSTANT_ATTRS:
+                setattr(sub, attr, getattr(start, attr))
+            sub.sheen_direction = np.array(start.sheen_direction)
+
+    def __contains__(self, animation):
+        return id(animation) in self.ids
+
+    def update_mobjects(self, dt):
+        for animation in self.to_update:
+            animation.update_mobjects(dt)
+
+    def interpolate(self, t):
+        alphas = np.array([a.get_sub_alpha(t / a.run_time, 0, 1) for a in self.groups], dtype = float)
+        for buffer, start, delta, owners in self.arrays:
+            np.multiply(delta, alphas[owners][:, None], out = buffer)
+            buffer += start
+        for animation, sub, start, target in self.slow:
+            animation.interpolate_submobject(sub, start, target, animation.get_sub_alpha(t / animation.run_time, 0, 1))
+
+class BatchedMixin():
+    """Scene mixin interpolating the plain Transforms of each play in one batch (see InterpolationBatch)."""
+    animation_batch = None
+
+    def begin_animations(self):
+        super().begin_animations()
+        batch = InterpolationBatch(self.animations)
+        self.animation_batch = batch if batch.animations else None
+
+    def play_internal(self, skip_rendering = False):
+        try:
+            return super().play_internal(skip_rendering)
+        finally:
+            self.animation_batch = None
+
+    def update_to_time(self, t):
+        batch = self.animation_batch
+        if batch is None:
+            return super().update_to_time(t)
+        dt = t - self.last_t
+        self.last_t = t
+        for animation in self.animations:
+            if animation not in batch:
+                animation.update_mobjects(dt)
+                animation.interpolate(t / animation.run_time)
+        batch.update_mobjects(dt)
+        batch.interpolate(t)
+        self.update_mobjects(dt)
+        self.update_meshes(dt)
+        self.update_self(dt)
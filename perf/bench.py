@@ -0,0 +1,234 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+import manim
+from manim import *
+
+from .hooks import count_tex_cache, peak_rss_bytes
+from .loader import load_scenes
+from .render import FEATURES, with_features
+from .stats import snapshot
+
+# Scene benchmarks: render a fixed set of representative scenes at a fixed low
+# resolution, each in its own process so peak memory means something, and keep
+# the results in a JSON history that can be compared across git revisions.
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# (name, project script relative to the repository root, scene)
+SUITE = [
+    ("Cantor", "pts/main.py", "Cantor"),
+    ("DimensionLadderExtrude", "pts/main.py", "DimensionLadderExtrude"),
+    ("Slider_C_Chart", "pts/main.py", "Slider_C_Chart"),
+    ("EffectiveDimensionDyadic", "pts/main.py", "EffectiveDimensionDyadic"),
+    ("ParityBlock", "parity_teaser/main.py", "ParityBlock"),
+    ("UpdatingMatrixAnimation", "klein/main.py", "UpdatingMatrixAnimation"),
+    ("level_statements", "hat_problems/main.py", "level_statements"),
+]
+
+BENCH_WIDTH = 480
+BENCH_HEIGHT = 270
+BENCH_FPS = 15
+DEFAULT_HISTORY = ROOT / "perf" / "bench_history.json"
+
+# Relative change in wall time or peak memory that counts as real, not noise
+DEFAULT_THRESHOLD = 0.10
+
+# ---------- one scene, in a child process ----------
+
+def bench_scene(file, scene_name, features = ()):
+    """Render one scene (with the named perf features on) at the benchmark settings and return its measurements."""
+    scene_cls, = load_scenes(file, [scene_name])
+    config.pixel_width = BENCH_WIDTH
+    config.pixel_height = BENCH_HEIGHT
+    config.frame_rate = BENCH_FPS
+    config.disable_caching = True
+    count_tex_cache()
+
+    # Rendered videos and partial movie files are thrown away with the directory
+    with tempfile.TemporaryDirectory(prefix = "perf-bench-") as video_dir:
+        config.video_dir = video_dir
+        start = perf_counter()
+        scene = with_features(scene_cls, features)()
+        scene.render()
+        wall = perf_counter() - start
+
+    frames = round(scene.renderer.time * config.frame_rate)
+    return {
+        "wall": wall,
+        "frames": frames,
+        "fps": frames / wall if wall else 0.0,
+        "peak_rss": peak_rss_bytes(),
+        "caches": snapshot(),
+    }
+
+def run_child(root, file, scene_name, features = ()):
+    """
+    bench_scene in a fresh interpreter, against the project files under root.
+
+    The child always runs this checkout's perf package, so older revisions
+    (with or without a perf folder of their own) are measured the same way.
+    """
+    env = dict(os.environ, PYTHONPATH = os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-m", "perf", "bench", "child", str(Path(root) / file), scene_name, *(f"--feature={f}" for f in features)],
+        env = env, cwd = ROOT, capture_output = True, text = True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"{scene_name} failed:\n{result.stderr[-4000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def run_suite(root = ROOT, names = None, repeat = 3, features = ()):
+    """Every selected benchmark `repeat` times; median wall and fps, worst peak memory."""
+    results = {}
+    for name, file, scene_name in SUITE:
+        if names and name not in names:
+            continue
+        runs = [run_child(root, file, scene_name, features) for _ in range(repeat)]
+        results[name] = {
+            "wall": statistics.median(r["wall"] for r in runs),
+            "walls": [r["wall"] for r in runs],
+            "frames": runs[0]["frames"],
+            "fps": statistics.median(r["fps"] for r in runs),
+            "peak_rss": max(r["peak_rss"] for r in runs),
+            "caches": runs[-1]["caches"],
+        }
+        print(format_result(name, results[name]), flush = True)
+    return results
+
+def format_result(name, r):
+    caches = ", ".join(f"{c} {s['hit_rate']:.0%}" for c, s in r["caches"].items())
+    return (
+        f"{name:<26} {r['wall']:>8.2f}s {r['frames']:>6} frames {r['fps']:>7.1f} fps "
+        f"{r['peak_rss'] / 1024 / 1024:>8.1f} MB" + (f"  hits: {caches}" if caches else "")
+    )
+
+# ---------- history ----------
+
+def git(*args, cwd = ROOT):
+    return subprocess.run(["git", *args], cwd = cwd, capture_output = True, text = True, check = True).stdout.strip()
+
+def load_history(path):
+    if not Path(path).is_file():
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+def save_entry(path, entry):
+    history = load_history(path)
+    history.append(entry)
+    with open(path, "w") as f:
+        json.dump(history, f, indent = 2)
+
+def make_entry(revision, dirty, results, features = ()):
+    return {
+        "revision": revision,
+        "dirty": dirty,
+        "date": datetime.now(timezone.utc).isoformat(timespec = "seconds"),
+        "python": platform.python_version(),
+        "manim": manim.__version__,
+        "machine": platform.node(),
+        "settings": {"width": BENCH_WIDTH, "height": BENCH_HEIGHT, "fps": BENCH_FPS},
+        "features": sorted(features),
+        "results": results,
+    }
+
+def latest_entry(history, revision, features = ()):
+    """The most recent entry for a revision (full hash, or any prefix of it) run with exactly these features."""
+    full = git("rev-parse", revision)
+    for entry in reversed(history):
+        if entry["revision"] == full and entry.get("features", []) == sorted(features):
+            return entry
+    raise SystemExit(f"no benchmark results for {revision} ({full[:10]}); run `python -m perf bench run --revision {revision}` first")
+
+def compare(old, new, threshold = DEFAULT_THRESHOLD):
+    """
+    (name, metric, old, new, change, verdict) for every benchmark in both entries.
+
+    Wall time and peak memory are compared; a relative change larger than the
+    threshold is a "regression" or an "improvement", anything smaller is noise.
+    """
+    rows = []
+    for name, a in old["results"].items():
+        b = new["results"].get(name)
+        if b is None:
+            continue
+        for metric in ("wall", "peak_rss"):
+            change = (b[metric] - a[metric]) / a[metric] if a[metric] else 0.0
+            verdict = "regression" if change > threshold else "improvement" if change < -threshold else ""
+            rows.append((name, metric, a[metric], b[metric], change, verdict))
+    return rows
+
+# ---------- command line ----------
+
+def register(subparsers):
+    parser = subparsers.add_parser("bench", help = "scene benchmark suite with a JSON history")
+    actions = parser.add_subparsers(dest = "action", required = True)
+
+    run = actions.add_parser("run", help = "run the suite and append the results to the history")
+    run.add_argument("names", nargs = "*", help = f"benchmarks to run (default: all of {', '.join(n for n, _, _ in SUITE)})")
+    run.add_argument("--revision", help = "benchmark this git revision's scenes (checked out into a temporary worktree)")
+    run.add_argument("--repeat", type = int, default = 3, help = "runs per scene, the median is kept (default: 3)")
+    run.add_argument("--feature", action = "append", default = [], choices = list(FEATURES),
+                     help = "render with this perf feature on (repeatable)")
+    run.add_argument("--history", default = str(DEFAULT_HISTORY), help = "history file (default: perf/bench_history.json)")
+    run.set_defaults(func = main_run, path_args = ["history"])
+
+    cmp = actions.add_parser("compare", help = "compare the latest results of two revisions")
+    cmp.add_argument("old", help = "baseline revision")
+    cmp.add_argument("new", nargs = "?", default = "HEAD", help = "revision to check (default: HEAD)")
+    cmp.add_argument("--threshold", type = float, default = DEFAULT_THRESHOLD, help = "relative change treated as noise (default: 0.10)")
+    cmp.add_argument("--old-feature", action = "append", default = [], choices = list(FEATURES), help = "features of the baseline run")
+    cmp.add_argument("--new-feature", action = "append", default = [], choices = list(FEATURES), help = "features of the run to check")
+    cmp.add_argument("--history", default = str(DEFAULT_HISTORY), help = "history file (default: perf/bench_history.json)")
+    cmp.set_defaults(func = main_compare, path_args = ["history"])
+
+    child = actions.add_parser("child", help = argparse.SUPPRESS)
+    child.add_argument("file")
+    child.add_argument("scene")
+    child.add_argument("--feature", action = "append", default = [])
+    child.set_defaults(func = main_child, path_args = ["file"])
+
+def main_child(args):
+    print(json.dumps(bench_scene(args.file, args.scene, args.feature)))
+
+def main_run(args):
+    if not args.revision:
+        revision = git("rev-parse", "HEAD")
+        dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+        results = run_suite(ROOT, args.names, args.repeat, args.feature)
+    else:
+        revision, dirty = git("rev-parse", args.revision), False
+        worktree = tempfile.mkdtemp(prefix = "perf-bench-worktree-")
+        git("worktree", "add", "--detach", worktree, revision)
+        try:
+            results = run_suite(worktree, args.names, args.repeat, args.feature)
+        finally:
+            git("worktree", "remove", "--force", worktree)
+    save_entry(args.history, make_entry(revision, dirty, results, args.feature))
+    print(f"saved to {args.history} as {revision[:10]}{' (dirty)' if dirty else ''}")
+
+def format_metric(metric, value):
+    return f"{value:.2f}s" if metric == "wall" else f"{value / 1024 / 1024:.1f}MB"
+
+def main_compare(args):
+    history = load_history(args.history)
+    old = latest_entry(history, args.old, args.old_feature)
+    new = latest_entry(history, args.new, args.new_feature)
+    if old["settings"] != new["settings"] or old["machine"] != new["machine"]:
+        print("warning: the two entries were recorded with different settings or on different machines")
+    regressions = 0
+    for name, metric, a, b, change, verdict in compare(old, new, args.threshold):
+        print(f"{name:<26} {metric:<9} {format_metric(metric, a):>10} -> {format_metric(metric, b):>10} {change:>+8.1%}  {verdict}")
+        regressions += verdict == "regression"
+    if regressions:
+        raise SystemExit(f"{regressions} regression(s) beyond {args.threshold:.0%}")
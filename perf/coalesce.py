@@ -0,0 +1,115 @@
+from contextlib import contextmanager
+
+from manim import *
+
+from .compose import ComposedScene
+from .stats import cache_stats
+
+# Coalesced plays: runs of short plays (the 0.12 s steps in Slider_C_Chart,
+# the three plays of every ParityBlock click) are written into one partial
+# movie file instead of one each. Every play still runs on its own, so the
+# frames are exactly the ones manim would write; what goes is the per-play
+# overhead around them: hashing the whole scene for the cache, and opening,
+# flushing and closing an encoder stream.
+
+# Plays at most this long (in seconds) are coalesced with their neighbours
+MAX_COALESCED_RUN_TIME = 0.5
+
+def _noop(*args, **kwargs):
+    pass
+
+class CoalescingRenderer():
+    """
+    Renderer mixin writing consecutive coalesced plays into one partial movie file.
+
+    The first written play of a run opens the stream as usual; later plays
+    skip the cache hash, add no file of their own (a None entry keeps the
+    list in step with num_plays) and write on into the open stream, which is
+    closed when a play that is not coalesced comes along, at a new section
+    or when the scene finishes.
+    """
+    coalescing = False
+    _coalesce_next = False
+    _segment_open = False
+
+    def plan_play(self, scene):
+        """Called once a play's animations are compiled: decide whether it joins the current run."""
+        self._coalesce_next = self.coalescing or scene.duration <= MAX_COALESCED_RUN_TIME
+        if not self._coalesce_next:
+            self.end_segment()
+
+    def end_segment(self):
+        """Close the partial movie file the coalesced plays so far were written into."""
+        if self._segment_open:
+            self._segment_open = False
+            self.file_writer.end_animation(True)
+
+    def play(self, scene, *args, **kwargs):
+        self._coalesce_next = False
+        writer = self.file_writer
+        caching_disabled = config.disable_caching
+
+        def add_partial_movie_file(hash_animation):
+            # Deciding happens in plan_play, after compiling and before hashing
+            if not self._coalesce_next:
+                return type(writer).add_partial_movie_file(writer, hash_animation)
+            writer.end_animation = _noop
+            if self._segment_open:
+                writer.begin_animation = _noop
+                cache_stats("coalesced plays").hit()
+                return type(writer).add_partial_movie_file(writer, None)
+            if hash_animation is not None:
+                cache_stats("coalesced plays").miss()
+            return type(writer).add_partial_movie_file(writer, hash_animation)
+
+        writer.add_partial_movie_file = add_partial_movie_file
+        try:
+            super().play(scene, *args, **kwargs)
+            if self._coalesce_next and not self.skip_animations:
+                self._segment_open = True
+        finally:
+            for name in ("add_partial_movie_file", "begin_animation", "end_animation"):
+                writer.__dict__.pop(name, None)
+            config.disable_caching = caching_disabled
+            self._coalesce_next = False
+
+    def scene_finished(self, scene):
+        self.end_segment()
+        return super().scene_finished(scene)
+
+class CoalescingMixin(ComposedScene):
+    """
+    Scene mixin coalescing runs of plays no longer than MAX_COALESCED_RUN_TIME.
+
+    Coalesced plays are not cached, since they share a file. Inside
+    `with self.coalesce():` every play is coalesced, whatever its length.
+    """
+    renderer_mixins = (CoalescingRenderer,)
+
+    def compile_animation_data(self, *animations, **play_kwargs):
+        result = super().compile_animation_data(*animations, **play_kwargs)
+        if isinstance(self.renderer, CoalescingRenderer):
+            self.renderer.plan_play(self)
+            if self.renderer._coalesce_next:
+                # Skips get_hash_from_play_call; play() puts the setting back
+                config.disable_caching = True
+        return result
+
+    @contextmanager
+    def coalesce(self):
+        """Write every play in the block into one partial movie file."""
+        renderer = self.renderer
+        if not isinstance(renderer, CoalescingRenderer) or renderer.coalescing:
+            yield
+            return
+        renderer.coalescing = True
+        try:
+            yield
+        finally:
+            renderer.coalescing = False
+            renderer.end_segment()
+
+    def next_section(self, *args, **kwargs):
+        if isinstance(self.renderer, CoalescingRenderer):
+            self.renderer.end_segment()
+        super().next_section(*args, **kwargs)
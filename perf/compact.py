@@ -0,0 +1,95 @@
+from contextlib import contextmanager
+
+import numpy as np
+from manim import *
+
+from .batch import is_packed
+from .stats import cache_stats
+
+# Compact storage: while active, mobject points (and optionally colours)
+# are stored as float32 instead of float64, halving what large scenes (the
+# level-3 sponge, dyadic grids, big parity boards) keep in memory. Arithmetic
+# still happens in whatever precision numpy picks for it, usually float64
+# since transform matrices and vectors are float64; only the stored result
+# is rounded, to about 1e-7 of its size, far below a pixel.
+
+# Array attributes stored as float32, by the class storing them
+POINT_ATTRS = {Mobject: ("points",)}
+COLOUR_ATTRS = {
+    VMobject: ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"),
+    PMobject: ("rgbas",),
+}
+
+def keeps_float64(mob):
+    """
+    Whether mob keeps float64 storage: ValueTrackers (their value is a point
+    coordinate, and is often accumulated) and mobjects with keep_float64 set.
+    """
+    return isinstance(mob, ValueTracker) or getattr(mob, "keep_float64", False)
+
+class Float32Array():
+    """
+    Data descriptor storing a mobject array attribute as float32.
+
+    Views into the packed buffers of --batch are stored as they are, since
+    copying them would cut them off from their buffer; every other array,
+    views included (apply_along_axis and reshape results), is converted.
+    Works on top of another descriptor already on the class (--cow's).
+    """
+    def __init__(self, name, previous = None):
+        self.name = name
+        self.previous = previous
+
+    def __get__(self, mob, owner = None):
+        if mob is None:
+            return self
+        if self.previous is not None:
+            return self.previous.__get__(mob, owner)
+        try:
+            return mob.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, mob, value):
+        if not is_packed(value) and not keeps_float64(mob):
+            array = np.asarray(value)
+            if array.dtype != np.float32 and array.dtype.kind in "fiu":
+                cache_stats("float32").hit()
+                value = array.astype(np.float32)
+        if self.previous is not None:
+            self.previous.__set__(mob, value)
+        else:
+            mob.__dict__[self.name] = value
+
+@contextmanager
+def float32_storage(colours = False):
+    """Store mobject points, and colours if asked, as float32 while the block runs."""
+    attrs = dict(POINT_ATTRS)
+    if colours:
+        attrs.update(COLOUR_ATTRS)
+    saved = []
+    for klass, names in attrs.items():
+        for name in names:
+            previous = klass.__dict__.get(name)
+            saved.append((klass, name, previous))
+            setattr(klass, name, Float32Array(name, previous))
+    try:
+        yield
+    finally:
+        for klass, name, previous in reversed(saved):
+            if previous is None:
+                delattr(klass, name)
+            else:
+                setattr(klass, name, previous)
+
+class Float32Mixin():
+    """
+    Scene mixin rendering with float32 mobject points (see float32_storage).
+
+    Set float32_colours to store colours as float32 too.
+    """
+    float32_colours = False
+
+    def render(self, *args, **kwargs):
+        with float32_storage(self.float32_colours):
+            return super().render(*args, **kwargs)
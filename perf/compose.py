@@ -0,0 +1,49 @@
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from .loader import default_camera_class
+
+# Scene mixins in this folder often need to change the renderer or camera as
+# well. Rather than each one building its own, a mixin lists the classes it
+# needs in `renderer_mixins` / `camera_mixins`, and ComposedScene stacks all
+# of them (in MRO order) on top of CairoRenderer and the scene's own camera.
+
+def compose(base, mixins, name = None):
+    """A subclass of base with the mixins in front of it (base itself if there are none)."""
+    mixins = tuple(m for m in mixins if not issubclass(base, m))
+    if not mixins:
+        return base
+    return type(name or base.__name__, (*mixins, base), {})
+
+def collect(scene_cls, attr):
+    """Every class listed under attr by scene_cls or its bases, outermost first, without repeats."""
+    found = []
+    for klass in scene_cls.__mro__:
+        for mixin in klass.__dict__.get(attr, ()):
+            if mixin not in found:
+                found.append(mixin)
+    return found
+
+class ComposedScene():
+    """
+    Base for scene mixins that declare renderer_mixins / camera_mixins.
+
+    Only kicks in for the Cairo renderer and when no renderer was passed in.
+    """
+    renderer_mixins = ()
+    camera_mixins = ()
+    renderer_base = CairoRenderer
+
+    def __init__(self, *args, renderer = None, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = self.build_renderer(
+                kwargs.get("camera_class") or default_camera_class(type(self)),
+                kwargs.get("skip_animations", False),
+            )
+        super().__init__(*args, renderer = renderer, **kwargs)
+
+    @classmethod
+    def build_renderer(cls, camera_class, skip_animations = False):
+        camera_class = compose(camera_class, collect(cls, "camera_mixins"))
+        renderer_class = compose(cls.renderer_base, collect(cls, "renderer_mixins"))
+        return renderer_class(camera_class = camera_class, skip_animations = skip_animations)
@@ -0,0 +1,142 @@
+import copy
+from contextlib import contextmanager
+
+import numpy as np
+from manim import *
+
+from .stats import cache_stats
+
+# Copy-on-write mobject arrays: while active, copying a mobject (which is
+# what .animate, generate_target and every Transform do) hands the copy the
+# same points and colour arrays instead of duplicating them. Shared arrays
+# are marked read-only; reading them goes through a thin view that remembers
+# its mobject, and the first write through that view gives the mobject its
+# own copy and carries the write out on it.
+
+# Per-mobject array attributes that copies share, by the class storing them
+SHARED_ATTRS = {
+    Mobject: ("points",),
+    VMobject: ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"),
+    PMobject: ("rgbas",),
+}
+
+class CowArray(np.ndarray):
+    """
+    A read-only view of a shared array, as returned by a mobject attribute.
+
+    Item assignment and ufuncs writing into it (`points += v`, `np.add(..., out = points)`)
+    first give the mobject its own writable copy, and every later write
+    through the same view goes to that copy too (update_rgbas_array writes
+    `rgbas[:, :3]`, then `rgbas[:, 3]`). Everything else is computed on the
+    plain array, so results are ordinary ndarrays. Views derived from
+    this one (`points[:, 0]`) know no mobject, and writing into them fails.
+    """
+    def __array_finalize__(self, obj):
+        self._owner = None
+        self._attr = None
+        self._owned = None
+
+    def _own(self):
+        """A writable array to write into in place of this one: the mobject's own copy if shared."""
+        if self._owned is not None:
+            # Written through before: later writes go to the same copy
+            return self._owned
+        if self.flags.writeable:
+            return self.view(np.ndarray)
+        if self._owner is None:
+            raise ValueError("assignment destination is a view of a shared, copy-on-write array")
+        array = self._owned = np.array(self.view(np.ndarray))
+        setattr(self._owner, self._attr, array)
+        self._owner = None
+        cache_stats("copy on write").miss()
+        return array
+
+    def __setitem__(self, key, value):
+        self._own()[key] = value
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out = None, **kwargs):
+        inputs = tuple(x.view(np.ndarray) if isinstance(x, CowArray) else x for x in inputs)
+        if out is not None:
+            kwargs["out"] = tuple(x._own() if isinstance(x, CowArray) else x for x in out)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+class SharedArray():
+    """Data descriptor serving a mobject array attribute, wrapping shared arrays in a CowArray."""
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, mob, owner = None):
+        if mob is None:
+            return self
+        try:
+            array = mob.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if isinstance(array, np.ndarray) and not array.flags.writeable:
+            view = array.view(CowArray)
+            view._owner, view._attr = mob, self.name
+            return view
+        return array
+
+    def __set__(self, mob, value):
+        if isinstance(value, CowArray):
+            value = value.view(np.ndarray)
+        mob.__dict__[self.name] = value
+
+def _sharing_deepcopy(self, memo):
+    # Mobject.__deepcopy__, except that arrays owning their memory are shared
+    # read-only; views into other buffers are still copied, since those
+    # buffers can change underneath.
+    cls = self.__class__
+    result = cls.__new__(cls)
+    memo[id(self)] = result
+    shared = _shared_names(cls)
+    for key, value in self.__dict__.items():
+        if key in shared and type(value) is np.ndarray and value.base is None:
+            value.flags.writeable = False
+            result.__dict__[key] = value
+            cache_stats("copy on write").hit()
+        else:
+            setattr(result, key, copy.deepcopy(value, memo))
+    result.original_id = str(id(self))
+    return result
+
+def _shared_names(cls):
+    return {name for klass, names in SHARED_ATTRS.items() if issubclass(cls, klass) for name in names}
+
+_active = 0
+
+@contextmanager
+def copy_on_write():
+    """
+    Share mobject arrays between copies while the block runs (nests).
+
+    Arrays shared inside the block stay read-only afterwards, so mobjects
+    copied in it should not be written to in place once it is left.
+    """
+    global _active
+    saved = None
+    if not _active:
+        saved = [(Mobject, "__deepcopy__", Mobject.__dict__["__deepcopy__"])]
+        Mobject.__deepcopy__ = _sharing_deepcopy
+        for klass, names in SHARED_ATTRS.items():
+            for name in names:
+                saved.append((klass, name, klass.__dict__.get(name)))
+                setattr(klass, name, SharedArray(name))
+    _active += 1
+    try:
+        yield
+    finally:
+        _active -= 1
+        if saved is not None:
+            for klass, name, original in saved:
+                if original is None:
+                    delattr(klass, name)
+                else:
+                    setattr(klass, name, original)
+
+class CopyOnWriteMixin():
+    """Scene mixin rendering with copy-on-write mobject arrays (see copy_on_write)."""
+    def render(self, *args, **kwargs):
+        with copy_on_write():
+            return super().render(*args, **kwargs)
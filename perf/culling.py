@@ -0,0 +1,126 @@
+import numpy as np
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_difference_update
+
+from .compose import ComposedScene
+from .stats import cache_stats
+
+# Visibility culling: before the camera sorts, projects or shades anything,
+# drop the family members that cannot put a pixel on screen, either because
+# they are fully transparent or because their projected bounding box lies
+# entirely outside the frame.
+
+def invisible(mob):
+    """True if a VMobject has no visible fill, stroke or background stroke."""
+    if not isinstance(mob, VMobject):
+        return False
+    if mob.fill_rgbas[:, 3].any():
+        return False
+    for background in (False, True):
+        if mob.get_stroke_width(background) > 0 and mob.get_stroke_rgbas(background)[:, 3].any():
+            return False
+    return True
+
+def box_corners(points):
+    """The 8 corners of the axis-aligned bounding box of points."""
+    lo, hi = points.min(axis = 0), points.max(axis = 0)
+    return np.array([[x, y, z] for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])])
+
+class CullingCamera():
+    """
+    Camera mixin dropping invisible and off-frame mobjects in get_mobjects_to_display.
+
+    The bounding box corners go through the camera's own
+    transform_points_pre_display, so ThreeDCamera projection, fixed-in-frame
+    and fixed-orientation mobjects are handled like the real points. A
+    perspective projection maps the box to a shape inside the hull of its
+    projected corners as long as the box is entirely in front of the camera;
+    boxes reaching behind it, and exponential projection, are never culled
+    for position. The ids culled and kept since the renderer last reset them
+    collect in `frame_culled` and `frame_kept`.
+    """
+    frame_culled = None
+    frame_kept = None
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects = True, excluded_mobjects = None):
+        if include_submobjects:
+            mobjects = extract_mobject_family_members(
+                mobjects, use_z_index = self.use_z_index, only_those_with_points = True,
+            )
+            if excluded_mobjects:
+                excluded = extract_mobject_family_members(excluded_mobjects, use_z_index = self.use_z_index)
+                mobjects = list_difference_update(mobjects, excluded)
+        if self.frame_culled is None:
+            self.frame_culled, self.frame_kept = set(), set()
+        kept = []
+        for mob in mobjects:
+            if invisible(mob) or self._off_frame(mob):
+                self.frame_culled.add(id(mob))
+            else:
+                self.frame_kept.add(id(mob))
+                kept.append(mob)
+        return super().get_mobjects_to_display(kept, include_submobjects = False)
+
+    def _behind_camera(self, mob, corners):
+        if not isinstance(self, ThreeDCamera) or mob in self.fixed_in_frame_mobjects:
+            return False
+        if self.exponential_projection:
+            return True
+        depth = np.dot(corners - self.frame_center, self.get_rotation_matrix().T)[:, 2]
+        return (depth >= self.get_focal_distance()).any()
+
+    def _off_frame(self, mob):
+        if not len(mob.points):
+            return False
+        corners = box_corners(mob.points)
+        if self._behind_camera(mob, corners):
+            return False
+        projected = self.transform_points_pre_display(mob, corners)
+        matrix = self.get_cairo_context(self.pixel_array).get_matrix()
+        xs = projected[:, 0] * matrix.xx + matrix.x0
+        ys = projected[:, 1] * matrix.yy + matrix.y0
+        if isinstance(mob, VMobject):
+            width = max(mob.get_stroke_width(), mob.get_stroke_width(background = True))
+            # Half the line width, times Cairo's default miter limit, plus antialiasing
+            pad = width * self.cairo_line_width_multiple * abs(matrix.xx) * 5 + 2
+        elif isinstance(mob, PMobject):
+            pad = mob.stroke_width + 2
+        else:
+            pad = 2
+        return (
+            xs.max() < -pad or xs.min() > self.pixel_width + pad
+            or ys.max() < -pad or ys.min() > self.pixel_height + pad
+        )
+
+class CullingRenderer():
+    """Renderer mixin recording how many mobjects the camera culled in each frame."""
+    culled_per_frame = None
+
+    def update_frame(self, scene, mobjects = None, include_submobjects = True, ignore_skipping = True, **kwargs):
+        if self.skip_animations and not ignore_skipping:
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if self.culled_per_frame is None:
+            self.culled_per_frame = []
+        camera = self.camera
+        camera.frame_culled, camera.frame_kept = set(), set()
+        super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        culled = len(camera.frame_culled)
+        self.culled_per_frame.append(culled)
+        stats = cache_stats("culling")
+        stats.hit(culled)
+        stats.miss(len(camera.frame_kept - camera.frame_culled))
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        if self.culled_per_frame:
+            counts = self.culled_per_frame
+            logger.info(
+                f"{type(scene).__name__}: culled {sum(counts) / len(counts):.1f} mobjects per frame "
+                f"on average, {max(counts)} at most, over {len(counts)} frames"
+            )
+
+class CullingMixin(ComposedScene):
+    """Scene mixin turning on visibility culling (see CullingCamera)."""
+    renderer_mixins = (CullingRenderer,)
+    camera_mixins = (CullingCamera,)
@@ -0,0 +1,239 @@
+import math
+
+import numpy as np
+from manim import *
+from manim.utils.iterables import list_update
+
+from .compose import ComposedScene
+from .layers import moving_ids
+from .stats import cache_stats
+
+# Damage rectangles: compare each frame's mobjects with what was drawn in the
+# previous one, and only re-rasterize the screen areas that changed on top of
+# the previous frame, leaving the rest of the pixels as they were.
+
+# Past this share of the frame, a plain full redraw is cheaper than clipping
+FULL_REDRAW_FRACTION = 0.5
+
+# More dirty rectangles than this are merged into their bounding box
+MAX_RECTS = 8
+
+class DrawnState():
+    """What a VMobject looked like when last drawn, and where on screen it went."""
+    __slots__ = ("points", "fill", "stroke", "background_stroke", "widths", "style", "box")
+
+    def __init__(self, mob, box):
+        self.points = mob.points.copy()
+        self.fill = np.array(mob.fill_rgbas)
+        self.stroke = np.array(mob.stroke_rgbas)
+        self.background_stroke = np.array(mob.background_stroke_rgbas)
+        self.widths = (mob.stroke_width, mob.background_stroke_width)
+        self.style = (mob.sheen_factor, tuple(mob.sheen_direction), mob.joint_type, mob.cap_style, mob.z_index)
+        self.box = box
+
+    def matches(self, mob):
+        return (
+            self.widths == (mob.stroke_width, mob.background_stroke_width)
+            and self.style == (mob.sheen_factor, tuple(mob.sheen_direction), mob.joint_type, mob.cap_style, mob.z_index)
+            and np.array_equal(self.points, mob.points)
+            and np.array_equal(self.fill, mob.fill_rgbas)
+            and np.array_equal(self.stroke, mob.stroke_rgbas)
+            and np.array_equal(self.background_stroke, mob.background_stroke_rgbas)
+        )
+
+def _drawable(mob):
+    # Clipped redraws go through Cairo; image and point cloud mobjects, and
+    # background-coloured vmobjects, are painted with numpy and ignore the clip.
+    return isinstance(mob, VMobject) and not mob.get_background_image()
+
+def _overlaps(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+def _union(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+def merge_rects(rects):
+    """Merge overlapping (x0, y0, x1, y1) rectangles until none overlap; too many become one."""
+    rects = list(rects)
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(rects)):
+            for j in range(i + 1, len(rects)):
+                if _overlaps(rects[i], rects[j]):
+                    rects[i] = _union(rects[i], rects.pop(j))
+                    merged = True
+                    break
+            if merged:
+                break
+    if len(rects) > MAX_RECTS:
+        box = rects[0]
+        for rect in rects[1:]:
+            box = _union(box, rect)
+        rects = [box]
+    return rects
+
+class DamageRenderer():
+    """
+    Renderer mixin that redraws only the dirty rectangles of each frame.
+
+    At the first frame of a play every mobject is compared with its state
+    when last drawn (construct may have changed anything since); during the
+    play only mobjects that are animated or carry updaters are compared.
+    A dirty rectangle is reset to the background and every mobject touching
+    it is redrawn, clipped to it, in display order. Camera moves, z-order
+    changes, non-Cairo mobjects in a dirty area, 3D scenes or a dirty area
+    over FULL_REDRAW_FRACTION of the frame fall back to a full redraw.
+    """
+    _drawn = None
+    _drawn_order = None
+    _drawn_frame = None
+    _check_all = True
+    _boxes = None
+    _changed = None
+
+    def play(self, scene, *args, **kwargs):
+        result = super().play(scene, *args, **kwargs)
+        if self.skip_animations:
+            # Nothing was drawn, so the pixels no longer match the scene
+            self._drawn = None
+        return result
+
+    _static_pass = False
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # Building the static image draws only the static mobjects, in full,
+        # into the camera's pixels, which still have to hold the last frame
+        # afterwards.
+        previous = self.camera.pixel_array.copy() if self._drawn is not None else None
+        self._static_pass = True
+        try:
+            result = super().save_static_frame_data(scene, static_mobjects)
+        finally:
+            self._static_pass = False
+        if previous is not None:
+            self.camera.pixel_array[:] = previous
+        self._check_all = True
+        return result
+
+    def update_frame(self, scene, mobjects = None, include_submobjects = True, ignore_skipping = True, **kwargs):
+        if isinstance(self.camera, ThreeDCamera) or self._static_pass:
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if self.skip_animations and not ignore_skipping:
+            return
+        stats = cache_stats("damage")
+        order = self.camera.get_mobjects_to_display(list_update(scene.mobjects, scene.foreground_mobjects))
+        rects = self._dirty_rects(scene, order)
+        self._check_all = False
+        if rects is None:
+            stats.miss()
+            super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        else:
+            stats.hit()
+            for rect in rects:
+                self._redraw(order, rect)
+        self._record(order)
+
+    def _frame_key(self):
+        camera = self.camera
+        return (tuple(camera.frame_center), camera.frame_width, camera.frame_height, camera.pixel_array.shape)
+
+    def _pixel_box(self, mob):
+        """Screen rectangle (x0, y0, x1, y1) a VMobject can paint into, stroke and miter joins included."""
+        if not len(mob.points):
+            return None
+        camera = self.camera
+        pw, ph = camera.pixel_width, camera.pixel_height
+        sx, sy = pw / camera.frame_width, ph / camera.frame_height
+        fc = camera.frame_center
+        lo, hi = mob.points.min(axis = 0), mob.points.max(axis = 0)
+        width = max(mob.get_stroke_width(), mob.get_stroke_width(background = True))
+        # Half the line width, times Cairo's default miter limit, plus antialiasing
+        pad = width * camera.cairo_line_width_multiple * sx * 5 + 2
+        x0 = max(0, math.floor((lo[0] - fc[0]) * sx + pw / 2 - pad))
+        x1 = min(pw, math.ceil((hi[0] - fc[0]) * sx + pw / 2 + pad))
+        y0 = max(0, math.floor(ph / 2 - (hi[1] - fc[1]) * sy - pad))
+        y1 = min(ph, math.ceil(ph / 2 - (lo[1] - fc[1]) * sy + pad))
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return (x0, y0, x1, y1)
+
+    def _dirty_rects(self, scene, order):
+        """
+        Merged dirty rectangles since the last frame, or None when a full redraw is needed.
+
+        Leaves the current screen box of every mobject in `self._boxes` and the
+        ids whose drawn state must be re-recorded in `self._changed`.
+        """
+        self._boxes, self._changed = None, None
+        drawn = self._drawn
+        if drawn is None or self._frame_key() != self._drawn_frame:
+            return None
+        if any(not _drawable(m) for m in order):
+            return None
+        ids = [id(m) for m in order]
+        current = set(ids)
+        if [i for i in ids if i in drawn] != [i for i in self._drawn_order if i in current]:
+            return None
+
+        check = None if self._check_all else moving_ids(scene)
+        boxes, changed, dirty = {}, set(), []
+        for mob in order:
+            state = drawn.get(id(mob))
+            if state is not None and (check is not None and id(mob) not in check or state.matches(mob)):
+                boxes[id(mob)] = state.box
+                continue
+            boxes[id(mob)] = box = self._pixel_box(mob)
+            changed.add(id(mob))
+            for rect in (state.box if state is not None else None, box):
+                if rect is not None:
+                    dirty.append(rect)
+        for key, state in drawn.items():
+            if key not in current and state.box is not None:
+                dirty.append(state.box)
+
+        rects = merge_rects(dirty)
+        area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in rects)
+        if area > FULL_REDRAW_FRACTION * self.camera.pixel_width * self.camera.pixel_height:
+            return None
+        self._boxes, self._changed = boxes, changed
+        return rects
+
+    def _redraw(self, order, rect):
+        x0, y0, x1, y1 = rect
+        pixels = self.camera.pixel_array
+        pixels[y0:y1, x0:x1] = self.camera.background[y0:y1, x0:x1]
+        touching = [m for m in order if (box := self._boxes[id(m)]) is not None and _overlaps(box, rect)]
+        if not touching:
+            return
+        ctx = self.camera.get_cairo_context(pixels)
+        matrix = ctx.get_matrix()
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        try:
+            self.camera.display_multiple_vectorized_mobjects(touching, pixels)
+        finally:
+            ctx.restore()
+
+    def _record(self, order):
+        """Remember what was just drawn: everything after a full redraw, the changed mobjects otherwise."""
+        if self._changed is None:
+            if any(not _drawable(m) for m in order):
+                self._drawn = None
+                return
+            self._drawn = {id(m): DrawnState(m, self._pixel_box(m)) for m in order}
+        else:
+            drawn = {}
+            for mob in order:
+                key = id(mob)
+                drawn[key] = DrawnState(mob, self._boxes[key]) if key in self._changed else self._drawn[key]
+            self._drawn = drawn
+        self._drawn_order = [id(m) for m in order]
+        self._drawn_frame = self._frame_key()
+
+class DamageMixin(ComposedScene):
+    """Scene mixin turning on damage-rectangle rendering (see DamageRenderer)."""
+    renderer_mixins = (DamageRenderer,)
@@ -0,0 +1,135 @@
+import copy
+import weakref
+from contextlib import contextmanager
+
+from manim import *
+
+from .stats import cache_stats
+
+# Cached families: while active, Mobject.get_family returns a list computed
+# once and kept until the structure below the mobject changes. Every
+# submobjects list is a TrackedList that knows its mobject; changing it drops
+# the cached family of every mobject whose family contains that one.
+
+# The cached family sits in the mobject's __dict__ next to a token. Copying a
+# mobject deep-copies the token into a different object, and each activation
+# makes a new one, so copies and leftovers from earlier renders recompute.
+CACHE_KEY = "_cached_family"
+_token = object()
+
+# mobject -> the mobjects whose cached family contains it
+DEPENDENTS = weakref.WeakKeyDictionary()
+
+def invalidate(mob):
+    """Drop every cached family that mob belongs to."""
+    for dependent in DEPENDENTS.pop(mob, ()):
+        dependent.__dict__.pop(CACHE_KEY, None)
+
+class TrackedList(list):
+    """A submobjects list that invalidates cached families whenever it is changed in place."""
+    def __init__(self, items, owner):
+        super().__init__(items)
+        self.owner = weakref.ref(owner)
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        # A plain list: the copy's mobject wraps it on first access
+        return [copy.deepcopy(m, memo) for m in self]
+
+def _tracking(name):
+    method = getattr(list, name)
+
+    def tracked(self, *args, **kwargs):
+        owner = self.owner()
+        if owner is not None:
+            invalidate(owner)
+        return method(self, *args, **kwargs)
+
+    tracked.__name__ = name
+    return tracked
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(TrackedList, _name, _tracking(_name))
+
+class TrackedSubmobjects():
+    """
+    Data descriptor for Mobject.submobjects handing out TrackedLists.
+
+    Assigning a new list invalidates like changing one in place. A list
+    belonging to another mobject (a deepcopy carries the original's owner
+    along) or a plain list from before caching started is swapped for a
+    TrackedList on first access.
+    """
+    def __get__(self, mob, owner = None):
+        if mob is None:
+            return self
+        try:
+            items = mob.__dict__["submobjects"]
+        except KeyError:
+            raise AttributeError("submobjects") from None
+        if type(items) is not TrackedList or items.owner() is not mob:
+            items = mob.__dict__["submobjects"] = TrackedList(items, mob)
+        return items
+
+    def __set__(self, mob, items):
+        if "submobjects" in mob.__dict__:
+            invalidate(mob)
+        mob.__dict__["submobjects"] = TrackedList(items, mob)
+
+def _cached(get_family):
+    stats = cache_stats("families")
+
+    def cached_get_family(self, recurse = True):
+        entry = self.__dict__.get(CACHE_KEY)
+        if entry is not None and entry[0] is _token:
+            stats.hit()
+            return entry[1]
+        stats.miss()
+        family = get_family(self, recurse)
+        self.__dict__[CACHE_KEY] = (_token, family)
+        for member in family:
+            dependents = DEPENDENTS.get(member)
+            if dependents is None:
+                dependents = DEPENDENTS[member] = weakref.WeakSet()
+            dependents.add(self)
+        return family
+
+    return cached_get_family
+
+def _family_members_with_points(self):
+    # Whether a member has points changes far more often than the structure,
+    # so that is still checked per call, over the cached flat list
+    return [m for m in self.get_family() if m.get_num_points() > 0]
+
+@contextmanager
+def cached_families():
+    """
+    Cache Mobject.get_family while the block runs.
+
+    The returned lists are shared between callers and must not be modified.
+    """
+    global _token
+    _token = object()
+    saved = {name: Mobject.__dict__.get(name) for name in ("submobjects", "get_family", "family_members_with_points")}
+    Mobject.submobjects = TrackedSubmobjects()
+    Mobject.get_family = _cached(saved["get_family"])
+    Mobject.family_members_with_points = _family_members_with_points
+    try:
+        yield
+    finally:
+        for name, original in saved.items():
+            if original is None:
+                delattr(Mobject, name)
+            else:
+                setattr(Mobject, name, original)
+        _token = object()
+        DEPENDENTS.clear()
+
+class FamilyCacheMixin():
+    """Scene mixin rendering with cached mobject families (see cached_families)."""
+    def render(self, *args, **kwargs):
+        with cached_families():
+            return super().render(*args, **kwargs)
@@ -0,0 +1,119 @@
+import os
+import resource
+import sys
+
+import manim.mobject.text.tex_mobject as tex_mobject
+import manim.utils.tex_file_writing as tex_file_writing
+from manim import *
+
+from .stats import cache_stats
+
+# Small pieces of instrumentation shared by the timeline, profiler and memory tools.
+
+class TexRecorder():
+    """
+    Records every TeX string handed to LaTeX while active.
+
+    Every MathTex / Tex goes through tex_to_svg_file once per string, so wrapping
+    that one function sees all of them. Strings whose SVG was already on disk
+    are still recorded, they just don't cost a LaTeX run.
+    """
+    def __init__(self):
+        self.strings = []
+        self._original = None
+
+    def start(self):
+        if self._original is not None:
+            return self
+        original = tex_mobject.tex_to_svg_file
+        self._original = original
+
+        def recording_tex_to_svg_file(expression, *args, **kwargs):
+            self.strings.append(expression)
+            return original(expression, *args, **kwargs)
+
+        tex_mobject.tex_to_svg_file = recording_tex_to_svg_file
+        return self
+
+    def stop(self):
+        if self._original is not None:
+            tex_mobject.tex_to_svg_file = self._original
+            self._original = None
+
+    def drain(self):
+        """Strings recorded since the last drain."""
+        strings, self.strings = self.strings, []
+        return strings
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def count_tex_cache():
+    """
+    Count TeX strings into cache_stats("tex") from now on.
+
+    A string whose SVG is already in the Tex folder is a hit, one that needs a
+    LaTeX run (compile_tex) is a miss. Stays in place for the rest of the process.
+    """
+    if getattr(tex_mobject.tex_to_svg_file, "counts_tex_cache", False):
+        return
+    stats = cache_stats("tex")
+    to_svg, compile_tex = tex_mobject.tex_to_svg_file, tex_file_writing.compile_tex
+
+    def counting_compile_tex(*args, **kwargs):
+        stats.miss()
+        return compile_tex(*args, **kwargs)
+
+    def counting_tex_to_svg_file(*args, **kwargs):
+        misses = stats.misses
+        result = to_svg(*args, **kwargs)
+        if stats.misses == misses:
+            stats.hit()
+        return result
+
+    counting_tex_to_svg_file.counts_tex_cache = True
+    tex_file_writing.compile_tex = counting_compile_tex
+    tex_mobject.tex_to_svg_file = counting_tex_to_svg_file
+
+def family_stats(scene):
+    """Mobject count, total Bezier/anchor points and updater count over everything in the scene."""
+    family = scene.get_mobject_family_members()
+    points = sum(len(m.points) for m in family)
+    updaters = sum(len(m.updaters) for m in family) + len(scene.updaters)
+    return len(family), points, updaters
+
+def heaviest_mobject(scene):
+    """The top-level mobject carrying the most points, with that count (or (None, 0))."""
+    best, best_points = None, 0
+    for mob in scene.mobjects:
+        points = sum(len(m.points) for m in mob.get_family())
+        if points > best_points:
+            best, best_points = mob, points
+    return best, best_points
+
+def describe_animations(animations):
+    """'ReplacementTransform x32, Wait' style summary of the animations of one play."""
+    counts = {}
+    for animation in animations:
+        name = type(animation).__name__
+        if name == "_MethodAnimation":
+            name = ".animate"
+        counts[name] = counts.get(name, 0) + 1
+    return ", ".join(name if n == 1 else f"{name} x{n}" for name, n in counts.items())
+
+def rss_bytes():
+    """Current resident set size of this process (peak RSS where /proc isn't available)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return peak_rss_bytes()
+
+def peak_rss_bytes():
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
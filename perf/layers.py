@@ -0,0 +1,164 @@
+import cairo
+import numpy as np
+from manim import *
+from manim.utils.iterables import list_update
+
+from .compose import ComposedScene
+from .stats import cache_stats
+
+# Static layers: for the length of one play, everything drawn below the first
+# moving mobject is rasterized once into a background image, everything drawn
+# above the last moving one once into a transparent overlay, and each frame
+# only redraws the band in between and composites the overlay on top.
+
+def moving_ids(scene):
+    """
+    ids of every mobject that may change during the current play.
+
+    That is the families of animated mobjects and of mobjects carrying
+    updaters. Like manim's own moving/static split, this assumes an updater
+    only changes the mobject it is attached to (and its submobjects).
+    """
+    moving = set()
+    for animation in scene.animations:
+        moving.update(id(m) for m in animation.mobject.get_family())
+    for mob in scene.get_mobject_family_members():
+        if mob.updaters:
+            moving.update(id(m) for m in mob.get_family())
+    return moving
+
+def _overlayable(mob):
+    # The overlay is composited as premultiplied ARGB, which only Cairo-drawn
+    # vectorized mobjects are guaranteed to produce.
+    return isinstance(mob, VMobject) and not mob.get_background_image()
+
+def split_layers(order, moving):
+    """
+    Split a display list into (below, band, above).
+
+    below is the static run before the first moving mobject, above the static
+    run after the last one that can go into an overlay; band is the rest.
+    """
+    first = next((i for i, m in enumerate(order) if id(m) in moving), len(order))
+    last = first - 1
+    for i in range(len(order) - 1, first - 1, -1):
+        if id(order[i]) in moving or not _overlayable(order[i]):
+            last = i
+            break
+    return order[:first], order[first:last + 1], order[last + 1:]
+
+def alpha_bounds(pixels):
+    """(x, y, width, height) of the non-transparent part of an RGBA buffer, or None if it is empty."""
+    alpha = pixels[:, :, 3]
+    rows = np.flatnonzero(alpha.any(axis = 1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(alpha.any(axis = 0))
+    return int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)
+
+class LayerPlan():
+    """The cached layers of one play."""
+    def __init__(self, below_ids, above_ids, background, overlay_bounds):
+        self.below_ids = below_ids
+        self.above_ids = above_ids
+        self.background = background
+        self.overlay_bounds = overlay_bounds
+
+class StaticLayerRenderer():
+    """
+    Renderer mixin that caches the static layers of every play.
+
+    ThreeDCamera scenes, scenes with scene-level updaters and plays that
+    remove a cached mobject mid-way fall back to the plain renderer, which
+    redraws everything after the first moving mobject.
+    """
+    layer_plan = None
+    _overlay = None
+
+    def play(self, scene, *args, **kwargs):
+        try:
+            return super().play(scene, *args, **kwargs)
+        finally:
+            self.layer_plan = None
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.layer_plan = None
+        if isinstance(self.camera, ThreeDCamera) or scene.updaters:
+            return super().save_static_frame_data(scene, static_mobjects)
+
+        order = self.camera.get_mobjects_to_display(list_update(scene.mobjects, scene.foreground_mobjects))
+        below, band, above = split_layers(order, moving_ids(scene))
+
+        self.static_image = None
+        background = None
+        if below:
+            self.camera.reset()
+            self.camera.capture_mobjects(below, include_submobjects = False)
+            background = self.get_frame()
+
+        bounds = None
+        if above:
+            overlay = self._overlay_buffer()
+            overlay.fill(0)
+            frame = self.camera.pixel_array
+            self.camera.pixel_array = overlay
+            try:
+                self.camera.capture_mobjects(above, include_submobjects = False)
+            finally:
+                self.camera.pixel_array = frame
+            self.camera.get_cairo_context(overlay).get_target().flush()
+            bounds = alpha_bounds(overlay)
+
+        self.layer_plan = LayerPlan({id(m) for m in below}, {id(m) for m in above}, background, bounds)
+        return background
+
+    def _overlay_buffer(self):
+        # One buffer for the renderer's lifetime: the camera caches Cairo
+        # contexts by id(pixel_array), so a fresh array per play could alias
+        # a stale context.
+        shape = self.camera.pixel_array.shape
+        if self._overlay is None or self._overlay.shape != shape:
+            self._overlay = np.zeros(shape, dtype = self.camera.pixel_array.dtype)
+        return self._overlay
+
+    def update_frame(self, scene, mobjects = None, include_submobjects = True, ignore_skipping = True, **kwargs):
+        plan = self.layer_plan
+        stats = cache_stats("static layers")
+        if plan is None:
+            stats.miss()
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if self.skip_animations and not ignore_skipping:
+            return
+
+        order = self.camera.get_mobjects_to_display(list_update(scene.mobjects, scene.foreground_mobjects))
+        band = [m for m in order if id(m) not in plan.below_ids and id(m) not in plan.above_ids]
+        if len(order) - len(band) != len(plan.below_ids) + len(plan.above_ids):
+            # A cached mobject left the scene (or was re-added twice); stop trusting the layers
+            self.layer_plan = None
+            stats.miss()
+            return super().update_frame(scene, None, include_submobjects, ignore_skipping, **kwargs)
+
+        stats.hit()
+        if plan.background is not None:
+            self.camera.set_frame_to_background(plan.background)
+        else:
+            self.camera.reset()
+        self.camera.capture_mobjects(band, include_submobjects = False)
+        if plan.overlay_bounds is not None:
+            self._composite_overlay(plan.overlay_bounds)
+
+    def _composite_overlay(self, bounds):
+        ctx = self.camera.get_cairo_context(self.camera.pixel_array)
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.rectangle(*bounds)
+        ctx.clip()
+        ctx.set_operator(cairo.OPERATOR_OVER)
+        ctx.set_source_surface(self.camera.get_cairo_context(self._overlay).get_target(), 0, 0)
+        ctx.paint()
+        ctx.restore()
+        ctx.get_target().flush()
+
+class StaticLayerMixin(ComposedScene):
+    """Scene mixin turning on static layer caching (see StaticLayerRenderer)."""
+    renderer_mixins = (StaticLayerRenderer,)
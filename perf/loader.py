@@ -0,0 +1,73 @@
+import importlib.util
+import inspect
+import os
+import sys
+from pathlib import Path
+
+from manim import *
+
+# Loading scene files the same way `manim render` does, so the tools in this
+# folder can be pointed at any project's main.py from the repository root.
+
+def load_module(path):
+    """
+    Import a project script (e.g. pts/main.py) as a module.
+
+    The project's folder is put on sys.path and becomes the working directory,
+    so assets like symbol.svg resolve, and its manim.cfg is digested on top of
+    the default config exactly as if manim had been run from inside it.
+    """
+    path = Path(path).resolve()
+    project = path.parent
+    if str(project) not in sys.path:
+        sys.path.insert(0, str(project))
+    os.chdir(project)
+    if (project / "manim.cfg").is_file():
+        config.digest_file(project / "manim.cfg")
+
+    name = f"{project.name}_{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def scene_classes(module):
+    """All Scene subclasses defined (not just imported) in the module, in file order."""
+    found = [
+        obj for obj in vars(module).values()
+        if inspect.isclass(obj) and issubclass(obj, Scene) and obj.__module__ == module.__name__
+    ]
+    return sorted(found, key = lambda cls: inspect.getsourcelines(cls)[1])
+
+def load_scenes(path, names = None):
+    """Scene classes from a project script, optionally restricted to the given names."""
+    module = load_module(path)
+    classes = scene_classes(module)
+    if not names:
+        return classes
+    by_name = {cls.__name__: cls for cls in classes}
+    missing = [name for name in names if name not in by_name]
+    if missing:
+        raise SystemExit(f"{path}: no scene named {', '.join(missing)} (have: {', '.join(by_name)})")
+    return [by_name[name] for name in names]
+
+def default_camera_class(scene_cls):
+    """The camera class a scene would build for itself (ThreeDCamera for ThreeDScenes, etc.)."""
+    for klass in scene_cls.__mro__:
+        init = klass.__dict__.get("__init__")
+        if init is None:
+            continue
+        param = inspect.signature(init).parameters.get("camera_class")
+        if param is not None and param.default is not inspect.Parameter.empty:
+            return param.default
+    return Camera
+
+def instrument(scene_cls, *mixins):
+    """
+    Subclass a scene with the given mixins in front of it.
+
+    The subclass keeps the scene's name so output files and logs still read
+    `Cantor`, `ParityBlock`, ...
+    """
+    return type(scene_cls.__name__, (*mixins, scene_cls), {"__module__": scene_cls.__module__})
@@ -0,0 +1,200 @@
+import weakref
+
+import numpy as np
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_difference_update
+
+from .compose import ComposedScene
+from .culling import box_corners
+from .stats import cache_stats
+
+# Level of detail: every frame, each Surface and Cube (Sphere, Cylinder,
+# Prism, ...) is measured on screen through the camera's projection. One
+# only a few pixels across is drawn as a single flat polygon over its
+# silhouette; a surface whose faces come out smaller than a few pixels is
+# drawn with blocks of k x k faces merged into one, k doubling until the
+# merged faces are large enough. Everything else is drawn face by face.
+
+# Objects at most this many pixels across are drawn as one polygon
+IMPOSTOR_PIXELS = 4
+
+# Surfaces merge faces until merged faces are at least this many pixels across
+MIN_FACE_PIXELS = 3
+
+# Anchors looked at for a silhouette at most
+MAX_HULL_POINTS = 256
+
+# Points of a uv face at its (u, v), (u + 1, v), (u + 1, v + 1) and (u, v + 1) corners
+CORNERS = [0, 3, 7, 11]
+
+# A closed solid puts two layers (front and back) over every pixel it covers
+LAYERS = 2
+
+def convex_hull(points):
+    """Indices of the convex hull of 2D points, counterclockwise (monotone chain)."""
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    if len(order) < 3:
+        return list(order)
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    def chain(indices):
+        hull = []
+        for i in indices:
+            while len(hull) >= 2 and cross(points[hull[-2]], points[hull[-1]], points[i]) <= 0:
+                hull.pop()
+            hull.append(i)
+        return hull
+
+    lower, upper = chain(order), chain(order[::-1])
+    return lower[:-1] + upper[:-1]
+
+class Impostor(VMobject):
+    """A flat polygon standing in for a small 3D object; its colours are already shaded."""
+    def __init__(self):
+        super().__init__(stroke_width = 0)
+        # Sorted by depth like the faces it replaces
+        self.shade_in_3d = True
+
+class LodCamera():
+    """
+    ThreeDCamera mixin swapping small surfaces and solids for coarser stand-ins in get_mobjects_to_display.
+
+    Sizes are measured like CullingCamera measures them: the bounding box
+    corners through transform_points_pre_display and the Cairo matrix.
+    Objects reaching behind the camera, fixed in frame or with a fixed
+    orientation are always drawn in full.
+    """
+    def get_mobjects_to_display(self, mobjects, include_submobjects = True, excluded_mobjects = None):
+        if not isinstance(self, ThreeDCamera) or not include_submobjects:
+            return super().get_mobjects_to_display(mobjects, include_submobjects, excluded_mobjects)
+        if not hasattr(self, "_impostors"):
+            self._impostors = weakref.WeakKeyDictionary()
+            self._coarse = weakref.WeakKeyDictionary()
+
+        # first face of a swapped object -> its stand-ins; its other faces -> None
+        swaps = {}
+        stats = cache_stats("level of detail")
+        for mob in extract_mobject_family_members(mobjects):
+            if not isinstance(mob, (Surface, Cube)):
+                continue
+            faces = mob.family_members_with_points()
+            stand_ins = self._stand_ins(mob, faces) if faces else None
+            if stand_ins is None:
+                continue
+            stats.hit(len(faces))
+            stats.miss(len(stand_ins))
+            for face in faces:
+                swaps[id(face)] = None
+            swaps[id(faces[0])] = stand_ins
+
+        family = extract_mobject_family_members(mobjects, use_z_index = self.use_z_index, only_those_with_points = True)
+        if excluded_mobjects:
+            excluded = extract_mobject_family_members(excluded_mobjects, use_z_index = self.use_z_index)
+            family = list_difference_update(family, excluded)
+        if swaps:
+            swapped = []
+            for mob in family:
+                if id(mob) not in swaps:
+                    swapped.append(mob)
+                elif swaps[id(mob)] is not None:
+                    swapped.extend(swaps[id(mob)])
+            family = swapped
+        return super().get_mobjects_to_display(family, include_submobjects = False)
+
+    def modified_rgbas(self, vmobject, rgbas):
+        if isinstance(vmobject, Impostor):
+            return rgbas
+        return super().modified_rgbas(vmobject, rgbas)
+
+    def _pixel_extent(self, mob, points):
+        """How many pixels across points come out on screen, or None if that cannot be told."""
+        if mob in self.fixed_in_frame_mobjects or mob in self.fixed_orientation_mobjects:
+            return None
+        corners = box_corners(points)
+        if self.exponential_projection:
+            return None
+        depth = np.dot(corners - self.frame_center, self.get_rotation_matrix().T)[:, 2]
+        if (depth >= self.get_focal_distance()).any():
+            return None
+        projected = self.transform_points_pre_display(mob, corners)
+        matrix = self.get_cairo_context(self.pixel_array).get_matrix()
+        xs = projected[:, 0] * matrix.xx
+        ys = projected[:, 1] * matrix.yy
+        return max(xs.max() - xs.min(), ys.max() - ys.min())
+
+    def _stand_ins(self, mob, faces):
+        points = np.concatenate([face.points for face in faces])
+        extent = self._pixel_extent(mob, points)
+        if extent is None:
+            return None
+        if extent <= IMPOSTOR_PIXELS:
+            return [self._impostor(mob, faces)]
+        if isinstance(mob, Surface):
+            resolution = max(tuplify(mob.resolution))
+            k = 1
+            while extent / resolution * k < MIN_FACE_PIXELS and k < resolution:
+                k *= 2
+            coarse = self._coarse_faces(mob, k) if k > 1 else None
+            if coarse is not None:
+                # Cylinder bases and anything else that is not a uv face stay as they are
+                return coarse + [face for face in faces if not hasattr(face, "u_index")]
+        return None
+
+    def _impostor(self, mob, faces):
+        impostor = self._impostors.get(mob)
+        if impostor is None:
+            impostor = self._impostors[mob] = Impostor()
+        anchors = np.concatenate([face.points[::face.n_points_per_cubic_curve] for face in faces])
+        anchors = anchors[::-(-len(anchors) // MAX_HULL_POINTS)]
+        hull = anchors[convex_hull(self.transform_points_pre_display(mob, anchors))]
+        impostor.set_points_as_corners([*hull, hull[0]])
+
+        fill = np.concatenate([self.get_fill_rgbas(face) for face in faces]).mean(axis = 0)
+        fill[3] = 1 - (1 - fill[3]) ** LAYERS
+        impostor.fill_rgbas = fill[None]
+        stroked = [face for face in faces if face.get_stroke_width() > 0]
+        if stroked:
+            impostor.stroke_rgbas = np.concatenate([self.get_stroke_rgbas(face) for face in stroked]).mean(axis = 0)[None]
+            impostor.stroke_width = stroked[0].get_stroke_width()
+        else:
+            impostor.stroke_width = 0
+        return impostor
+
+    def _coarse_faces(self, surface, k):
+        faces = [face for face in surface.submobjects if hasattr(face, "u_index")]
+        # What merging reads, by content: set_fill and friends write colours in place
+        state = hash(b"".join(
+            face.points[CORNERS].tobytes() + face.fill_rgbas.tobytes() + face.stroke_rgbas.tobytes()
+            + np.float64(face.get_stroke_width()).tobytes()
+            for face in faces
+        ))
+        cached = self._coarse.get(surface)
+        if cached is not None and cached[0] == k and cached[1] == state:
+            return cached[2]
+
+        grid = {(face.u_index, face.v_index): face for face in faces}
+        u_count = max(i for i, _ in grid) + 1
+        v_count = max(j for _, j in grid) + 1
+        coarse = []
+        for i0 in range(0, u_count, k):
+            for j0 in range(0, v_count, k):
+                i1, j1 = min(i0 + k, u_count) - 1, min(j0 + k, v_count) - 1
+                corners = [(i0, j0, CORNERS[0]), (i1, j0, CORNERS[1]), (i1, j1, CORNERS[2]), (i0, j1, CORNERS[3])]
+                if any((i, j) not in grid for i, j, _ in corners):
+                    # A grid with holes is merged no further
+                    return None
+                block = [grid[i, j] for i in range(i0, i1 + 1) for j in range(j0, j1 + 1) if (i, j) in grid]
+                face = ThreeDVMobject()
+                face.set_points_as_corners([grid[i, j].points[n] for i, j, n in corners] + [grid[i0, j0].points[0]])
+                face.match_style(block[0])
+                face.fill_rgbas = np.concatenate([b.fill_rgbas for b in block]).mean(axis = 0)[None]
+                coarse.append(face)
+        self._coarse[surface] = (k, state, coarse)
+        return coarse
+
+class LevelOfDetailMixin(ComposedScene):
+    """Scene mixin drawing small 3D objects with fewer faces (see LodCamera)."""
+    camera_mixins = (LodCamera,)
@@ -0,0 +1,257 @@
+import gc
+import json
+import os
+import sys
+import types
+import weakref
+from collections import deque
+from dataclasses import asdict, dataclass, field
+
+from manim import *
+
+from .hooks import describe_animations, rss_bytes
+from .loader import instrument, load_scenes
+from .timeline import dry_run
+
+# Memory timeline: at every play boundary, how big the process is, which
+# mobjects are alive, and which mobjects left the scene but were never freed.
+
+PERF_DIR = os.path.dirname(os.path.abspath(__file__))
+
+@dataclass
+class MemoryRecord:
+    index: int
+    start: float
+    animations: str
+    rss: int
+    live: int
+    point_bytes: int
+    by_type: dict = field(default_factory = dict)
+    lingering: int = 0
+    new_lingering: list = field(default_factory = list)
+
+def live_mobjects():
+    """Every Mobject the garbage collector can see, whether or not it is in a scene."""
+    return [obj for obj in gc.get_objects() if isinstance(obj, Mobject)]
+
+def _owner_of(namespace):
+    """The object whose __dict__ is namespace, if any."""
+    for obj in gc.get_referrers(namespace):
+        if getattr(obj, "__dict__", None) is namespace:
+            return obj
+    return None
+
+def _key_of(namespace, target):
+    for key, value in namespace.items():
+        if value is target:
+            return key
+    return "?"
+
+def _step(referrer, target):
+    """How referrer points at target, e.g. '[3]', "['brace']" or '<cell>'."""
+    if isinstance(referrer, (list, tuple)):
+        for i, item in enumerate(referrer):
+            if item is target:
+                return f"[{i}]"
+    if isinstance(referrer, dict):
+        for key, value in referrer.items():
+            if value is target:
+                return f"[{key!r}]"
+    return f"<{type(referrer).__name__}>"
+
+def referrer_chain(obj, max_depth = 8, max_nodes = 300):
+    """
+    The shortest chain of references keeping obj alive, as a readable string.
+
+    Walks gc.get_referrers outwards until it hits a root: a local variable of
+    a running frame (usually `construct`), a module global or the scene
+    itself. Instance __dict__s are folded into `.attr` steps on their owner.
+    Frames belonging to this tool, and the search's own bookkeeping, are
+    skipped so they don't show up as the culprit.
+    """
+    gc.collect()
+    internal = set()
+    queue = deque([(obj, [type(obj).__name__])])
+    internal.add(id(queue))
+    seen = {id(obj)}
+    visited = 0
+    while queue and visited < max_nodes:
+        target, path = queue.popleft()
+        visited += 1
+        if len(path) > max_depth:
+            continue
+        referrers = gc.get_referrers(target)
+        internal.add(id(referrers))
+        for ref in referrers:
+            if id(ref) in seen or id(ref) in internal:
+                continue
+            if isinstance(ref, types.FrameType):
+                if os.path.dirname(os.path.abspath(ref.f_code.co_filename)) == PERF_DIR:
+                    continue
+                names = [name for name, value in ref.f_locals.items() if value is target]
+                local = f"local '{names[0]}'" if names else "a local"
+                return " -> ".join([f"{local} in {ref.f_code.co_name}()", *reversed(path)])
+            if isinstance(ref, dict) and "__name__" in ref and getattr(sys.modules.get(ref["__name__"]), "__dict__", None) is ref:
+                return " -> ".join([f"module {ref['__name__']}{_step(ref, target)}", *reversed(path)])
+            seen.add(id(ref))
+            if isinstance(ref, dict):
+                owner = _owner_of(ref)
+                if owner is not None:
+                    attr = _key_of(ref, target)
+                    if isinstance(owner, Scene):
+                        return " -> ".join([f"scene.{attr}", *reversed(path)])
+                    step = f"{type(owner).__name__}.{attr}"
+                    seen.add(id(owner))
+                    node = (owner, path + [step])
+                    internal.add(id(node))
+                    queue.append(node)
+                    continue
+            node = (ref, path + [_step(ref, target)])
+            internal.add(id(node))
+            queue.append(node)
+    return "(no root found)"
+
+class MemoryMixin():
+    """
+    Scene mixin that appends a MemoryRecord to `self.memory` after every play.
+
+    Top-level mobjects are remembered (weakly) at each boundary. One that has
+    dropped out of the scene is given a play to be released, since the play
+    that removed it still holds it through `scene.animations`; if it is alive
+    at the boundary after that, it is counted as lingering and reported once,
+    with the reference chain that keeps it alive.
+    """
+    max_reported = 5
+
+    def setup(self):
+        super().setup()
+        self.memory = []
+        self._on_screen = weakref.WeakValueDictionary()
+        self._removed = {}
+        self._reported = set()
+
+    def play(self, *args, **kwargs):
+        start = self.time
+        super().play(*args, **kwargs)
+        self._record(describe_animations(self.animations or []), start)
+
+    def tear_down(self):
+        self._record("", self.time)
+        super().tear_down()
+
+    def _record(self, animations, start):
+        gc.collect()
+        in_scene = {id(m) for m in self.get_mobject_family_members()}
+
+        lingering, new = 0, []
+        for key, (ref, removed_at) in list(self._removed.items()):
+            mob = ref()
+            if mob is None or id(mob) in in_scene:
+                del self._removed[key]
+                continue
+            if removed_at == len(self.memory):
+                continue
+            lingering += 1
+            if key not in self._reported:
+                self._reported.add(key)
+                if len(new) < self.max_reported:
+                    new.append({
+                        "type": type(mob).__name__,
+                        "removed_after_play": removed_at,
+                        "points": sum(len(m.points) for m in mob.get_family()),
+                        "chain": referrer_chain(mob),
+                    })
+            del mob
+
+        for key, mob in list(self._on_screen.items()):
+            if id(mob) not in in_scene and key not in self._removed:
+                self._removed[key] = (weakref.ref(mob), len(self.memory))
+        for mob in self.mobjects:
+            self._on_screen[id(mob)] = mob
+
+        live = live_mobjects()
+        by_type = {}
+        for mob in live:
+            name = type(mob).__name__
+            by_type[name] = by_type.get(name, 0) + 1
+        self.memory.append(MemoryRecord(
+            index = len(self.memory),
+            start = start,
+            animations = animations,
+            rss = rss_bytes(),
+            live = len(live),
+            point_bytes = sum(m.points.nbytes for m in live),
+            by_type = dict(sorted(by_type.items(), key = lambda kv: -kv[1])),
+            lingering = lingering,
+            new_lingering = new,
+        ))
+
+def measure_memory(scene_cls, render = False):
+    """Run a scene (dry, unless render is set) with MemoryMixin and return the scene."""
+    if not render:
+        return dry_run(scene_cls, MemoryMixin)
+    scene = instrument(scene_cls, MemoryMixin)()
+    scene.render()
+    return scene
+
+def format_memory(name, memory):
+    """The memory timeline as a table, with lingering mobjects listed under the play that found them."""
+    mb = 1024 * 1024
+    header = f"{'#':>4} {'start':>8} {'rss MB':>8} {'+MB':>7} {'live':>7} {'pts MB':>7} {'linger':>6}  animations"
+    lines = [name, header, "-" * len(header)]
+    previous = memory[0].rss if memory else 0
+    for r in memory:
+        lines.append(
+            f"{r.index:>4} {r.start:>8.2f} {r.rss / mb:>8.1f} {(r.rss - previous) / mb:>+7.1f} "
+            f"{r.live:>7} {r.point_bytes / mb:>7.2f} {r.lingering:>6}  {r.animations or '(after last play)'}"
+        )
+        for item in r.new_lingering:
+            lines.append(f"{'':>6}lingering {item['type']} ({item['points']} points) from play {item['removed_after_play']}: {item['chain']}")
+        previous = r.rss
+    return "\n".join(lines)
+
+def format_memory_diff(name, old, new, top = 3):
+    """Play-by-play deltas between two timelines of the same scene (new minus old)."""
+    mb = 1024 * 1024
+    lines = [f"{name}: {len(old)} -> {len(new)} records"]
+    for a, b in zip(old, new):
+        types = {t: b.by_type.get(t, 0) - a.by_type.get(t, 0) for t in {*a.by_type, *b.by_type}}
+        changed = sorted(((t, d) for t, d in types.items() if d), key = lambda td: -abs(td[1]))[:top]
+        if not changed and b.lingering == a.lingering and abs(b.rss - a.rss) < mb:
+            continue
+        lines.append(
+            f"{b.index:>4} rss {(b.rss - a.rss) / mb:>+7.1f}MB  live {b.live - a.live:>+6}  "
+            f"points {(b.point_bytes - a.point_bytes) / mb:>+6.2f}MB  lingering {b.lingering - a.lingering:>+3}  "
+            + ", ".join(f"{t} {d:+}" for t, d in changed)
+        )
+    return "\n".join(lines)
+
+# ---------- command line ----------
+
+def register(subparsers):
+    parser = subparsers.add_parser("memory", help = "record RSS, live mobjects and lingering mobjects at every play")
+    parser.add_argument("file", help = "project script, e.g. pts/main.py")
+    parser.add_argument("scenes", nargs = "*", help = "scene names (default: every scene in the file)")
+    parser.add_argument("--render", action = "store_true", help = "render for real instead of a dry run")
+    parser.add_argument("--json", help = "write the memory timelines to this file")
+    parser.add_argument("--diff", help = "compare against timelines saved earlier with --json")
+    parser.set_defaults(func = main, path_args = ["file", "json", "diff"])
+
+def load_memory(path):
+    with open(path) as f:
+        return {name: [MemoryRecord(**r) for r in records] for name, records in json.load(f).items()}
+
+def main(args):
+    old = load_memory(args.diff) if args.diff else {}
+    results = {}
+    for scene_cls in load_scenes(args.file, args.scenes):
+        name = scene_cls.__name__
+        results[name] = measure_memory(scene_cls, args.render).memory
+        print(format_memory(name, results[name]))
+        if name in old:
+            print()
+            print(format_memory_diff(name, old[name], results[name]))
+        print()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({name: [asdict(r) for r in memory] for name, memory in results.items()}, f, indent = 2)
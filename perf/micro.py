@@ -0,0 +1,225 @@
+import json
+import math
+import random
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+import numpy as np
+from manim import *
+
+from .loader import load_module
+
+# Micro-benchmarks: time and measure the geometry builders over a range of
+# sizes and fit how they scale, so depth and level caps can be set knowingly.
+
+ROOT = Path(__file__).resolve().parent.parent
+
+@dataclass
+class Sweep:
+    name: str
+    file: str               # project script, relative to the repository root
+    variable: str           # what the size is, as printed in O(...)
+    sizes: list
+    prepare: Callable       # (module, size) -> zero-argument callable doing the work once
+
+@dataclass
+class SweepResult:
+    name: str
+    variable: str
+    sizes: list = field(default_factory = list)
+    seconds: list = field(default_factory = list)
+    peak_bytes: list = field(default_factory = list)
+    time_order: str = ""
+    memory_order: str = ""
+    stopped_early: bool = False
+
+def bare(scene_cls):
+    """A scene instance without running Scene.__init__, enough to call its builder methods."""
+    return scene_cls.__new__(scene_cls)
+
+def cantor_intervals(depth):
+    """The 2^depth intervals of the Cantor construction after depth steps."""
+    intervals = [(0.0, 1.0)]
+    for _ in range(depth):
+        intervals = [half for a, b in intervals for half in ((a, a + (b - a) / 3), (b - (b - a) / 3, b))]
+    return intervals
+
+# ---------- sweeps ----------
+
+def _menger(module, n):
+    scene = bare(module.DimensionLadderExtrude)
+    return lambda: scene.create_menger_sponge(n)
+
+def _cantor_blocks(module, depth):
+    scene = bare(module.Cantor)
+    intervals = cantor_intervals(depth)
+    return lambda: [scene.make_block(a, b, depth) for a, b in intervals]
+
+def _dyadic_grid(module, n):
+    scene = bare(module.EffectiveDimensionDyadic)
+    frame_square = Square(side_length = 2 * scene.GRID_HALF)
+    return lambda: scene.make_dyadic_grid(n, frame_square)
+
+def _hats(module, count):
+    return lambda: VGroup(*[module.get_hat(ORIGIN, label = r"\mathbb{N}") for _ in range(count)])
+
+def _notes(module, count):
+    def build():
+        random.seed(0)
+        return [module.make_notes("finite", "natural", correct_number = "1") for _ in range(count)]
+    return build
+
+def _arrange_hats(module, count):
+    level = {"label": r"\mathbb{N}", "number": count}
+    return lambda: module.arrange_hats(level)
+
+def _update_values(module, n):
+    # klein's f is only defined on a 3x3 matrix, so larger ones repeat it
+    matrix = module.UpdatingMatrix(lambda t, i, j: module.f(t, i % 3, j % 3), n, n)
+    return lambda: matrix.update_values(0.5)
+
+def _parity_click(module, n):
+    grid = module.ClickGrid(n = n)
+    return lambda: grid.parity_game_click(n // 2, n // 2)
+
+SWEEPS = [
+    Sweep("create_menger_sponge", "pts/main.py", "n", [0, 1, 2, 3], _menger),
+    Sweep("Cantor.make_block", "pts/main.py", "depth", [0, 1, 2, 3, 4, 5, 6, 7], _cantor_blocks),
+    Sweep("make_dyadic_grid", "pts/main.py", "n", [0, 1, 2, 3, 4, 5, 6, 7, 8], _dyadic_grid),
+    Sweep("get_hat", "hat_problems/main.py", "hats", [1, 2, 4, 8, 16, 32], _hats),
+    Sweep("make_notes", "hat_problems/main.py", "notes", [1, 2, 4, 8, 16], _notes),
+    Sweep("arrange_hats", "hat_problems/main.py", "hats", [1, 2, 4, 8, 16, 32], _arrange_hats),
+    Sweep("UpdatingMatrix.update_values", "klein/main.py", "n", [1, 2, 3, 4, 6, 8, 12, 16], _update_values),
+    Sweep("ClickGrid.parity_game_click", "parity_teaser/main.py", "n", [4, 8, 16, 32, 64, 128, 256, 512], _parity_click),
+]
+
+# ---------- measuring ----------
+
+def time_call(func, budget = 0.2, repeat = 5):
+    """
+    Best time of one call, in seconds.
+
+    Cheap calls are batched until a batch takes a fair share of the budget,
+    and the best of `repeat` batches is kept; a call that alone exceeds the
+    budget is only timed once.
+    """
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - start
+        if elapsed >= budget:
+            return elapsed / number
+        if elapsed >= budget / repeat:
+            break
+        number *= 10
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, perf_counter() - start)
+    return best / number
+
+def peak_memory(func):
+    """Peak bytes allocated (numpy buffers included) while func runs, with its result kept alive."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+def fit_scaling(sizes, values, variable):
+    """
+    The empirical order of values in size, e.g. 'O(n^2.0)' or 'O(4.0^n)'.
+
+    Fits log(value) both against log(size) (a power law) and against size
+    (an exponential) over the larger half of the sweep, where constant
+    overhead matters least, and reports whichever fits better.
+    """
+    points = [(s, v) for s, v in zip(sizes, values) if v > 0]
+    points = points[len(points) // 2 - 1:] if len(points) >= 4 else points
+    if len(points) < 3:
+        return "?"
+    x = np.array([s for s, _ in points], dtype = float)
+    y = np.log([v for _, v in points])
+
+    def fit(xs):
+        slope, intercept = np.polyfit(xs, y, 1)
+        residual = y - (slope * xs + intercept)
+        return slope, float(residual @ residual)
+
+    candidates = []
+    if (x > 0).all():
+        k, error = fit(np.log(x))
+        candidates.append((error, "O(1)" if abs(k) < 0.15 else f"O({variable}^{k:.1f})"))
+    slope, error = fit(x)
+    candidates.append((error, "O(1)" if abs(slope) < 0.05 else f"O({math.exp(slope):.1f}^{variable})"))
+    return min(candidates)[1]
+
+_modules = {}
+
+def _load(file):
+    if file not in _modules:
+        _modules[file] = load_module(ROOT / file)
+    return _modules[file]
+
+def run_sweep(sweep, max_seconds = 10.0):
+    """Time and measure the sweep's builder at every size, stopping after the first call slower than max_seconds."""
+    module = _load(sweep.file)
+    result = SweepResult(name = sweep.name, variable = sweep.variable)
+    for size in sweep.sizes:
+        func = sweep.prepare(module, size)
+        func()  # warm up: TeX compiles, SVG parsing caches
+        result.sizes.append(size)
+        result.seconds.append(time_call(func))
+        result.peak_bytes.append(peak_memory(func))
+        if result.seconds[-1] > max_seconds:
+            result.stopped_early = size != sweep.sizes[-1]
+            break
+    result.time_order = fit_scaling(result.sizes, result.seconds, sweep.variable)
+    result.memory_order = fit_scaling(result.sizes, result.peak_bytes, sweep.variable)
+    return result
+
+def format_sweep(r):
+    lines = [f"{r.name}"]
+    lines.append(f"{r.variable:>8} {'time':>12} {'peak memory':>14}")
+    for size, seconds, peak in zip(r.sizes, r.seconds, r.peak_bytes):
+        lines.append(f"{size:>8} {seconds * 1000:>10.3f}ms {peak / 1024:>12.1f}KB")
+    if r.stopped_early:
+        lines.append(f"{'':>8} (stopped: the last size took over the time limit)")
+    lines.append(f"{r.name} is {r.time_order} in time and {r.memory_order} in memory")
+    return "\n".join(lines)
+
+# ---------- command line ----------
+
+def register(subparsers):
+    parser = subparsers.add_parser("micro", help = "sweep the geometry builders over sizes and fit their scaling")
+    parser.add_argument("names", nargs = "*", help = f"sweeps to run (default: all of {', '.join(s.name for s in SWEEPS)})")
+    parser.add_argument("--max-seconds", type = float, default = 10.0, help = "stop a sweep once one call takes longer (default: 10)")
+    parser.add_argument("--json", help = "write the measurements to this file")
+    parser.set_defaults(func = main, path_args = ["json"])
+
+def main(args):
+    unknown = set(args.names) - {s.name for s in SWEEPS}
+    if unknown:
+        raise SystemExit(f"no sweep named {', '.join(sorted(unknown))}")
+    results = []
+    for sweep in SWEEPS:
+        if args.names and sweep.name not in args.names:
+            continue
+        results.append(run_sweep(sweep, args.max_seconds))
+        print(format_sweep(results[-1]))
+        print()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([asdict(r) for r in results], f, indent = 2)
@@ -0,0 +1,192 @@
+import numpy as np
+from manim import *
+
+from .stats import cache_stats
+
+# Partial paths: Create, Uncreate, ShowPassingFlash and the drawing half of
+# Write / DrawBorderThenFill show each submobject's path between two
+# proportions a and b, through pointwise_become_partial, one submobject at
+# a time. Here every such animation gets a table of cumulative lengths over
+# the curves of all its submobjects when it begins; each frame then finds
+# both ends of every submobject's piece with one binary search and cuts the
+# two end curves with one vectorised de Casteljau split.
+
+# Knots per curve when measuring by arc length
+ARC_LENGTH_SAMPLES = 8
+
+def partial_drawing(animation):
+    """True for animations drawing their submobjects' paths through the stock ShowPartial / DrawBorderThenFill methods."""
+    cls = type(animation)
+    return (
+        cls.interpolate is Animation.interpolate
+        and cls.interpolate_mobject is Animation.interpolate_mobject
+        and (
+            isinstance(animation, ShowPartial) and cls.interpolate_submobject is ShowPartial.interpolate_submobject
+            or isinstance(animation, DrawBorderThenFill)
+            and cls.interpolate_submobject is DrawBorderThenFill.interpolate_submobject
+        )
+    )
+
+def _split(curves, t):
+    """The parts of cubic Bézier curves (n, 4, dim) before and after t (n,)."""
+    t = t[:, None]
+    p0, p1, p2, p3 = curves[:, 0], curves[:, 1], curves[:, 2], curves[:, 3]
+    p01, p12, p23 = p0 + t * (p1 - p0), p1 + t * (p2 - p1), p2 + t * (p3 - p2)
+    p012, p123 = p01 + t * (p12 - p01), p12 + t * (p23 - p12)
+    mid = p012 + t * (p123 - p012)
+    return np.stack([p0, p01, p012, mid], axis = 1), np.stack([mid, p123, p23, p3], axis = 1)
+
+def partial_curves(curves, a, b):
+    """The portions [a, b] of cubic Bézier curves (n, 4, dim), for 0 <= a <= b <= 1 per curve."""
+    _, tail = _split(curves, a)
+    span = 1 - a
+    head, _ = _split(tail, np.divide(b - a, span, out = np.ones_like(span), where = span > 0))
+    return head
+
+def curve_lengths(curves, samples):
+    """Polyline lengths of curves (n, 4, dim) sampled at samples + 1 points: an (n, samples) array."""
+    t = np.linspace(0, 1, samples + 1)[:, None]
+    weights = np.hstack([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3])
+    points = np.einsum("sk,nkd->nsd", weights, curves)
+    return np.linalg.norm(np.diff(points, axis = 1), axis = 2)
+
+class PartialPaths():
+    """
+    Length tables for the submobjects one animation draws partially.
+
+    By default every curve counts as one unit of length, which is how
+    pointwise_become_partial itself splits a path, so frames come out the
+    same. With by_arc_length, curves are measured by arc length (at
+    ARC_LENGTH_SAMPLES knots each) and paths are drawn at an even speed.
+    Submobjects that are not VMobjects with curves are drawn as usual.
+    """
+    def __init__(self, animation, by_arc_length = False):
+        self.animation = animation
+        self.draw_border = isinstance(animation, DrawBorderThenFill)
+        families = list(animation.get_all_families_zipped())
+        self.count = len(families)
+        self.fast, self.slow = [], []
+        samples = ARC_LENGTH_SAMPLES if by_arc_length else 1
+        curves, knots, bases, knot_starts, curve_starts = [], [], [], [], []
+        base = knot = curve = 0
+        for index, mobs in enumerate(families):
+            sub, source = mobs[0], mobs[-1] if self.draw_border else mobs[1]
+            num_curves = source.get_num_curves() if isinstance(source, VMobject) else 0
+            if not isinstance(sub, VMobject) or num_curves == 0:
+                self.slow.append((index, mobs))
+                continue
+            own = source.points[:4 * num_curves].reshape(num_curves, 4, -1)
+            lengths = curve_lengths(own, samples).ravel() if by_arc_length else np.ones(num_curves)
+            table = np.concatenate([[0], np.cumsum(lengths)])
+            self.fast.append((index, mobs, sub, source, own))
+            curves.append(own)
+            knots.append(table + base)
+            bases.append(base)
+            knot_starts.append(knot)
+            curve_starts.append(curve)
+            # A gap of 1 keeps every query inside its own submobject's table
+            base += table[-1] + 1
+            knot += len(table)
+            curve += num_curves
+        cache_stats("partial paths").hit(len(self.fast))
+        cache_stats("partial paths").miss(len(self.slow))
+        if not self.fast:
+            return
+        self.samples = samples
+        self.curves = np.concatenate(curves)
+        self.knots = np.concatenate(knots)
+        self.bases = np.array(bases)
+        self.totals = np.array([k[-1] for k in knots]) - self.bases
+        self.knot_starts = np.array(knot_starts)
+        self.knot_lasts = self.knot_starts + np.array([len(own) for *_, own in self.fast]) * samples - 1
+        self.curve_starts = np.array(curve_starts)
+
+    def locate(self, which, proportions):
+        """Global curve indices and residues of the given proportions along the entries' paths."""
+        query = self.bases[which] + proportions * self.totals[which]
+        first = self.knot_starts[which]
+        knot = np.clip(np.searchsorted(self.knots, query, side = "right") - 1, first, self.knot_lasts[which])
+        width = self.knots[knot + 1] - self.knots[knot]
+        frac = np.divide(query - self.knots[knot], width, out = np.zeros_like(width), where = width > 0)
+        local = knot - first
+        return self.curve_starts[which] + local // self.samples, (local % self.samples + frac) / self.samples
+
+    def interpolate_mobject(self, alpha):
+        animation = self.animation
+        which, lowers, uppers = [], [], []
+        for entry, (index, mobs, sub, source, own) in enumerate(self.fast):
+            sub_alpha = animation.get_sub_alpha(alpha, index, self.count)
+            if self.draw_border:
+                phase, sub_alpha = integer_interpolate(0, 2, sub_alpha)
+                if phase != 0:
+                    animation.interpolate_submobject(*mobs, sub_alpha)
+                    continue
+                a, b = 0, sub_alpha
+            else:
+                a, b = animation._get_bounds(sub_alpha)
+            if a <= 0 and b >= 1:
+                sub.set_points(source.points)
+            else:
+                which.append(entry)
+                lowers.append(a)
+                uppers.append(b)
+            if self.draw_border:
+                sub.match_style(source)
+        for index, mobs in self.slow:
+            animation.interpolate_submobject(*mobs, animation.get_sub_alpha(alpha, index, self.count))
+        if not which:
+            return
+
+        which = np.array(which)
+        lowers, uppers = np.clip(lowers, 0, 1), np.clip(uppers, 0, 1)
+        lower, lower_residue = self.locate(which, lowers)
+        upper, upper_residue = self.locate(which, uppers)
+        same = lower == upper
+        firsts = partial_curves(self.curves[lower], lower_residue, np.where(same, upper_residue, 1))
+        lasts = partial_curves(self.curves[upper], np.zeros_like(upper_residue), upper_residue)
+        for i, entry in enumerate(which):
+            _, _, sub, _, own = self.fast[entry]
+            if same[i]:
+                sub.points = firsts[i]
+            else:
+                start = self.curve_starts[entry]
+                middle = own[lower[i] - start + 1:upper[i] - start]
+                sub.points = np.concatenate([firsts[i], middle.reshape(-1, own.shape[2]), lasts[i]])
+
+def _animations(animations):
+    for animation in animations:
+        if isinstance(animation, AnimationGroup):
+            yield from _animations(animation.animations)
+        else:
+            yield animation
+
+class PartialPathMixin():
+    """
+    Scene mixin drawing partial paths from length tables built once per animation (see PartialPaths).
+
+    Set partial_by_arc_length to draw paths at an even speed along their
+    length rather than an even number of curves per unit time.
+    """
+    partial_by_arc_length = False
+
+    def begin_animations(self):
+        super().begin_animations()
+        self._partial_paths = []
+        for animation in _animations(self.animations):
+            if not partial_drawing(animation):
+                continue
+            # Tables are built once, so whatever the paths are cut from must not move
+            if any(m.updaters for mob in animation.get_all_mobjects_to_update() for m in mob.get_family()):
+                continue
+            paths = PartialPaths(animation, self.partial_by_arc_length)
+            if paths.fast:
+                animation.interpolate_mobject = paths.interpolate_mobject
+                self._partial_paths.append(animation)
+
+    def play_internal(self, skip_rendering = False):
+        try:
+            return super().play_internal(skip_rendering)
+        finally:
+            for animation in getattr(self, "_partial_paths", ()):
+                animation.__dict__.pop("interpolate_mobject", None)
+            self._partial_paths = []
@@ -0,0 +1,435 @@
+import inspect
+import json
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim import *
+
+from .compose import ComposedScene
+from .hooks import describe_animations
+from .loader import instrument, load_scenes
+
+# Per-play profiler: every play (and so every wait) gets its wall time split
+# into stages, plus which updaters and which TeX strings the time went to.
+# Timing is done with an explicit stack of named frames, so the same data can
+# be written out as JSON, a speedscope profile and folded flamegraph stacks.
+
+STAGES = ["construction", "updaters", "interpolation", "projection", "rasterization", "encoding", "other"]
+
+# Frame name -> stage. Frames not listed here (MathTex, latex, animation
+# names, ...) count towards the stage of the frame they were opened in.
+FRAME_STAGES = {
+    "construct": "construction",
+    "updaters": "updaters",
+    "interpolate": "interpolation",
+    "sort": "projection",
+    "project": "projection",
+    "shade": "projection",
+    "draw": "rasterization",
+    "rasterize": "rasterization",
+    "encode": "encoding",
+    "begin": "other",
+    "static frame": "other",
+}
+
+class _Frame():
+    __slots__ = ("profiler", "name")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.push(self.name)
+
+    def __exit__(self, *exc):
+        self.profiler.pop()
+
+class Profiler():
+    """
+    Stack of named timing frames.
+
+    `stacks` maps each stack of frame names to the self time (seconds) spent
+    with exactly that stack open; `inclusive` maps a frame name to its total
+    time including children, counted once even when frames nest recursively.
+    Both are emptied by `cut`, which the scene mixin calls at play boundaries.
+    """
+    def __init__(self):
+        self._open = []
+        self.stacks = {}
+        self.inclusive = {}
+        self.tex = {}
+        self.frames = 0
+
+    def push(self, name):
+        self._open.append([name, perf_counter(), 0.0])
+
+    def pop(self):
+        name, start, children = self._open.pop()
+        elapsed = perf_counter() - start
+        key = tuple(f[0] for f in self._open) + (name,)
+        self.stacks[key] = self.stacks.get(key, 0.0) + elapsed - children
+        if self._open:
+            self._open[-1][2] += elapsed
+        if name not in key[:-1]:
+            self.inclusive[name] = self.inclusive.get(name, 0.0) + elapsed
+        return elapsed
+
+    def frame(self, name):
+        """Context manager timing the block as a frame called name."""
+        return _Frame(self, name)
+
+    def cut(self):
+        """Everything recorded since the last cut, as (stacks, inclusive, tex, frames)."""
+        result = (self.stacks, self.inclusive, self.tex, self.frames)
+        self.stacks, self.inclusive, self.tex, self.frames = {}, {}, {}, 0
+        return result
+
+def stage_of(stack):
+    """The stage a stack's self time belongs to: that of its innermost staged frame."""
+    for name in reversed(stack):
+        if name.startswith("updater "):
+            return "updaters"
+        if name in FRAME_STAGES:
+            return FRAME_STAGES[name]
+    return "other"
+
+def _func_name(func):
+    name = getattr(func, "__name__", type(func).__name__)
+    code = getattr(func, "__code__", None)
+    if name == "<lambda>" and code is not None:
+        return f"<lambda>:{code.co_firstlineno}"
+    return name
+
+def updater_label(mobject, updater):
+    """
+    A readable name for an updater frame.
+
+    always_redraw wraps the user's builder in `lambda _: mob.become(func())`,
+    so the builder is dug out of that closure: `always_redraw(graph_up_to_n)`
+    rather than yet another anonymous lambda.
+    """
+    try:
+        closure = inspect.getclosurevars(updater).nonlocals
+    except TypeError:
+        closure = {}
+    func = closure.get("func")
+    if "mob" in closure and callable(func):
+        return f"updater always_redraw({_func_name(func)})"
+    return f"updater {_func_name(updater)} on {type(mobject).__name__}"
+
+@dataclass
+class PlayProfile:
+    index: int
+    start: float
+    run_time: float
+    animations: str
+    frames: int
+    wall: float
+    stages: dict
+    updaters: dict = field(default_factory = dict)
+    tex: dict = field(default_factory = dict)
+    stacks: list = field(default_factory = list)
+
+# ---------- mixins ----------
+
+class ProfilingCamera():
+    """Camera mixin: capture is rasterization, with sorting, projection and shading split out."""
+    profiler = None
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        with self.profiler.frame("rasterize"):
+            return super().capture_mobjects(mobjects, **kwargs)
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        with self.profiler.frame("sort"):
+            return super().get_mobjects_to_display(*args, **kwargs)
+
+    def transform_points_pre_display(self, mobject, points):
+        with self.profiler.frame("project"):
+            return super().transform_points_pre_display(mobject, points)
+
+    def get_fill_rgbas(self, vmobject):
+        with self.profiler.frame("shade"):
+            return super().get_fill_rgbas(vmobject)
+
+    def get_stroke_rgbas(self, vmobject, background = False):
+        with self.profiler.frame("shade"):
+            return super().get_stroke_rgbas(vmobject, background)
+
+class ProfilingRenderer():
+    """Renderer mixin: frame setup and capture are drawing, handing frames to the writer is encoding."""
+    profiler = None
+
+    def update_frame(self, *args, **kwargs):
+        with self.profiler.frame("draw"):
+            return super().update_frame(*args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        with self.profiler.frame("static frame"):
+            return super().save_static_frame_data(scene, static_mobjects)
+
+    def get_frame(self):
+        with self.profiler.frame("encode"):
+            return super().get_frame()
+
+    def add_frame(self, frame, num_frames = 1):
+        if not self.skip_animations:
+            self.profiler.frames += num_frames
+        with self.profiler.frame("encode"):
+            return super().add_frame(frame, num_frames)
+
+class ProfilerMixin(ComposedScene):
+    """
+    Scene mixin that profiles every play into `self.profile` (a list of PlayProfile).
+
+    Time spent in `construct` between two plays is charged to the play that
+    follows it, the same convention the dry-run timeline uses for TeX. What is
+    left after the last play becomes a final record with no animations.
+
+    Mobject updaters are run here rather than through Mobject.update so each
+    one gets its own frame; that mirrors Mobject.update exactly, but subclasses
+    that override `update` will have their override skipped while profiling.
+    """
+    renderer_mixins = (ProfilingRenderer,)
+    camera_mixins = (ProfilingCamera,)
+
+    def __init__(self, *args, **kwargs):
+        self.profiler = Profiler()
+        super().__init__(*args, **kwargs)
+        self.renderer.profiler = self.profiler
+        self.renderer.camera.profiler = self.profiler
+
+    def setup(self):
+        super().setup()
+        self.profile = []
+        self._patch_tex()
+        self.profiler.push("construct")
+
+    def tear_down(self):
+        self.profiler.pop()
+        self._record("", self.time, 0)
+        self._unpatch_tex()
+        super().tear_down()
+
+    def play(self, *args, **kwargs):
+        self.profiler.pop()
+        start = self.time
+        super().play(*args, **kwargs)
+        self._record(describe_animations(self.animations or []), start, self.time - start)
+        self.profiler.push("construct")
+
+    def _record(self, animations, start, run_time):
+        stacks, inclusive, tex, frames = self.profiler.cut()
+        stages = dict.fromkeys(STAGES, 0.0)
+        for stack, seconds in stacks.items():
+            stages[stage_of(stack)] += seconds * 1000
+        updaters = {
+            name[len("updater "):]: seconds * 1000
+            for name, seconds in inclusive.items() if name.startswith("updater ")
+        }
+        self.profile.append(PlayProfile(
+            index = len(self.profile),
+            start = start,
+            run_time = run_time,
+            animations = animations,
+            frames = frames,
+            wall = sum(stages.values()),
+            stages = stages,
+            updaters = dict(sorted(updaters.items(), key = lambda kv: -kv[1])),
+            tex = {string: seconds * 1000 for string, seconds in sorted(tex.items(), key = lambda kv: -kv[1])},
+            stacks = [[list(stack), seconds * 1000] for stack, seconds in stacks.items()],
+        ))
+
+    # ---------- stages ----------
+
+    def compile_animation_data(self, *args, **kwargs):
+        with self.profiler.frame("begin"):
+            return super().compile_animation_data(*args, **kwargs)
+
+    def begin_animations(self):
+        with self.profiler.frame("begin"):
+            super().begin_animations()
+
+    def update_to_time(self, t):
+        dt = t - self.last_t
+        self.last_t = t
+        with self.profiler.frame("interpolate"):
+            for animation in self.animations:
+                with self.profiler.frame(type(animation).__name__):
+                    animation.update_mobjects(dt)
+                    animation.interpolate(t / animation.run_time)
+        self.update_mobjects(dt)
+        self.update_meshes(dt)
+        self.update_self(dt)
+
+    def update_mobjects(self, dt):
+        with self.profiler.frame("updaters"):
+            for mobject in self.mobjects:
+                self._update_profiled(mobject, dt)
+
+    def update_self(self, dt):
+        with self.profiler.frame("updaters"):
+            for func in self.updaters:
+                with self.profiler.frame(f"updater {_func_name(func)} on scene"):
+                    func(dt)
+
+    def _update_profiled(self, mobject, dt):
+        if mobject.updating_suspended:
+            return
+        for updater in mobject.updaters:
+            with self.profiler.frame(updater_label(mobject, updater)):
+                if "dt" in inspect.signature(updater).parameters:
+                    updater(mobject, dt)
+                else:
+                    updater(mobject)
+        for submob in mobject.submobjects:
+            self._update_profiled(submob, dt)
+
+    # ---------- TeX ----------
+
+    def _patch_tex(self):
+        profiler = self.profiler
+        self._tex_originals = (tex_mobject.SingleStringMathTex.__init__, tex_mobject.tex_to_svg_file)
+        init, to_svg = self._tex_originals
+
+        def profiled_init(mob, tex_string, *args, **kwargs):
+            with profiler.frame("MathTex"):
+                start = perf_counter()
+                init(mob, tex_string, *args, **kwargs)
+            profiler.tex[tex_string] = profiler.tex.get(tex_string, 0.0) + perf_counter() - start
+
+        def profiled_to_svg(*args, **kwargs):
+            with profiler.frame("latex"):
+                return to_svg(*args, **kwargs)
+
+        tex_mobject.SingleStringMathTex.__init__ = profiled_init
+        tex_mobject.tex_to_svg_file = profiled_to_svg
+
+    def _unpatch_tex(self):
+        tex_mobject.SingleStringMathTex.__init__, tex_mobject.tex_to_svg_file = self._tex_originals
+
+def profile_scene(scene_cls, *mixins):
+    """Render a scene with the profiler attached and return the scene (see `scene.profile`)."""
+    scene = instrument(scene_cls, ProfilerMixin, *mixins)()
+    scene.render()
+    return scene
+
+# ---------- export ----------
+
+def to_speedscope(profiles):
+    """
+    A speedscope file (https://www.speedscope.app) with one sampled profile per scene.
+
+    Samples are in play order and carry a `play N` frame, so the "Time Order"
+    view reads as a timeline and the "Sandwich" view totals each updater.
+    """
+    frames, index = [], {}
+
+    def frame_id(name):
+        if name not in index:
+            index[name] = len(frames)
+            frames.append({"name": name})
+        return index[name]
+
+    out = []
+    for name, profile in profiles.items():
+        samples, weights = [], []
+        for record in profile:
+            label = f"play {record.index}: {record.animations}" if record.animations else "after last play"
+            for stack, ms in record.stacks:
+                samples.append([frame_id(n) for n in [label, *stack]])
+                weights.append(ms)
+        out.append({
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        })
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": out,
+        "exporter": "perf profile",
+    }
+
+def to_folded(profiles):
+    """Folded stacks ("Scene;updaters;MathTex 1234", in microseconds) for flamegraph.pl, summed over plays."""
+    totals = {}
+    for name, profile in profiles.items():
+        for record in profile:
+            for stack, ms in record.stacks:
+                key = ";".join([name, *stack])
+                totals[key] = totals.get(key, 0.0) + ms
+    return "".join(f"{key} {round(ms * 1000)}\n" for key, ms in totals.items() if ms >= 0.0005)
+
+def format_profile(name, profile, top = 3):
+    """Per-play stage table in milliseconds, then the scene's most expensive updaters and TeX strings."""
+    short = {"construction": "constr", "updaters": "update", "interpolation": "interp",
+             "projection": "proj", "rasterization": "raster", "encoding": "encode", "other": "other"}
+    header = f"{'#':>4} {'run':>6} {'frames':>6} {'wall':>9} " + " ".join(f"{short[s]:>8}" for s in STAGES) + "  animations"
+    lines = [name, header, "-" * len(header)]
+    updaters, tex = {}, {}
+    for r in profile:
+        lines.append(
+            f"{r.index:>4} {r.run_time:>6.2f} {r.frames:>6} {r.wall:>9.1f} "
+            + " ".join(f"{r.stages[s]:>8.1f}" for s in STAGES) + f"  {r.animations or '(after last play)'}"
+        )
+        for label, ms in r.updaters.items():
+            updaters[label] = updaters.get(label, 0.0) + ms
+        for string, ms in r.tex.items():
+            tex[string] = tex.get(string, 0.0) + ms
+    if profile:
+        stages = {s: sum(r.stages[s] for r in profile) for s in STAGES}
+        lines.append("-" * len(header))
+        lines.append(
+            f"{'':>4} {'':>6} {sum(r.frames for r in profile):>6} {sum(r.wall for r in profile):>9.1f} "
+            + " ".join(f"{stages[s]:>8.1f}" for s in STAGES)
+        )
+    for title, costs in (("updaters", updaters), ("TeX", tex)):
+        worst = sorted(costs.items(), key = lambda kv: -kv[1])[:top]
+        if worst:
+            lines.append(f"top {title}: " + ", ".join(f"{label} {ms:.1f}ms" for label, ms in worst))
+    return "\n".join(lines)
+
+# ---------- command line ----------
+
+def register(subparsers):
+    parser = subparsers.add_parser("profile", help = "render scenes and break each play down by stage")
+    parser.add_argument("file", help = "project script, e.g. pts/main.py")
+    parser.add_argument("scenes", nargs = "*", help = "scene names (default: every scene in the file)")
+    parser.add_argument("-q", "--quality", choices = ["low", "medium", "high", "production", "fourk"],
+                        help = "render quality (default: whatever the project's manim.cfg says)")
+    parser.add_argument("--no-write", action = "store_true", help = "rasterize every frame but don't write a movie")
+    parser.add_argument("--json", help = "write the per-play profiles to this file")
+    parser.add_argument("--speedscope", help = "write a speedscope profile to this file")
+    parser.add_argument("--folded", help = "write folded stacks for flamegraph.pl to this file")
+    parser.set_defaults(func = main, path_args = ["file", "json", "speedscope", "folded"])
+
+def main(args):
+    scenes = load_scenes(args.file, args.scenes)
+    if args.quality:
+        config.quality = f"{args.quality}_quality"
+    if args.no_write:
+        config.dry_run = True
+    # A cached play is copied, not rendered, and would profile as free.
+    config.disable_caching = True
+
+    profiles = {}
+    for scene_cls in scenes:
+        profiles[scene_cls.__name__] = profile_scene(scene_cls).profile
+        print(format_profile(scene_cls.__name__, profiles[scene_cls.__name__]))
+        print()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({name: [asdict(r) for r in profile] for name, profile in profiles.items()}, f, indent = 2)
+    if args.speedscope:
+        with open(args.speedscope, "w") as f:
+            json.dump(to_speedscope(profiles), f)
+    if args.folded:
+        with open(args.folded, "w") as f:
+            f.write(to_folded(profiles))
@@ -0,0 +1,249 @@
+import inspect
+import types
+from functools import partial
+
+import numpy as np
+from manim import *
+
+from .compose import ComposedScene
+from .stats import cache_stats
+
+# Reactive updaters: every updater gets a key built from the state of what it
+# reads (its inputs) and of its own mobject. When the key is the same as right
+# after the updater last ran, running it again could not change anything, so
+# it is skipped. When no updater or animation changed anything visible in a
+# frame, the previous frame's pixels are reused instead of rasterizing again.
+
+# How deep to follow functions and containers when tracing an updater's inputs
+TRACE_DEPTH = 4
+
+# Marks a traced input that cannot be versioned; updaters reading one always run
+OPAQUE = object()
+
+def depends_on(*inputs):
+    """
+    Declare the mobjects and ValueTrackers an updater reads, instead of having them traced.
+
+        y0.add_updater(depends_on(axes)(lambda m: m.move_to(axes.c2p(0, 0))))
+    """
+    def decorate(updater):
+        updater.depends_on = inputs
+        return updater
+    return decorate
+
+def member_key(m):
+    """A hash of everything about one mobject (not its submobjects) that drawing or reading it depends on."""
+    parts = (id(m), m.z_index, hash(m.points.tobytes()))
+    if isinstance(m, VMobject):
+        parts += (
+            hash(m.fill_rgbas.tobytes()), hash(m.stroke_rgbas.tobytes()),
+            hash(m.background_stroke_rgbas.tobytes()), m.stroke_width, m.background_stroke_width,
+            m.sheen_factor, tuple(m.sheen_direction),
+        )
+    elif isinstance(m, PMobject):
+        parts += (hash(m.rgbas.tobytes()), m.stroke_width)
+    elif isinstance(m, AbstractImageMobject):
+        parts += (id(m.get_pixel_array()),)
+    return hash(parts)
+
+def state_key(mob, member_keys = member_key):
+    """A hash of everything about a mobject's family that drawing or reading it depends on."""
+    return hash(tuple(member_keys(m) for m in mob.get_family()))
+
+def _trace(value, found, seen, depth):
+    """Collect the mobjects, arrays and plain values reachable from value into found."""
+    if id(value) in seen:
+        return
+    seen.add(id(value))
+    if isinstance(value, Mobject) or isinstance(value, np.ndarray):
+        found.append(value)
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes, range)):
+        found.append(value)
+    elif isinstance(value, (types.ModuleType, type, types.BuiltinFunctionType)):
+        return
+    elif depth >= TRACE_DEPTH:
+        found.append(OPAQUE)
+    elif isinstance(value, types.FunctionType):
+        for cell in value.__closure__ or ():
+            try:
+                _trace(cell.cell_contents, found, seen, depth + 1)
+            except ValueError:
+                # Cell not filled yet
+                found.append(OPAQUE)
+        for default in (value.__defaults__ or ()) + tuple((value.__kwdefaults__ or {}).values()):
+            _trace(default, found, seen, depth + 1)
+    elif isinstance(value, types.MethodType):
+        _trace(value.__self__, found, seen, depth + 1)
+        _trace(value.__func__, found, seen, depth + 1)
+    elif isinstance(value, partial):
+        for item in (value.func, *value.args, *value.keywords.values()):
+            _trace(item, found, seen, depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            _trace(item, found, seen, depth + 1)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _trace(item, found, seen, depth + 1)
+    else:
+        found.append(OPAQUE)
+
+def updater_inputs(updater):
+    """
+    The inputs of an updater: what it declared through depends_on, or what its closure holds.
+
+    Tracing follows closures, defaults, bound methods, partials and
+    containers, so always_redraw's function and the trackers and mobjects it
+    captures are found. Module globals are taken to be constant. Returns
+    None when something that cannot be versioned is reachable (a Scene, any
+    other object), in which case the updater always runs.
+    """
+    declared = getattr(updater, "depends_on", None)
+    if declared is not None:
+        return list(declared)
+    found = []
+    _trace(updater, found, set(), 0)
+    if any(value is OPAQUE for value in found):
+        return None
+    return found
+
+def _visual(animation, camera):
+    """Whether an animation can change the picture (Waits and plain ValueTrackers cannot)."""
+    if isinstance(animation, Wait):
+        return False
+    mob = animation.mobject
+    if isinstance(mob, ValueTracker):
+        # ThreeDCamera keeps its angles, zoom and frame centre in ValueTrackers
+        return any(mob is tracker for tracker in vars(camera).values())
+    return True
+
+class ReactiveRenderer():
+    """Renderer mixin reusing the previous frame when the scene reports nothing changed."""
+    _reusable = False
+
+    def play(self, scene, *args, **kwargs):
+        self._reusable = False
+        return super().play(scene, *args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # Building the static image draws only part of the frame
+        try:
+            return super().save_static_frame_data(scene, static_mobjects)
+        finally:
+            self._reusable = False
+
+    def update_frame(self, scene, mobjects = None, include_submobjects = True, ignore_skipping = True, **kwargs):
+        if self.skip_animations and not ignore_skipping:
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        changed = getattr(scene, "frame_changed", True)
+        scene.frame_changed = True
+        stats = cache_stats("frame reuse")
+        if self._reusable and not changed:
+            stats.hit()
+            return
+        stats.miss()
+        super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        self._reusable = True
+
+class ReactiveMixin(ComposedScene):
+    """
+    Scene mixin running updaters only when their inputs changed.
+
+    An updater runs when it is time-based (takes dt), when its inputs cannot
+    all be versioned, or when the state of its inputs or of its own mobject
+    differs from right after its last run. Like any caching of updaters, this
+    assumes they are deterministic and only change their own mobject.
+    After each update the scene sets `frame_changed`, which ReactiveRenderer
+    reads to reuse the last frame.
+
+    Each mobject's own state is hashed at most once per frame, plus once
+    after each of its updaters that runs: the hashes are kept for the frame
+    and dropped for the family of a mobject whose updater ran.
+
+    Inputs are traced again every frame, so captured variables that were
+    rebound and captured lists that were changed are seen. An updater that
+    changes its own captured values (a counter it increments, a list it
+    appends to) is stateful, and runs every frame from then on.
+    """
+    renderer_mixins = (ReactiveRenderer,)
+    frame_changed = True
+
+    def update_to_time(self, t):
+        self.frame_changed = bool(self.updaters) or any(
+            _visual(animation, self.renderer.camera) for animation in self.animations
+        )
+        super().update_to_time(t)
+
+    def update_mobjects(self, dt):
+        if not hasattr(self, "_updater_keys"):
+            self._updater_keys = {}
+            self._updater_kinds = {}
+            self._stateful = set()
+        # id -> (mobject, member_key), for this frame; holding the mobject keeps its id from being reused
+        self._member_keys = {}
+        for mobject in self.mobjects:
+            self._update_family(mobject, dt)
+
+    def _update_family(self, mob, dt):
+        if mob.updating_suspended:
+            return
+        for updater in mob.updaters:
+            self._run_updater(mob, updater, dt)
+        for submob in mob.submobjects:
+            self._update_family(submob, dt)
+
+    def _run_updater(self, mob, updater, dt):
+        slot = (id(mob), id(updater))
+        if slot not in self._updater_kinds:
+            # Holding on to mob and updater keeps their ids from being reused
+            self._updater_kinds[slot] = (mob, updater, "dt" in inspect.signature(updater).parameters)
+        time_based = self._updater_kinds[slot][2]
+        # Traced each time: closure cells and containers may hold something else by now
+        inputs = None if time_based or slot in self._stateful else updater_inputs(updater)
+
+        stats = cache_stats("updaters")
+        key = None if inputs is None else self._key(mob, inputs)
+        if key is not None and self._updater_keys.get(slot) == key:
+            stats.hit()
+            return
+        stats.miss()
+        family = mob.get_family()
+        before = state_key(mob, self._member_key) if key is None else key[0]
+        if time_based:
+            updater(mob, dt)
+        else:
+            updater(mob)
+        # The updater may have changed anything in its mobject's family, before and after
+        for m in family + mob.get_family():
+            self._member_keys.pop(id(m), None)
+        after = state_key(mob, self._member_key)
+        if after != before:
+            self.frame_changed = True
+        if inputs is None:
+            return
+        inputs_after = updater_inputs(updater)
+        if inputs_after is None or self._plain_versions(inputs_after) != self._plain_versions(inputs):
+            # It changed its own captured values: skipping it would change what it does
+            self._stateful.add(slot)
+            self._updater_keys.pop(slot, None)
+        else:
+            self._updater_keys[slot] = (after, tuple(self._version(value) for value in inputs_after))
+
+    def _plain_versions(self, inputs):
+        """The inputs' versions, with mobjects (whose state the updater may change) only by identity."""
+        return tuple(id(value) if isinstance(value, Mobject) else self._version(value) for value in inputs)
+
+    def _member_key(self, m):
+        entry = self._member_keys.get(id(m))
+        if entry is None or entry[0] is not m:
+            entry = self._member_keys[id(m)] = (m, member_key(m))
+        return entry[1]
+
+    def _version(self, value):
+        if isinstance(value, Mobject):
+            return state_key(value, self._member_key)
+        if isinstance(value, np.ndarray):
+            return hash(value.tobytes())
+        return value
+
+    def _key(self, mob, inputs):
+        return (state_key(mob, self._member_key), tuple(self._version(value) for value in inputs))
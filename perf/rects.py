@@ -0,0 +1,156 @@
+import math
+
+import cairo
+import numpy as np
+from manim import *
+
+from .compose import ComposedScene
+from .stats import cache_stats
+
+# Axis-aligned rectangle fills: a Square or Rectangle that has not been
+# rotated, with one solid fill colour, is blitted straight into the pixel
+# array with numpy instead of going through Cairo's path filling. Edges get
+# exact area coverage, which is what Cairo's antialiasing approximates.
+
+def device_rect(points, matrix):
+    """
+    (x0, y0, x1, y1) in device pixels if points trace an axis-aligned rectangle, else None.
+
+    The path has to be one closed run of four straight segments (how Polygon
+    builds rectangles) with every point on the rectangle's border.
+    """
+    if len(points) != 16 or matrix.xy or matrix.yx:
+        return None
+    xs = points[:, 0] * matrix.xx + matrix.x0
+    ys = points[:, 1] * matrix.yy + matrix.y0
+    x0, x1, y0, y1 = xs.min(), xs.max(), ys.min(), ys.max()
+    tol = 1e-3
+    on_x = (np.abs(xs - x0) < tol) | (np.abs(xs - x1) < tol)
+    on_y = (np.abs(ys - y0) < tol) | (np.abs(ys - y1) < tol)
+    if not (on_x | on_y).all():
+        return None
+    # Each cubic is straight and axis-parallel: its four points share an x or a y
+    seg_x, seg_y = xs.reshape(4, 4), ys.reshape(4, 4)
+    straight = (np.ptp(seg_x, axis = 1) < tol) | (np.ptp(seg_y, axis = 1) < tol)
+    corners = {(round(x, 2), round(y, 2)) for x, y in zip(xs[::4], ys[::4])}
+    if not straight.all() or len(corners) != 4:
+        return None
+    return x0, y0, x1, y1
+
+def coverage(lo, hi, start, stop):
+    """Share of each pixel in [start, stop) covered by the interval [lo, hi]."""
+    edges = np.arange(start, stop, dtype = np.float32)
+    return np.clip(np.minimum(hi, edges + 1) - np.maximum(lo, edges), 0, 1)
+
+def _blend(region, color, alpha):
+    """Premultiplied OVER of color (RGB 0-255) with per-pixel alpha onto a uint8 RGBA region."""
+    a = alpha[:, :, None]
+    src = np.empty(region.shape, dtype = np.float32)
+    src[:, :, :3] = color
+    src[:, :, 3] = 255
+    region[:] = np.rint(src * a + region * (1 - a)).astype(np.uint8)
+
+def blit_rect(pixels, rect, rgba, clip = None):
+    """
+    Fill the device rectangle into pixels with an RGBA (floats 0-1) colour, antialiasing the edges.
+
+    clip is an optional device-space (x0, y0, x1, y1) box nothing outside of which is touched.
+    """
+    height, width = pixels.shape[:2]
+    x0, y0, x1, y1 = rect
+    if clip is not None:
+        x0, y0 = max(x0, clip[0]), max(y0, clip[1])
+        x1, y1 = min(x1, clip[2]), min(y1, clip[3])
+    i0, i1 = max(0, math.floor(x0)), min(width, math.ceil(x1))
+    j0, j1 = max(0, math.floor(y0)), min(height, math.ceil(y1))
+    if i0 >= i1 or j0 >= j1:
+        return
+    color = np.asarray(rgba[:3], dtype = np.float32) * 255
+    opacity = float(rgba[3])
+    cov_x = coverage(x0, x1, i0, i1)
+    cov_y = coverage(y0, y1, j0, j1)
+
+    if opacity < 1:
+        _blend(pixels[j0:j1, i0:i1], color, np.outer(cov_y, cov_x) * opacity)
+        return
+
+    # Opaque: the fully covered interior is a plain assignment, only the
+    # partially covered border rows and columns need blending
+    full_x, full_y = np.flatnonzero(cov_x >= 1), np.flatnonzero(cov_y >= 1)
+    if not len(full_x) or not len(full_y):
+        _blend(pixels[j0:j1, i0:i1], color, np.outer(cov_y, cov_x))
+        return
+    a, b = full_x[0], full_x[-1] + 1
+    c, d = full_y[0], full_y[-1] + 1
+    pixels[j0 + c:j0 + d, i0 + a:i0 + b, :3] = np.rint(color).astype(np.uint8)
+    pixels[j0 + c:j0 + d, i0 + a:i0 + b, 3] = 255
+    if c > 0:
+        _blend(pixels[j0:j0 + c, i0:i1], color, np.outer(cov_y[:c], cov_x))
+    if d < j1 - j0:
+        _blend(pixels[j0 + d:j1, i0:i1], color, np.outer(cov_y[d:], cov_x))
+    if a > 0:
+        _blend(pixels[j0 + c:j0 + d, i0:i0 + a], color, np.outer(cov_y[c:d], cov_x[:a]))
+    if b < i1 - i0:
+        _blend(pixels[j0 + c:j0 + d, i0 + b:i1], color, np.outer(cov_y[c:d], cov_x[b:]))
+
+class RectFillCamera():
+    """
+    Camera mixin taking the numpy path for solid, unrotated rectangle fills.
+
+    Strokes are still drawn by Cairo, on top of the blitted fill. Rectangles
+    with a background stroke or a gradient/sheen fill, and anything drawn
+    through a stand-in context (like the tiled camera's recorder), take the
+    normal path. The pixel array holds premultiplied RGBA in manim's channel
+    order (Cairo's BGRA with red and blue swapped back by the camera).
+    """
+    _blit_pixels = None
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        self._blit_pixels = pixel_array
+        try:
+            return super().display_multiple_non_background_colored_vmobjects(vmobjects, pixel_array)
+        finally:
+            self._blit_pixels = None
+
+    def display_vectorized(self, vmobject, ctx):
+        rect = self._fast_rect(vmobject, ctx)
+        if rect is None:
+            return super().display_vectorized(vmobject, ctx)
+        rect, rgba = rect
+        # Honour a clip set up around the draw (the damage renderer's dirty
+        # rectangles); those are axis-aligned, so their extents are exact
+        ctx.save()
+        ctx.identity_matrix()
+        clip = ctx.clip_extents()
+        ctx.restore()
+        surface = ctx.get_target()
+        surface.flush()
+        blit_rect(self._blit_pixels, rect, rgba, clip)
+        surface.mark_dirty()
+        if vmobject.get_stroke_width() > 0:
+            self.set_cairo_context_path(ctx, vmobject)
+            self.apply_stroke(ctx, vmobject)
+        return self
+
+    def _fast_rect(self, vmobject, ctx):
+        """((x0, y0, x1, y1), rgba) when the vmobject's fill can be blitted, else None."""
+        if self._blit_pixels is None or not isinstance(ctx, cairo.Context):
+            return None
+        rgbas = self.get_fill_rgbas(vmobject)
+        if len(rgbas) != 1 or rgbas[0][3] == 0:
+            return None
+        stats = cache_stats("rect fast path")
+        if vmobject.get_stroke_width(background = True) > 0:
+            stats.miss()
+            return None
+        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        rect = device_rect(points, ctx.get_matrix())
+        if rect is None:
+            stats.miss()
+            return None
+        stats.hit()
+        return rect, rgbas[0]
+
+class RectFillMixin(ComposedScene):
+    """Scene mixin turning on the rectangle fill fast path (see RectFillCamera)."""
+    camera_mixins = (RectFillCamera,)
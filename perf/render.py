@@ -0,0 +1,76 @@
+from manim import *
+
+from .batch import BatchedMixin
+from .coalesce import CoalescingMixin
+from .compact import Float32Mixin
+from .cow import CopyOnWriteMixin
+from .culling import CullingMixin
+from .damage import DamageMixin
+from .depthsort import DepthSortMixin
+from .family import FamilyCacheMixin
+from .layers import StaticLayerMixin
+from .loader import instrument, load_scenes
+from .lod import LevelOfDetailMixin
+from .partial import PartialPathMixin
+from .reactive import ReactiveMixin
+from .rects import RectFillMixin
+from .shading import ShadingCacheMixin
+from .simplify import SimplifiedPathsMixin
+from .templates import TemplateMixin
+from .tessellation import TessellationMixin
+from .tiles import TiledMixin
+
+# Rendering with opt-in optimizations switched on. Each feature is a scene
+# mixin; `python -m perf render` stacks the ones asked for in front of the
+# scene, and scene files can equally inherit from them directly.
+
+# flag name -> (scene mixin, help), outermost first: a feature's full redraw
+# falls through to the features listed after it.
+FEATURES = {
+    "reactive": (ReactiveMixin, "rerun updaters only when their inputs changed, reuse unchanged frames"),
+    "batch": (BatchedMixin, "interpolate all plain Transforms of a play in one vectorised step per frame"),
+    "partial-paths": (PartialPathMixin, "cut the paths Create and Write draw from length tables built once per animation"),
+    "tessellation": (TessellationMixin, "build spheres, cylinders, cubes and prisms from faces cached per shape and size"),
+    "templates": (TemplateMixin, "build arcs from cached unit templates and polygons in one vectorised step"),
+    "simplify": (SimplifiedPathsMixin, "reduce plots and smooth paths to the fewest curves within half a pixel"),
+    "cow": (CopyOnWriteMixin, "share points and colours between a mobject and its copies until one is written to"),
+    "float32": (Float32Mixin, "store mobject points as float32, halving what large scenes keep in memory"),
+    "families": (FamilyCacheMixin, "cache flattened mobject families until their structure changes"),
+    "lod": (LevelOfDetailMixin, "draw 3D objects a few pixels across as one polygon and merge faces smaller than a few pixels"),
+    "shading-cache": (ShadingCacheMixin, "reuse the shaded colours of 3D faces until their points or the light move"),
+    "culling": (CullingMixin, "skip fully transparent and off-frame mobjects before sorting and drawing"),
+    "damage": (DamageMixin, "re-rasterize only the screen areas that changed since the previous frame"),
+    "static-layers": (StaticLayerMixin, "rasterize the static layers below and above what moves once per play"),
+    "tiles": (TiledMixin, "rasterize large batches in horizontal bands on a thread pool"),
+    "rect-fill": (RectFillMixin, "blit solid, unrotated rectangle fills with numpy instead of Cairo"),
+    "coalesce": (CoalescingMixin, "write runs of short plays into one partial movie file, without hashing each"),
+    "depth-sort": (DepthSortMixin, "sort 3D scenes by depth starting from the previous frame's order"),
+}
+
+def with_features(scene_cls, names):
+    """scene_cls with the mixins of the named features in front of it."""
+    return instrument(scene_cls, *(mixin for name, (mixin, _) in FEATURES.items() if name in names))
+
+# ---------- command line ----------
+
+def register(subparsers):
+    parser = subparsers.add_parser("render", help = "render scenes with opt-in optimizations")
+    parser.add_argument("file", help = "project script, e.g. pts/main.py")
+    parser.add_argument("scenes", nargs = "*", help = "scene names (default: every scene in the file)")
+    parser.add_argument("-q", "--quality", choices = ["low", "medium", "high", "production", "fourk"],
+                        help = "render quality (default: whatever the project's manim.cfg says)")
+    parser.add_argument("--all", action = "store_true", help = "turn on every feature")
+    for name, (_, help) in FEATURES.items():
+        parser.add_argument(f"--{name}", action = "store_true", help = help)
+    parser.set_defaults(func = main, path_args = ["file"])
+
+def selected_features(args):
+    return [name for name in FEATURES if args.all or getattr(args, name.replace("-", "_"))]
+
+def main(args):
+    scenes = load_scenes(args.file, args.scenes)
+    if args.quality:
+        config.quality = f"{args.quality}_quality"
+    names = selected_features(args)
+    for scene_cls in scenes:
+        with_features(scene_cls, names)().render()
@@ -0,0 +1,76 @@
+import weakref
+
+from manim import *
+
+from .compose import ComposedScene
+from .stats import cache_stats
+
+# Cached shading: ThreeDCamera shades the two gradient colours of every
+# shade_in_3d face in every frame, from the face's corner points and normals
+# and the light source, which is a handful of small numpy calls per face.
+# Here the shaded colours are kept per face and reused for as long as the
+# corner points and colours the shading reads and the light source stay the
+# same.
+
+# Colour arrays (fill, stroke, background stroke, ...) remembered per face at most
+MAX_SHADINGS_PER_FACE = 4
+
+def shading_indices(n_points):
+    """
+    The points ThreeDCamera's shading reads from a face of n_points points:
+    the start and end corners and the neighbours their normals come from.
+    """
+    indices = []
+    for i in (0, ((n_points - 1) // 6) * 3):
+        im3 = i - 3 if i > 2 else n_points - 4
+        ip3 = i + 3 if i < n_points - 3 else 3
+        indices += [im3, i, ip3]
+    return [i for i in indices if 0 <= i < n_points]
+
+class ShadingCacheCamera():
+    """
+    ThreeDCamera mixin reusing shaded colours while nothing they depend on changed.
+
+    Cairo shading depends on a handful of the face's points (two corners and
+    the neighbours of each that give its normal), the number of points, the
+    first two colours and the light source position, not on where the camera
+    looks from, so turning the camera keeps the cache valid. Only those are
+    compared, by content, so the check costs the same for any face and sees
+    in-place edits too. The cached arrays are read-only.
+    """
+    def modified_rgbas(self, vmobject, rgbas):
+        if (
+            not isinstance(self, ThreeDCamera) or not self.should_apply_shading
+            or not vmobject.shade_in_3d or not vmobject.get_num_points()
+        ):
+            return super().modified_rgbas(vmobject, rgbas)
+        if not hasattr(self, "_shadings"):
+            self._shadings = weakref.WeakKeyDictionary()
+        shadings = self._shadings.get(vmobject)
+        if shadings is None:
+            shadings = self._shadings[vmobject] = {}
+
+        points = vmobject.points
+        n_points = len(points)
+        key = (n_points, points[shading_indices(n_points)].tobytes(), self.light_source.points[0].tobytes())
+        # Only the first two colours are shaded (one is repeated); the rest are dropped
+        colours = (len(rgbas) < 2, rgbas[:2].tobytes())
+        entry = shadings.get(colours)
+        stats = cache_stats("shading")
+        if entry is not None and entry[0] == key:
+            stats.hit()
+            return entry[1]
+        stats.miss()
+        shaded = super().modified_rgbas(vmobject, rgbas)
+        if shaded is rgbas:
+            # Left unshaded by a camera further down (an Impostor under --lod)
+            return shaded
+        shaded.flags.writeable = False
+        if colours not in shadings and len(shadings) >= MAX_SHADINGS_PER_FACE:
+            shadings.clear()
+        shadings[colours] = (key, shaded)
+        return shaded
+
+class ShadingCacheMixin(ComposedScene):
+    """Scene mixin caching per-face shading in 3D scenes (see ShadingCacheCamera)."""
+    camera_mixins = (ShadingCacheCamera,)
@@ -0,0 +1,228 @@
+from contextlib import contextmanager
+
+import numpy as np
+from manim import *
+
+from .stats import cache_stats
+
+# Path simplification: dense generated paths (axes.plot, set_points_smoothly
+# through hundreds of samples like graph2 in Slider_C_Chart) carry far more
+# cubic curves than differ visibly at the output resolution. Douglas–Peucker
+# over the path's anchors picks the ones that matter, then every run of
+# curves between two kept anchors is refitted with a single cubic keeping the
+# original tangents at both ends; runs that do not fit within the tolerance
+# are split at their worst point until they do.
+
+# Allowed deviation from the original path, in output pixels
+PATH_TOLERANCE = 0.5
+
+# Points sampled on each original curve to measure the deviation against
+SAMPLES_PER_CURVE = 4
+
+def pixel_size():
+    """Scene units per output pixel at the configured resolution."""
+    return config.frame_width / config.pixel_width
+
+def _bernstein(t):
+    mt = 1 - t
+    return np.stack([mt ** 3, 3 * mt ** 2 * t, 3 * mt * t ** 2, t ** 3], axis = 1)
+
+def _distances(points, a, b):
+    """Distances of points from the segment ab."""
+    ab = b - a
+    length = ab @ ab
+    t = np.clip((points - a) @ ab / length, 0, 1) if length > 0 else np.zeros(len(points))
+    return np.linalg.norm(points - (a + t[:, None] * ab), axis = 1)
+
+def douglas_peucker(points, tolerance, candidates):
+    """
+    The candidates (sorted indices into points, first and last included) to keep.
+
+    Every point lies within tolerance of the polyline through the points kept,
+    except where no candidate is left between two kept ones.
+    """
+    keep = {0, len(candidates) - 1}
+    stack = [(0, len(candidates) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        lo, hi = candidates[i], candidates[j]
+        distances = _distances(points[lo + 1:hi], points[lo], points[hi])
+        if distances.max() <= tolerance:
+            continue
+        worst = lo + 1 + np.argmax(distances)
+        k = int(np.clip(np.searchsorted(candidates, worst), i + 1, j - 1))
+        if k > i + 1 and worst - candidates[k - 1] < candidates[k] - worst:
+            k -= 1
+        keep.add(k)
+        stack += [(i, k), (k, j)]
+    return [candidates[k] for k in sorted(keep)]
+
+def _direction(*vectors):
+    """The first of vectors that is not zero, normalised (or zero)."""
+    for v in vectors:
+        norm = np.linalg.norm(v)
+        if norm > 1e-12:
+            return v / norm
+    return np.zeros_like(vectors[0])
+
+def fit_cubic(samples, start_tangent, end_tangent):
+    """
+    The cubic through the first and last samples, leaving along start_tangent
+    and arriving against end_tangent, closest to the samples in the least
+    squares sense (Schneider's method, chord-length parameters).
+    Returns the control points and the deviation from each sample.
+    """
+    p0, p3 = samples[0], samples[-1]
+    chords = np.concatenate([[0], np.cumsum(np.linalg.norm(np.diff(samples, axis = 0), axis = 1))])
+    u = chords / chords[-1] if chords[-1] > 0 else np.linspace(0, 1, len(samples))
+    b = _bernstein(u)
+    a1, a2 = b[:, 1:2] * start_tangent, b[:, 2:3] * end_tangent
+    rest = samples - np.outer(b[:, 0] + b[:, 1], p0) - np.outer(b[:, 2] + b[:, 3], p3)
+    c = np.array([[np.sum(a1 * a1), np.sum(a1 * a2)], [np.sum(a1 * a2), np.sum(a2 * a2)]])
+    x = np.array([np.sum(a1 * rest), np.sum(a2 * rest)])
+    det = np.linalg.det(c)
+    alphas = np.linalg.solve(c, x) if abs(det) > 1e-12 else np.zeros(2)
+    if min(alphas) <= 1e-6 * chords[-1]:
+        # Degenerate fit: fall back to handles a third of the way along the chord
+        alphas = np.full(2, np.linalg.norm(p3 - p0) / 3)
+    curve = np.array([p0, p0 + alphas[0] * start_tangent, p3 + alphas[1] * end_tangent, p3])
+    return curve, np.linalg.norm(b @ curve - samples, axis = 1)
+
+def simplify_subpath(curves, tolerance):
+    """Fewer cubic curves (n, 4, dim) tracing curves within tolerance."""
+    n = len(curves)
+    if n < 2:
+        return curves
+    t = np.linspace(0, 1, SAMPLES_PER_CURVE + 1)[:-1]
+    samples = np.concatenate([np.einsum("sk,nkd->nsd", _bernstein(t), curves).reshape(-1, curves.shape[2]), curves[-1:, 3]])
+    anchors = list(range(0, len(samples), SAMPLES_PER_CURVE))
+    kept = douglas_peucker(samples, tolerance, anchors)
+
+    result = []
+    spans = [(kept[i] // SAMPLES_PER_CURVE, kept[i + 1] // SAMPLES_PER_CURVE) for i in range(len(kept) - 1)]
+    spans.reverse()
+    while spans:
+        first, last = spans.pop()
+        if last - first == 1:
+            result.append(curves[first])
+            continue
+        start = _direction(curves[first, 1] - curves[first, 0], curves[first, 2] - curves[first, 0], curves[first, 3] - curves[first, 0])
+        end = _direction(curves[last - 1, 2] - curves[last - 1, 3], curves[last - 1, 1] - curves[last - 1, 3], curves[last - 1, 0] - curves[last - 1, 3])
+        span_samples = samples[first * SAMPLES_PER_CURVE:last * SAMPLES_PER_CURVE + 1]
+        curve, errors = fit_cubic(span_samples, start, end)
+        if errors.max() <= tolerance:
+            result.append(curve)
+            continue
+        # Split at the anchor nearest the worst sample and fit both halves
+        worst = np.argmax(errors)
+        middle = int(np.clip(first + round(worst / SAMPLES_PER_CURVE), first + 1, last - 1))
+        spans += [(middle, last), (first, middle)]
+    return np.array(result)
+
+# Instance attribute holding the points a member was last simplified to
+SIMPLIFIED_KEY = "_simplified_points"
+
+def _already_simplified(member):
+    """Whether member still holds the points it was simplified to (in-place edits aside)."""
+    done = member.__dict__.get(SIMPLIFIED_KEY)
+    points = member.points
+    return (
+        done is not None and done.shape == points.shape
+        and done.__array_interface__["data"][0] == points.__array_interface__["data"][0]
+    )
+
+def simplify(mob, tolerance = PATH_TOLERANCE, family = True):
+    """
+    Simplify the paths of mob's family (or only mob's own) to within
+    tolerance output pixels, in place.
+
+    Members with simplify_paths set to False, and members whose points were
+    simplified already, are left alone, so error cannot build up over
+    repeated fits.
+    """
+    stats = cache_stats("simplified curves")
+    members = mob.family_members_with_points() if family else [mob] if mob.has_points() else []
+    for member in members:
+        if not isinstance(member, VMobject) or not getattr(member, "simplify_paths", True) or _already_simplified(member):
+            continue
+        nppc = member.n_points_per_cubic_curve
+        subpaths = [
+            simplify_subpath(subpath.reshape(-1, nppc, member.dim), tolerance * pixel_size())
+            for subpath in member.get_subpaths()
+        ]
+        before = member.get_num_curves()
+        member.points = np.concatenate([s.reshape(-1, member.dim) for s in subpaths]) if subpaths else member.points
+        # Kept alive, so its memory cannot be reused by another array
+        member.__dict__[SIMPLIFIED_KEY] = np.asarray(member.points)
+        after = member.get_num_curves()
+        stats.hit(before - after)
+        stats.miss(after)
+    return mob
+
+_tolerance = None
+_installed = None
+
+def _simplifying(generate):
+    def simplified(self, *args, **kwargs):
+        result = generate(self, *args, **kwargs)
+        if _tolerance is not None:
+            # Only the path just made: submobjects keep theirs
+            simplify(self, _tolerance, family = False)
+        return result
+    return simplified
+
+def _opting_out(init):
+    # The flag has to be set before ParametricFunction.__init__ makes the points
+    def __init__(self, *args, simplify_paths = True, **kwargs):
+        self.simplify_paths = simplify_paths
+        init(self, *args, **kwargs)
+    return __init__
+
+@contextmanager
+def simplified_paths(tolerance = PATH_TOLERANCE):
+    """
+    Simplify plots (ParametricFunction, so axes.plot and FunctionGraph) and
+    paths set through set_points_smoothly as they are made, while the block runs.
+
+    A plot made with simplify_paths = False (`axes.plot(f, simplify_paths = False)`)
+    is left exact. Passing None suspends simplification in a nested block.
+    """
+    global _tolerance, _installed
+    saved_tolerance = _tolerance
+    saved = None
+    if _installed is None:
+        wrappers = [
+            (ParametricFunction, "generate_points", _simplifying), (ParametricFunction, "init_points", _simplifying),
+            (VMobject, "set_points_smoothly", _simplifying), (ParametricFunction, "__init__", _opting_out),
+        ]
+        saved = _installed = [(klass, name, klass.__dict__[name]) for klass, name, _ in wrappers]
+        for klass, name, wrap in wrappers:
+            setattr(klass, name, wrap(klass.__dict__[name]))
+    _tolerance = tolerance
+    try:
+        yield
+    finally:
+        _tolerance = saved_tolerance
+        if saved is not None:
+            _installed = None
+            for klass, name, original in saved:
+                setattr(klass, name, original)
+
+def no_simplification():
+    """Keep the paths made while the block runs exact (simplified_paths(None))."""
+    return simplified_paths(None)
+
+class SimplifiedPathsMixin():
+    """
+    Scene mixin simplifying generated plots and smooth paths to path_tolerance pixels (see simplified_paths).
+
+    Plots made with simplify_paths = False, and paths made inside
+    `with no_simplification():`, are kept exact.
+    """
+    path_tolerance = PATH_TOLERANCE
+
+    def render(self, *args, **kwargs):
+        with simplified_paths(self.path_tolerance):
+            return super().render(*args, **kwargs)
@@ -0,0 +1,45 @@
+# Hit/miss counters for the caches in this folder, collected in one place so
+# the benchmark suite can report hit rates without knowing which caches exist.
+
+class CacheStats():
+    """Hit and miss counts of one named cache."""
+    def __init__(self, name):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+
+    def hit(self, n = 1):
+        self.hits += n
+
+    def miss(self, n = 1):
+        self.misses += n
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self):
+        self.hits = self.misses = 0
+
+    def __repr__(self):
+        return f"CacheStats({self.name!r}, hits = {self.hits}, misses = {self.misses})"
+
+CACHES = {}
+
+def cache_stats(name):
+    """The counters registered under name, created on first use."""
+    if name not in CACHES:
+        CACHES[name] = CacheStats(name)
+    return CACHES[name]
+
+def snapshot():
+    """Every cache that saw any traffic, as {name: {"hits", "misses", "hit_rate"}}."""
+    return {
+        name: {"hits": s.hits, "misses": s.misses, "hit_rate": s.hit_rate}
+        for name, s in sorted(CACHES.items()) if s.hits or s.misses
+    }
+
+def reset_all():
+    for s in CACHES.values():
+        s.reset()
@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+
+import numpy as np
+from manim import *
+
+from .stats import cache_stats
+
+# Primitive templates: while active, an Arc (and so every Circle, Ellipse,
+# Dot and ArcBetweenPoints, and the brims and crowns of get_hat) takes its
+# points from a unit arc computed once per (start angle, angle, number of
+# components) and only scales and shifts them, and a Polygram (Polygon,
+# Rectangle, Square, the make_notes bodies) builds all its edges in one
+# vectorised step instead of path by path. Both do the same floating point
+# operations as manim, so the points come out bit for bit the same.
+
+# Unit arcs kept at most; the oldest is dropped past this
+MAX_ARC_TEMPLATES = 1024
+
+# (start_angle, angle, num_components) -> read-only unit arc points
+ARC_TEMPLATES = {}
+
+def arc_template(arc, compute):
+    """The unit points for arc's parameters, computed into arc by compute() on a miss."""
+    key = (float(arc.start_angle), float(arc.angle), int(arc.num_components))
+    template = ARC_TEMPLATES.get(key)
+    stats = cache_stats("arc templates")
+    if template is not None:
+        stats.hit()
+        return template
+    stats.miss()
+    compute()
+    if len(ARC_TEMPLATES) >= MAX_ARC_TEMPLATES:
+        del ARC_TEMPLATES[next(iter(ARC_TEMPLATES))]
+    template = ARC_TEMPLATES[key] = arc.points.copy()
+    template.flags.writeable = False
+    return template
+
+def _templated_arc_points(self):
+    # Arc.generate_points: the unit arc, scaled about the origin, then shifted
+    template = arc_template(self, self._set_pre_positioned_points)
+    self.points = self.radius * template
+    self.points += self.arc_center
+
+def polygon_points(vertices, t_values):
+    """The points of the closed polyline through vertices, one straight cubic per edge, as Polygram makes them."""
+    starts = np.array(vertices, dtype = float)
+    ends = np.roll(starts, -1, axis = 0)
+    t = np.asarray(t_values)[:, None, None]
+    points = (1 - t) * starts + t * ends
+    return points.transpose(1, 0, 2).reshape(-1, starts.shape[1])
+
+def _templated_polygram_init(self, *vertex_groups, color = BLUE, **kwargs):
+    VMobject.__init__(self, color = color, **kwargs)
+    groups = [polygon_points(vertices, self._bezier_t_values) for vertices in vertex_groups if len(vertices)]
+    if groups:
+        self.append_points(np.concatenate(groups))
+
+@contextmanager
+def primitive_templates():
+    """Build arcs from cached unit templates and polygons in one step while the block runs."""
+    saved = [(Arc, "generate_points", Arc.__dict__["generate_points"]), (Polygram, "__init__", Polygram.__dict__["__init__"])]
+    Arc.generate_points = _templated_arc_points
+    Polygram.__init__ = _templated_polygram_init
+    try:
+        yield
+    finally:
+        for klass, name, original in saved:
+            setattr(klass, name, original)
+
+class TemplateMixin():
+    """Scene mixin building primitive geometry from templates (see primitive_templates)."""
+    def render(self, *args, **kwargs):
+        with primitive_templates():
+            return super().render(*args, **kwargs)
@@ -0,0 +1,122 @@
+import copy
+from contextlib import contextmanager
+
+import numpy as np
+from manim import *
+
+from .family import CACHE_KEY
+from .stats import cache_stats
+
+# Tessellation cache: while active, the faces of a Sphere, Cylinder (and so
+# Line3D), Cube or Prism are built once per shape and size and kept. Every
+# later instance of the same shape gets shallow clones of those faces with
+# their own copies of the point arrays, instead of constructing a
+# ThreeDVMobject or Square per face and evaluating the parametric surface
+# point by point. Styles are still set on the clones the way the
+# constructors set them, so instances come out exactly as before.
+
+# Shapes kept at most; the oldest is dropped past this
+MAX_TESSELLATIONS = 256
+
+# key -> faces, as built for the first instance (never added to anything)
+TESSELLATIONS = {}
+
+def clone_face(face):
+    """A copy of a face without submobjects, sharing nothing mutable with it."""
+    clone = copy.copy(face)
+    for key, value in face.__dict__.items():
+        if isinstance(value, np.ndarray):
+            clone.__dict__[key] = np.array(value)
+        elif isinstance(value, (list, dict, set)):
+            clone.__dict__[key] = copy.copy(value)
+    clone.__dict__.pop(CACHE_KEY, None)
+    return clone
+
+def _store(key, faces):
+    stats = cache_stats("tessellations")
+    stats.miss()
+    if len(TESSELLATIONS) >= MAX_TESSELLATIONS:
+        del TESSELLATIONS[next(iter(TESSELLATIONS))]
+    TESSELLATIONS[key] = [clone_face(face) for face in faces]
+
+def _lookup(key):
+    faces = TESSELLATIONS.get(key)
+    if faces is not None:
+        cache_stats("tessellations").hit()
+        return [clone_face(face) for face in faces]
+    return None
+
+def surface_key(surface):
+    """What the geometry of a stock Sphere or Cylinder depends on, or None for other surfaces."""
+    func = type(surface).func
+    if func is not Sphere.func and func is not Cylinder.func:
+        return None
+    return (
+        func, float(surface.radius), tuple(surface.u_range), tuple(surface.v_range),
+        tuplify(surface.resolution), surface.pre_function_handle_to_anchor_scale_factor,
+    )
+
+def _surface_setup(setup):
+    def setup_in_uv_space(self):
+        key = surface_key(self)
+        faces = None if key is None else _lookup(key)
+        if faces is None:
+            # Surface.__init__ applies the function next; its result is stored then
+            self.__dict__["_tessellation_key"] = key
+            return setup(self)
+        # The rest of Surface._setup_in_uv_space, on faces already in their final place
+        faces = VGroup(*faces)
+        faces.set_fill(color = self.fill_color, opacity = self.fill_opacity)
+        faces.set_stroke(color = self.stroke_color, width = self.stroke_width, opacity = self.stroke_opacity)
+        self.add(*faces)
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+        self.__dict__["_tessellated"] = True
+    return setup_in_uv_space
+
+def _surface_apply_function(self, function):
+    if self.__dict__.pop("_tessellated", False):
+        return self
+    key = self.__dict__.pop("_tessellation_key", None)
+    VMobject.apply_function(self, function)
+    if key is not None:
+        _store(key, self.submobjects)
+    return self
+
+def _solid_generate(klass, generate, key):
+    def generate_points(self):
+        k = (klass, *key(self))
+        faces = _lookup(k)
+        if faces is None:
+            generate(self)
+            _store(k, self.submobjects)
+        else:
+            self.add(*faces)
+    return generate_points
+
+@contextmanager
+def cached_tessellations():
+    """Build Spheres, Cylinders, Cubes and Prisms from cached faces while the block runs."""
+    saved = [(Surface, "_setup_in_uv_space", Surface.__dict__["_setup_in_uv_space"]), (Surface, "apply_function", None)]
+    for klass in (Cube, Prism):
+        saved += [(klass, "generate_points", klass.__dict__["generate_points"]), (klass, "init_points", klass.__dict__.get("init_points"))]
+    Surface._setup_in_uv_space = _surface_setup(saved[0][2])
+    Surface.apply_function = _surface_apply_function
+    Cube.generate_points = Cube.init_points = _solid_generate(Cube, saved[2][2], lambda cube: (float(cube.side_length),))
+    Prism.generate_points = Prism.init_points = _solid_generate(
+        Prism, saved[4][2], lambda prism: (float(prism.side_length), tuple(float(d) for d in prism.dimensions)),
+    )
+    try:
+        yield
+    finally:
+        for klass, name, original in saved:
+            if original is None:
+                delattr(klass, name)
+            else:
+                setattr(klass, name, original)
+
+class TessellationMixin():
+    """Scene mixin building 3D surfaces and solids from cached faces (see cached_tessellations)."""
+    def render(self, *args, **kwargs):
+        with cached_tessellations():
+            return super().render(*args, **kwargs)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The tests import perf as a package from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
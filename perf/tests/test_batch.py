@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.batch import InterpolationBatch, batchable
+
+TIMES = [0, 0.2, 0.5, 0.9, 1.0]
+
+def animations():
+    square, circle, dot = Square(), Circle().shift(LEFT), Dot(UP)
+    text_like = VGroup(Square(0.5), Triangle()).shift(DOWN)
+    return [
+        Transform(square, Circle(color = RED).shift(RIGHT)),
+        circle.animate.scale(2).set_fill(GREEN, opacity = 0.5).build(),
+        FadeIn(dot),
+        ReplacementTransform(text_like, VGroup(Star(), Square(2)).shift(UP), rate_func = linear, run_time = 0.5),
+    ]
+
+def state(animation_list):
+    return [
+        (m.points, m.fill_rgbas, m.stroke_rgbas)
+        for animation in animation_list for m in animation.mobject.get_family()
+        if isinstance(m, VMobject)
+    ]
+
+@pytest.mark.parametrize("t", TIMES)
+def test_batch_interpolates_like_each_animation(t):
+    stock, batched = animations(), animations()
+    for animation in stock + batched:
+        animation.begin()
+    assert all(batchable(animation) for animation in batched)
+    for animation in stock:
+        animation.interpolate(t / animation.run_time)
+    InterpolationBatch(batched).interpolate(t)
+    for expected, actual in zip(state(stock), state(batched)):
+        for a, b in zip(expected, actual):
+            np.testing.assert_allclose(b, a, atol = 1e-12)
+
+def test_submobjects_write_into_the_batch_buffers():
+    batched = animations()
+    for animation in batched:
+        animation.begin()
+    batch = InterpolationBatch(batched)
+    square = batched[0].mobject
+    batch.interpolate(0.3)
+    first = np.array(square.points)
+    batch.interpolate(0.7)
+    assert not np.array_equal(square.points, first)
+    assert any(np.shares_memory(square.points, buffer) for buffer, *_ in batch.arrays)
+
+def test_lagged_and_curved_transforms_are_not_batched():
+    assert not batchable(Transform(Square(), Circle(), path_arc = PI / 2))
+    assert not batchable(Transform(VGroup(Square(), Circle()), VGroup(Circle(), Square()), lag_ratio = 0.5))
+    assert not batchable(Create(Square()))
@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.batch import InterpolationBatch
+from perf.compact import float32_storage
+
+class ExactSquare(Square):
+    keep_float64 = True
+
+def test_sphere_faces_are_float32():
+    with float32_storage():
+        sphere = Sphere(resolution = (8, 8))
+    faces = sphere.family_members_with_points()
+    assert faces and all(face.points.dtype == np.float32 for face in faces)
+
+def test_aligned_transform_points_are_float32():
+    with float32_storage():
+        animation = Transform(Square(), Circle())
+        animation.begin()
+        animation.interpolate(0.5)
+    for mob in (animation.mobject, animation.starting_mobject, animation.target_copy):
+        assert mob.points.dtype == np.float32
+
+def test_points_stay_close_to_float64():
+    with float32_storage():
+        compact = Circle().rotate(0.3).shift(UP).scale(2)
+    exact = Circle().rotate(0.3).shift(UP).scale(2)
+    np.testing.assert_allclose(compact.points, exact.points, atol = 1e-6)
+
+def test_trackers_and_opted_out_mobjects_stay_float64():
+    with float32_storage():
+        tracker = ValueTracker(0.1)
+        for _ in range(10):
+            tracker.increment_value(0.1)
+        exact = ExactSquare().shift(RIGHT)
+    assert tracker.points.dtype == np.float64
+    assert tracker.get_value() == sum([0.1] * 11)
+    assert exact.points.dtype == np.float64
+
+def test_colours_only_when_asked():
+    with float32_storage():
+        assert Square().fill_rgbas.dtype == np.float64
+    with float32_storage(colours = True):
+        square = Square().set_fill(RED, opacity = 0.5)
+        assert square.fill_rgbas.dtype == np.float32
+        assert square.points.dtype == np.float32
+
+def test_batch_buffers_are_not_copied():
+    with float32_storage():
+        animation = Transform(Square(), Square().shift(RIGHT))
+        animation.begin()
+        batch = InterpolationBatch([animation])
+        batch.interpolate(0.5)
+    points = animation.mobject.points
+    assert any(np.shares_memory(points, buffer) for buffer, *_ in batch.arrays)
+    np.testing.assert_allclose(points, Square().shift(RIGHT / 2).points, atol = 1e-6)
+
+def test_patches_are_removed_afterwards():
+    with float32_storage(colours = True):
+        pass
+    assert "points" not in Mobject.__dict__
+    assert "fill_rgbas" not in VMobject.__dict__
+    assert Square().points.dtype == np.float64
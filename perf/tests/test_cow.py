@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.cow import copy_on_write
+
+def test_copies_share_arrays_until_written():
+    with copy_on_write():
+        original = Square()
+        copy = original.copy()
+        assert np.shares_memory(original.points, copy.points)
+        assert np.shares_memory(original.fill_rgbas, copy.fill_rgbas)
+
+def test_writing_a_copy_leaves_the_original_alone():
+    with copy_on_write():
+        original = Square().set_fill(BLUE, opacity = 1)
+        points, fill = np.array(original.points), np.array(original.fill_rgbas)
+        copy = original.copy()
+        copy.shift(RIGHT)
+        copy.set_fill(RED)
+        np.testing.assert_array_equal(original.points, points)
+        np.testing.assert_array_equal(original.fill_rgbas, fill)
+        np.testing.assert_array_equal(copy.points, points + RIGHT)
+        assert not np.shares_memory(original.points, copy.points)
+        assert not np.array_equal(copy.fill_rgbas, fill)
+
+def test_colour_and_opacity_changes_on_a_copy():
+    # update_rgbas_array writes twice through the same array: colour, then opacity
+    with copy_on_write():
+        original = Square().set_fill(BLUE, opacity = 1).set_stroke(WHITE, 2, opacity = 1)
+        fill, stroke = np.array(original.fill_rgbas), np.array(original.stroke_rgbas)
+        copy = original.copy()
+        copy.set_fill(RED, opacity = 0.5)
+        copy.set_stroke(GREEN, 4, opacity = 0.25)
+        target = original.copy()
+        target.generate_target()
+        target.target.set_fill(YELLOW, opacity = 0.3)
+        np.testing.assert_array_equal(original.fill_rgbas, fill)
+        np.testing.assert_array_equal(original.stroke_rgbas, stroke)
+        np.testing.assert_allclose(copy.fill_rgbas[0], [*color_to_rgb(RED), 0.5])
+        np.testing.assert_allclose(copy.stroke_rgbas[0], [*color_to_rgb(GREEN), 0.25])
+        np.testing.assert_allclose(target.target.fill_rgbas[0], [*color_to_rgb(YELLOW), 0.3])
+
+def test_writing_the_original_leaves_the_copy_alone():
+    with copy_on_write():
+        original = Square()
+        copy = original.copy()
+        points = np.array(copy.points)
+        original.points[0] = [5, 5, 0]
+        original.scale(2)
+        np.testing.assert_array_equal(copy.points, points)
+
+def test_matches_plain_copies():
+    with copy_on_write():
+        shared = Circle().copy().rotate(1).stretch(2, 0).set_stroke(RED, 3)
+    plain = Circle().copy().rotate(1).stretch(2, 0).set_stroke(RED, 3)
+    np.testing.assert_array_equal(shared.points, plain.points)
+    np.testing.assert_array_equal(shared.stroke_rgbas, plain.stroke_rgbas)
+
+def test_submobjects_are_isolated_too():
+    with copy_on_write():
+        group = VGroup(Square(), Circle())
+        copy = group.copy()
+        points = np.array(group[1].points)
+        copy[1].shift(UP)
+        np.testing.assert_array_equal(group[1].points, points)
+
+def test_patches_are_removed_afterwards():
+    before = dict(Mobject.__dict__)
+    with copy_on_write():
+        with copy_on_write():
+            pass
+        assert "points" in Mobject.__dict__
+    assert "points" not in Mobject.__dict__
+    assert Mobject.__dict__["__deepcopy__"] is before["__deepcopy__"]
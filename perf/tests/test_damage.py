@@ -0,0 +1,116 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.damage import MAX_RECTS, DamageMixin, _overlaps, merge_rects
+from perf.stats import cache_stats
+
+# ---------- merging ----------
+
+def test_disjoint_rects_stay_apart():
+    rects = [(0, 0, 10, 10), (20, 0, 30, 10), (0, 20, 10, 30)]
+    assert sorted(merge_rects(rects)) == sorted(rects)
+
+def test_touching_rects_stay_apart():
+    # Sharing an edge covers no pixel twice
+    rects = [(0, 0, 10, 10), (10, 0, 20, 10)]
+    assert sorted(merge_rects(rects)) == sorted(rects)
+
+def test_overlapping_rects_merge_into_their_union():
+    assert merge_rects([(0, 0, 10, 10), (5, 5, 15, 15)]) == [(0, 0, 15, 15)]
+
+def test_merging_repeats_until_nothing_overlaps():
+    # The union of the first two reaches the third, which overlaps neither alone
+    rects = [(0, 0, 10, 10), (8, 8, 20, 20), (18, 0, 30, 5), (100, 100, 110, 110)]
+    merged = merge_rects(rects)
+    assert sorted(merged) == [(0, 0, 30, 20), (100, 100, 110, 110)]
+    assert not any(_overlaps(a, b) for i, a in enumerate(merged) for b in merged[i + 1:])
+
+def test_too_many_rects_become_their_bounding_box():
+    rects = [(20 * i, 0, 20 * i + 10, 10) for i in range(MAX_RECTS + 1)]
+    assert merge_rects(rects) == [(0, 0, 20 * MAX_RECTS + 10, 10)]
+
+def test_empty():
+    assert merge_rects([]) == []
+
+# ---------- frames ----------
+
+class DamageScene(DamageMixin, Scene):
+    pass
+
+@pytest.fixture(autouse = True)
+def small_frames(tmp_path):
+    with tempconfig({"pixel_width": 160, "pixel_height": 90, "media_dir": str(tmp_path), "write_to_movie": False}):
+        yield
+
+def scenes():
+    """The same mobjects in a damage-tracking scene and a plain one."""
+    pair = []
+    for scene_cls in (DamageScene, Scene):
+        scene = scene_cls()
+        square = Square(1).set_fill(BLUE, 1).shift(3 * LEFT)
+        scene.add(square, Circle(0.5).set_stroke(RED, 6).shift(3 * RIGHT), Dot(2 * UP))
+        pair.append(scene)
+    return pair
+
+def frame(scene):
+    # What the start of a play does, then one frame
+    scene.renderer.save_static_frame_data(scene, [])
+    scene.renderer.update_frame(scene)
+    return scene.renderer.get_frame()
+
+def both(pair, change):
+    """Apply change to both scenes, draw a frame in each and check they match; returns the damage hit count."""
+    for scene in pair:
+        change(scene)
+    hits = cache_stats("damage").hits
+    damaged, plain = (frame(scene) for scene in pair)
+    np.testing.assert_array_equal(damaged, plain)
+    return cache_stats("damage").hits - hits
+
+def test_moving_one_square_matches_full_redraws():
+    pair = scenes()
+    both(pair, lambda scene: None)
+    for _ in range(5):
+        assert both(pair, lambda scene: scene.mobjects[0].shift(0.3 * RIGHT + 0.1 * UP)) == 1
+    # Changing colour in place, and removing a mobject
+    assert both(pair, lambda scene: scene.mobjects[1].set_stroke(GREEN)) == 1
+    assert both(pair, lambda scene: scene.remove(scene.mobjects[2])) == 1
+
+def test_camera_move_redraws_everything():
+    pair = scenes()
+    both(pair, lambda scene: None)
+
+    def pan(scene):
+        scene.renderer.camera.frame_center = np.array([0.5, 0, 0])
+
+    assert both(pair, pan) == 0
+
+def test_z_order_change_redraws_everything():
+    pair = scenes()
+    both(pair, lambda scene: None)
+    assert both(pair, lambda scene: scene.bring_to_front(scene.mobjects[0])) == 0
+
+def test_image_mobjects_redraw_everything():
+    pair = scenes()
+    both(pair, lambda scene: scene.add(ImageMobject(np.uint8([[0, 255], [255, 0]])).scale(0.5)))
+    assert both(pair, lambda scene: scene.mobjects[0].shift(RIGHT)) == 0
+
+def test_changes_over_most_of_the_frame_redraw_everything():
+    pair = scenes()
+    both(pair, lambda scene: scene.add(Rectangle(width = 14, height = 7.5).set_fill(GREY, 0.5)))
+    assert both(pair, lambda scene: scene.mobjects[-1].shift(0.1 * RIGHT)) == 0
+
+def test_static_frame_data_keeps_the_last_frame():
+    damaged, plain = scenes()
+    frame(damaged)
+    last = damaged.renderer.get_frame()
+    static = [damaged.mobjects[1]]
+    image = damaged.renderer.save_static_frame_data(damaged, static)
+    np.testing.assert_array_equal(damaged.renderer.get_frame(), last)
+    # The static image itself holds only the static mobjects, as manim's does
+    frame(plain)
+    np.testing.assert_array_equal(image, plain.renderer.save_static_frame_data(plain, [plain.mobjects[1]]))
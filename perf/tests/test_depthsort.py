@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+
+from perf.depthsort import IncrementalSortCamera
+
+restore_ties = IncrementalSortCamera._restore_ties
+
+def resorted(depths, previous):
+    """What IncrementalSortCamera makes of depths, starting from the previous order."""
+    order = previous[np.argsort(depths[previous], kind = "stable")]
+    restore_ties(order, depths[order])
+    return order
+
+def test_runs_of_equal_depth_go_back_to_family_order():
+    order = np.array([4, 2, 0, 3, 1, 5])
+    restore_ties(order, np.array([0.0, 1.0, 1.0, 1.0, 2.0, 2.0]))
+    assert order.tolist() == [4, 0, 2, 3, 1, 5]
+
+def test_distinct_depths_are_left_alone():
+    order = np.array([3, 1, 2, 0])
+    restore_ties(order, np.array([0.0, 1.0, 2.0, 3.0]))
+    assert order.tolist() == [3, 1, 2, 0]
+
+def test_ties_at_both_ends():
+    order = np.array([2, 0, 1, 5, 4, 3])
+    restore_ties(order, np.array([0.0, 0.0, 1.0, 2.0, np.inf, np.inf]))
+    assert order.tolist() == [0, 2, 1, 5, 3, 4]
+
+def test_one_long_run():
+    order = np.array([3, 1, 2, 0])
+    restore_ties(order, np.zeros(4))
+    assert order.tolist() == [0, 1, 2, 3]
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_a_stable_sort_from_family_order(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 200))
+    # Few distinct values, so there are plenty of ties; non-3D mobjects sort last at inf
+    depths = rng.integers(0, 10, n).astype(float)
+    depths[rng.uniform(size = n) < 0.2] = np.inf
+    previous = rng.permutation(n)
+    np.testing.assert_array_equal(resorted(depths, previous), np.argsort(depths, kind = "stable"))
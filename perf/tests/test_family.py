@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import *
+
+from perf.family import cached_families
+
+def walk(mob):
+    """mob's family, computed from scratch."""
+    return [mob] + [member for submob in mob.submobjects for member in walk(submob)]
+
+def nested():
+    inner = VGroup(Square(), Circle())
+    middle = VGroup(inner, Triangle())
+    return VGroup(middle, Dot()), middle, inner
+
+def test_family_is_cached_until_changed():
+    with cached_families():
+        outer, _, _ = nested()
+        family = outer.get_family()
+        assert outer.get_family() is family
+        assert family == walk(outer)
+
+def test_add_below_invalidates_every_ancestor():
+    with cached_families():
+        outer, middle, inner = nested()
+        for mob in (outer, middle, inner):
+            mob.get_family()
+        star = Star()
+        inner.add(star)
+        for mob in (outer, middle, inner):
+            assert star in mob.get_family()
+            assert mob.get_family() == walk(mob)
+
+def test_remove_below_invalidates_every_ancestor():
+    with cached_families():
+        outer, middle, inner = nested()
+        square = inner[0]
+        outer.get_family()
+        inner.remove(square)
+        assert square not in outer.get_family()
+        assert outer.get_family() == walk(outer)
+
+def test_in_place_list_changes_invalidate():
+    with cached_families():
+        outer, middle, inner = nested()
+        outer.get_family()
+        inner.submobjects.append(Star())
+        assert outer.get_family() == walk(outer)
+        middle.submobjects[1] = Dot()
+        assert outer.get_family() == walk(outer)
+        middle.submobjects = [inner]
+        assert outer.get_family() == walk(outer)
+
+def test_become_invalidates_every_ancestor():
+    with cached_families():
+        outer, middle, inner = nested()
+        outer.get_family()
+        inner.become(VGroup(Square(), Circle(), Triangle(), Star()))
+        assert len(inner.submobjects) == 4
+        assert outer.get_family() == walk(outer)
+
+def test_copies_do_not_share_cached_families():
+    with cached_families():
+        outer, _, inner = nested()
+        outer.get_family()
+        copy = outer.copy()
+        assert copy.get_family() == walk(copy)
+        assert not set(map(id, copy.get_family())) & set(map(id, outer.get_family()))
+
+def test_patches_are_removed_afterwards():
+    with cached_families():
+        pass
+    assert "submobjects" not in Mobject.__dict__
+    outer, _, inner = nested()
+    family = outer.get_family()
+    assert outer.get_family() is not family
@@ -0,0 +1,67 @@
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.lod import LodCamera, convex_hull
+
+def test_convex_hull_of_a_square_with_inner_points():
+    points = np.array([[0, 0], [2, 0], [2, 2], [0, 2], [1, 1], [0.5, 1.5], [1, 0]], dtype = float)
+    hull = convex_hull(points)
+    # Counterclockwise from the lowest x; the point on an edge is left out
+    assert hull == [0, 1, 2, 3]
+
+def test_convex_hull_of_random_points_contains_them_all():
+    points = np.random.default_rng(0).normal(size = (200, 2))
+    hull = points[convex_hull(points)]
+    edges = np.roll(hull, -1, axis = 0) - hull
+    for point in points:
+        cross = edges[:, 0] * (point[1] - hull[:, 1]) - edges[:, 1] * (point[0] - hull[:, 0])
+        assert (cross >= -1e-12).all()
+
+def test_convex_hull_of_too_few_points():
+    assert convex_hull(np.array([[1.0, 0.0], [0.0, 0.0]])) == [1, 0]
+
+def plane(resolution = 4):
+    return Surface(lambda u, v: np.array([u, v, 0]), u_range = [0, 4], v_range = [0, 4], resolution = resolution)
+
+def camera():
+    return SimpleNamespace(_coarse = weakref.WeakKeyDictionary())
+
+def coarse_faces(cam, surface, k):
+    return LodCamera._coarse_faces(cam, surface, k)
+
+def test_merged_faces_take_the_outer_corners_of_their_block():
+    surface = plane()
+    merged = coarse_faces(camera(), surface, 2)
+    assert len(merged) == 4
+    blocks = [(0, 0), (0, 2), (2, 0), (2, 2)]
+    for face, (u, v) in zip(merged, blocks):
+        np.testing.assert_allclose(
+            face.points[::4][:4],
+            [[u, v, 0], [u + 2, v, 0], [u + 2, v + 2, 0], [u, v + 2, 0]],
+        )
+
+def test_merged_faces_take_the_mean_colour():
+    surface = plane()
+    merged = coarse_faces(camera(), surface, 4)
+    expected = np.concatenate([face.fill_rgbas for face in surface.submobjects]).mean(axis = 0)
+    np.testing.assert_allclose(merged[0].fill_rgbas[0], expected)
+
+def test_merged_faces_are_kept_until_something_changes():
+    cam, surface = camera(), plane()
+    merged = coarse_faces(cam, surface, 2)
+    assert coarse_faces(cam, surface, 2) is merged
+    surface.set_fill(RED, opacity = 0.5)
+    refilled = coarse_faces(cam, surface, 2)
+    assert refilled is not merged
+    np.testing.assert_allclose(refilled[0].fill_rgbas[0], [*color_to_rgb(RED), 0.5])
+    # Points written in place
+    np.multiply(surface[0].points, 2, out = surface[0].points)
+    assert coarse_faces(cam, surface, 2) is not refilled
+    assert coarse_faces(cam, surface, 4) is not coarse_faces(cam, surface, 2)
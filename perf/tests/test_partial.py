@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+from manim.utils.bezier import partial_bezier_points
+
+from perf.partial import PartialPaths, partial_curves
+
+ALPHAS = [0, 0.1, 0.3, 0.5, 0.77, 0.999, 1]
+
+def test_partial_curves_match_partial_bezier_points():
+    rng = np.random.default_rng(0)
+    curves = rng.normal(size = (50, 4, 3))
+    a = rng.uniform(0, 1, 50)
+    b = a + (1 - a) * rng.uniform(0, 1, 50)
+    pieces = partial_curves(curves, a, b)
+    for curve, lo, hi, piece in zip(curves, a, b, pieces):
+        np.testing.assert_allclose(piece, partial_bezier_points(curve, lo, hi), atol = 1e-12)
+
+def test_whole_curves_come_back_unchanged():
+    curves = np.random.default_rng(1).normal(size = (5, 4, 3))
+    np.testing.assert_allclose(partial_curves(curves, np.zeros(5), np.ones(5)), curves, atol = 1e-12)
+
+def shapes():
+    return VGroup(Circle(), Square().shift(RIGHT), Line(LEFT, UP), VMobject(), Arc(angle = 3).set_stroke(RED))
+
+def drawn(animation_cls, alpha, tables):
+    mob = shapes()
+    animation = animation_cls(mob)
+    animation.begin()
+    if tables:
+        PartialPaths(animation).interpolate_mobject(alpha)
+    else:
+        animation.interpolate_mobject(alpha)
+    return mob.get_family()
+
+@pytest.mark.parametrize("animation_cls", [Create, Uncreate, DrawBorderThenFill])
+@pytest.mark.parametrize("alpha", ALPHAS)
+def test_tables_draw_what_pointwise_become_partial_draws(animation_cls, alpha):
+    stock, tabled = drawn(animation_cls, alpha, False), drawn(animation_cls, alpha, True)
+    for expected, actual in zip(stock, tabled):
+        np.testing.assert_allclose(actual.points, expected.points, atol = 1e-12)
+        if isinstance(expected, VMobject):
+            np.testing.assert_array_equal(actual.stroke_rgbas, expected.stroke_rgbas)
+            np.testing.assert_array_equal(actual.fill_rgbas, expected.fill_rgbas)
+
+def test_arc_length_tables_draw_at_an_even_speed():
+    # Half of a path made of one long and one short segment ends inside the long one
+    path = VMobject().set_points_as_corners([LEFT * 3, ORIGIN, UP])
+    animation = Create(path)
+    animation.begin()
+    PartialPaths(animation, by_arc_length = True).interpolate_mobject(0.5)
+    np.testing.assert_allclose(path.points[-1], [-1, 0, 0], atol = 1e-9)
@@ -0,0 +1,72 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.reactive import ReactiveMixin, updater_inputs
+from perf.stats import cache_stats
+
+class ReactiveScene(ReactiveMixin, Scene):
+    pass
+
+def frames(scene, n = 1):
+    for _ in range(n):
+        scene.update_mobjects(0)
+
+def test_unchanged_inputs_skip_the_updater():
+    scene = ReactiveScene()
+    tracker = ValueTracker(1)
+    dot = Dot().add_updater(lambda m: m.move_to(RIGHT * tracker.get_value()))
+    scene.add(dot)
+    frames(scene)
+    hits = cache_stats("updaters").hits
+    frames(scene, 3)
+    assert cache_stats("updaters").hits == hits + 3
+    tracker.set_value(2)
+    frames(scene)
+    np.testing.assert_allclose(dot.get_center(), 2 * RIGHT)
+
+def test_rebound_closure_variable_is_seen():
+    scene = ReactiveScene()
+    k = 0
+    dot = Dot().add_updater(lambda m: m.move_to(RIGHT * k))
+    scene.add(dot)
+    frames(scene, 2)
+    k = 2
+    frames(scene)
+    np.testing.assert_allclose(dot.get_center(), 2 * RIGHT)
+
+def test_changed_captured_list_is_seen():
+    scene = ReactiveScene()
+    targets = [Dot(LEFT)]
+    dot = Dot().add_updater(lambda m: m.move_to(targets[-1]))
+    scene.add(dot)
+    frames(scene, 2)
+    np.testing.assert_allclose(dot.get_center(), LEFT)
+    targets.append(Dot(3 * RIGHT))
+    frames(scene)
+    np.testing.assert_allclose(dot.get_center(), 3 * RIGHT)
+    targets[-1] = Dot(UP)
+    frames(scene)
+    np.testing.assert_allclose(dot.get_center(), UP)
+
+def test_stateful_updaters_run_every_frame():
+    scene = ReactiveScene()
+    calls = 0
+
+    def count(m):
+        nonlocal calls
+        calls += 1
+
+    scene.add(Dot().add_updater(count))
+    frames(scene, 4)
+    assert calls == 4
+
+def test_tracing_reads_cells_as_they_are_now():
+    k = 1
+    updater = lambda m: m.shift(RIGHT * k)
+    assert 1 in updater_inputs(updater)
+    k = 5
+    assert 5 in updater_inputs(updater)
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+
+from perf.rects import blit_rect, device_rect
+
+RED = (1.0, 0.0, 0.0, 1.0)
+
+def blank(width = 8, height = 6):
+    return np.zeros((height, width, 4), dtype = np.uint8)
+
+def test_opaque_pixel_aligned_rect_fills_exactly_its_pixels():
+    pixels = blank()
+    blit_rect(pixels, (2, 1, 5, 4), RED)
+    expected = blank()
+    expected[1:4, 2:5] = (255, 0, 0, 255)
+    np.testing.assert_array_equal(pixels, expected)
+
+def test_partially_covered_edges_get_their_area_coverage():
+    pixels = blank()
+    blit_rect(pixels, (2.5, 1, 5, 4), RED)
+    # Half of column 2 is covered: half of red over transparent black
+    np.testing.assert_array_equal(pixels[1:4, 2], [[128, 0, 0, 128]] * 3)
+    np.testing.assert_array_equal(pixels[1:4, 3:5], np.full((3, 2, 4), (255, 0, 0, 255)))
+    assert not pixels[:, :2].any() and not pixels[:, 5:].any()
+
+def test_translucent_fill_blends_over_what_is_there():
+    pixels = blank()
+    pixels[:] = (0, 0, 200, 255)
+    blit_rect(pixels, (0, 0, 8, 6), (1.0, 0.0, 0.0, 0.25))
+    np.testing.assert_array_equal(pixels[0, 0], [64, 0, 150, 255])
+    assert (pixels == pixels[0, 0]).all()
+
+def test_clip_limits_what_is_touched():
+    pixels = blank()
+    blit_rect(pixels, (0, 0, 8, 6), RED, clip = (4, 2, 6, 3))
+    expected = blank()
+    expected[2:3, 4:6] = (255, 0, 0, 255)
+    np.testing.assert_array_equal(pixels, expected)
+
+def test_rect_outside_the_pixels_changes_nothing():
+    pixels = blank()
+    blit_rect(pixels, (20, 20, 30, 30), RED)
+    blit_rect(pixels, (-5, 0, -1, 4), RED)
+    assert not pixels.any()
+
+def _matrix(xx = 10, yy = -10, x0 = 40, y0 = 30, xy = 0, yx = 0):
+    return SimpleNamespace(xx = xx, yy = yy, x0 = x0, y0 = y0, xy = xy, yx = yx)
+
+def _rect_points(corners):
+    # Straight cubics the way Polygon builds them: anchors and handles on each edge
+    points = []
+    for start, end in zip(corners, corners[1:] + corners[:1]):
+        start, end = np.array(start, dtype = float), np.array(end, dtype = float)
+        points += [start + (end - start) * t for t in (0, 1 / 3, 2 / 3, 1)]
+    return np.array(points)
+
+def test_device_rect_of_an_axis_aligned_rectangle():
+    points = _rect_points([(1, 1, 0), (-1, 1, 0), (-1, -1, 0), (1, -1, 0)])
+    assert device_rect(points, _matrix()) == pytest.approx((30, 20, 50, 40))
+
+def test_device_rect_rejects_rotated_shapes():
+    points = _rect_points([(1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, -1, 0)])
+    assert device_rect(points, _matrix()) is None
+    square = _rect_points([(1, 1, 0), (-1, 1, 0), (-1, -1, 0), (1, -1, 0)])
+    assert device_rect(square, _matrix(xy = 1)) is None
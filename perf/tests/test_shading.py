@@ -0,0 +1,83 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.shading import ShadingCacheCamera, shading_indices
+from perf.stats import cache_stats
+
+SIZES = [4, 8, 12, 16, 20, 32]
+
+class CachingCamera(ShadingCacheCamera, ThreeDCamera):
+    pass
+
+def face(n_points, seed = 0):
+    mob = VMobject(shade_in_3d = True)
+    mob.points = np.random.default_rng(seed).normal(size = (n_points, 3))
+    return mob.set_fill(BLUE, opacity = 0.8)
+
+def rgbas(n = 2):
+    return np.array([[0.2, 0.4, 0.8, 1.0], [0.9, 0.1, 0.3, 0.5], [0.5, 0.5, 0.5, 1.0]][:n])
+
+@pytest.mark.parametrize("n_points", SIZES)
+@pytest.mark.parametrize("n_colours", [1, 2, 3])
+def test_cached_shading_matches_manim(n_points, n_colours):
+    cached, plain = CachingCamera(), ThreeDCamera()
+    mob = face(n_points)
+    expected = plain.modified_rgbas(mob, rgbas(n_colours))
+    for _ in range(2):
+        np.testing.assert_array_equal(cached.modified_rgbas(mob, rgbas(n_colours)), expected)
+
+@pytest.mark.parametrize("n_points", SIZES)
+def test_shading_reads_only_the_indexed_points(n_points):
+    # Moving any other point leaves manim's shading as it is, so the key misses nothing
+    camera = ThreeDCamera()
+    mob = face(n_points)
+    expected = camera.modified_rgbas(mob, rgbas())
+    others = [i for i in range(n_points) if i not in shading_indices(n_points)]
+    mob.points[others] += 5
+    np.testing.assert_array_equal(camera.modified_rgbas(mob, rgbas()), expected)
+    for i in shading_indices(n_points):
+        moved = face(n_points)
+        moved.points[i] += [0.3, -0.7, 1.1]
+        if not np.array_equal(camera.modified_rgbas(moved, rgbas()), expected):
+            break
+    else:
+        pytest.fail("no indexed point changes the shading")
+
+def test_in_place_colour_change_shades_again():
+    cached, plain = CachingCamera(), ThreeDCamera()
+    mob = face(16)
+    cached.modified_rgbas(mob, mob.fill_rgbas)
+    misses = cache_stats("shading").misses
+    mob.set_fill(RED, opacity = 0.4)
+    np.testing.assert_array_equal(cached.modified_rgbas(mob, mob.fill_rgbas), plain.modified_rgbas(mob, mob.fill_rgbas))
+    assert cache_stats("shading").misses == misses + 1
+
+def test_in_place_point_change_shades_again():
+    cached, plain = CachingCamera(), ThreeDCamera()
+    mob = face(16)
+    cached.modified_rgbas(mob, mob.fill_rgbas)
+    mob.shift(2 * OUT)
+    np.testing.assert_array_equal(cached.modified_rgbas(mob, mob.fill_rgbas), plain.modified_rgbas(mob, mob.fill_rgbas))
+
+def test_light_move_shades_again():
+    cached, plain = CachingCamera(), ThreeDCamera()
+    mob = face(16)
+    cached.modified_rgbas(mob, mob.fill_rgbas)
+    misses = cache_stats("shading").misses
+    for camera in (cached, plain):
+        camera.light_source.move_to(3 * LEFT + OUT)
+    np.testing.assert_array_equal(cached.modified_rgbas(mob, mob.fill_rgbas), plain.modified_rgbas(mob, mob.fill_rgbas))
+    assert cache_stats("shading").misses == misses + 1
+
+def test_camera_turns_keep_the_cache():
+    cached = CachingCamera()
+    mob = face(16)
+    cached.modified_rgbas(mob, mob.fill_rgbas)
+    hits = cache_stats("shading").hits
+    cached.set_theta(1.0)
+    cached.modified_rgbas(mob, mob.fill_rgbas)
+    assert cache_stats("shading").hits == hits + 1
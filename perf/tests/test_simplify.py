@@ -0,0 +1,133 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.simplify import _bernstein, douglas_peucker, fit_cubic, no_simplification, pixel_size, simplified_paths, simplify
+
+def _distance_to_polyline(point, polyline):
+    best = np.inf
+    for a, b in zip(polyline, polyline[1:]):
+        ab = b - a
+        t = np.clip((point - a) @ ab / (ab @ ab), 0, 1) if ab @ ab > 0 else 0
+        best = min(best, np.linalg.norm(point - (a + t * ab)))
+    return best
+
+def test_douglas_peucker_drops_collinear_points():
+    points = np.stack([np.linspace(0, 1, 20), np.linspace(0, 2, 20), np.zeros(20)], axis = 1)
+    assert douglas_peucker(points, 1e-6, list(range(20))) == [0, 19]
+
+def test_douglas_peucker_keeps_corners():
+    points = np.array([[x, 0, 0] for x in range(5)] + [[4, y, 0] for y in range(1, 5)], dtype = float)
+    assert douglas_peucker(points, 0.1, list(range(len(points)))) == [0, 4, 8]
+
+def test_douglas_peucker_keeps_every_point_within_tolerance():
+    rng = np.random.default_rng(0)
+    points = np.cumsum(rng.normal(size = (200, 3)) * [1, 1, 0], axis = 0)
+    kept = douglas_peucker(points, 0.5, list(range(len(points))))
+    assert kept[0] == 0 and kept[-1] == len(points) - 1 and kept == sorted(kept)
+    polyline = points[kept]
+    assert max(_distance_to_polyline(p, polyline) for p in points) <= 0.5 + 1e-9
+
+def test_douglas_peucker_only_returns_candidates():
+    points = np.array([[np.cos(t), np.sin(t), 0] for t in np.linspace(0, 3, 41)])
+    candidates = list(range(0, 41, 4))
+    kept = douglas_peucker(points, 0.01, candidates)
+    assert set(kept) <= set(candidates) and kept[0] == 0 and kept[-1] == 40
+
+def test_fit_cubic_keeps_ends_and_tangents():
+    t = np.linspace(0, np.pi / 2, 17)
+    samples = np.stack([np.cos(t), np.sin(t), np.zeros_like(t)], axis = 1)
+    # The end tangent points back along the curve, from its last point
+    curve, errors = fit_cubic(samples, UP, RIGHT)
+    np.testing.assert_array_equal(curve[0], samples[0])
+    np.testing.assert_array_equal(curve[3], samples[-1])
+    np.testing.assert_allclose(np.cross(curve[1] - curve[0], UP), 0, atol = 1e-12)
+    np.testing.assert_allclose(np.cross(curve[2] - curve[3], RIGHT), 0, atol = 1e-12)
+    assert (curve[1] - curve[0]) @ UP > 0 and (curve[2] - curve[3]) @ RIGHT > 0
+    # A quarter circle is within a few thousandths of a cubic
+    assert len(errors) == len(samples) and errors.max() < 5e-3
+
+def test_fit_cubic_reproduces_a_cubic():
+    curve = np.array([[0, 0, 0], [1, 0, 0], [2, 1, 0], [3, 1, 0]], dtype = float)
+    samples = _bernstein(np.linspace(0, 1, 33)) @ curve
+    fitted, errors = fit_cubic(samples, RIGHT, LEFT)
+    # Chord-length parameters are not the curve's own, so it comes back close, not exact
+    assert errors.max() < 2e-2
+    np.testing.assert_allclose(fitted, curve, atol = 0.1)
+
+def wave():
+    xs = np.linspace(-6, 6, 400)
+    return VMobject().set_points_smoothly(np.stack([xs, np.sin(xs), np.zeros_like(xs)], axis = 1))
+
+def _polyline_distances(points, polyline):
+    a, b = polyline[:-1], polyline[1:]
+    ab = b - a
+    lengths = np.maximum(np.einsum("sd,sd->s", ab, ab), 1e-300)
+    distances = []
+    for point in points:
+        t = np.clip(np.einsum("sd,sd->s", point - a, ab) / lengths, 0, 1)
+        distances.append(np.linalg.norm(point - (a + t[:, None] * ab), axis = 1).min())
+    return np.array(distances)
+
+def _max_deviation(original, simplified):
+    """How far the points simplify measures at on the original get from the simplified path."""
+    def sample(mob, t):
+        curves = mob.points.reshape(-1, 4, 3)
+        return np.einsum("sk,nkd->nsd", _bernstein(t), curves).reshape(-1, 3)
+    samples = sample(original, np.linspace(0, 1, 5)[:-1])
+    return _polyline_distances(samples, sample(simplified, np.linspace(0, 1, 65))).max()
+
+def test_simplify_stays_within_tolerance():
+    original, simplified = wave(), wave()
+    simplify(simplified)
+    assert simplified.get_num_curves() < original.get_num_curves() / 4
+    assert _max_deviation(original, simplified) <= 0.5 * pixel_size() * 1.01
+
+def test_simplified_paths_are_not_refitted():
+    mob = wave()
+    simplify(mob)
+    points = np.array(mob.points)
+    simplify(mob)
+    np.testing.assert_array_equal(mob.points, points)
+
+def test_own_points_only():
+    parent, child = wave(), wave()
+    parent.add(child)
+    before = np.array(child.points)
+    simplify(parent, family = False)
+    np.testing.assert_array_equal(child.points, before)
+    assert parent.get_num_curves() < child.get_num_curves()
+
+def test_opted_out_paths_are_left_alone():
+    mob = wave()
+    mob.simplify_paths = False
+    before = np.array(mob.points)
+    simplify(mob)
+    np.testing.assert_array_equal(mob.points, before)
+
+def test_plots_are_simplified_as_they_are_made():
+    stock = FunctionGraph(np.sin)
+    with simplified_paths():
+        plot = FunctionGraph(np.sin)
+    assert plot.get_num_curves() < stock.get_num_curves()
+
+def test_plots_can_opt_out():
+    axes = Axes()
+    stock_graph, stock_plot = FunctionGraph(np.sin), axes.plot(np.cos)
+    with simplified_paths():
+        graph = FunctionGraph(np.sin, simplify_paths = False)
+        plot = axes.plot(np.cos, simplify_paths = False)
+        with no_simplification():
+            nested = FunctionGraph(np.sin)
+    np.testing.assert_array_equal(graph.points, stock_graph.points)
+    np.testing.assert_array_equal(plot.points, stock_plot.points)
+    np.testing.assert_array_equal(nested.points, stock_graph.points)
+
+def test_patches_are_removed_afterwards():
+    init = ParametricFunction.__dict__["__init__"]
+    with simplified_paths():
+        assert ParametricFunction.__dict__["__init__"] is not init
+    assert ParametricFunction.__dict__["__init__"] is init
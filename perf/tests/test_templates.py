@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.templates import ARC_TEMPLATES, polygon_points, primitive_templates
+
+CONSTRUCTORS = [
+    lambda: Circle(),
+    lambda: Circle(radius = 2.5, color = RED).shift(UP),
+    lambda: Arc(radius = 0.3, start_angle = 1, angle = 2.5, arc_center = [1, -2, 0]),
+    lambda: Arc(angle = -PI / 3, num_components = 5),
+    lambda: Dot([3, 1, 0]),
+    lambda: Ellipse(width = 3, height = 1),
+    lambda: ArcBetweenPoints(LEFT, UP * 2, angle = PI / 3),
+    lambda: Annulus(),
+    lambda: Square(1.5),
+    lambda: Rectangle(width = 4, height = 0.5),
+    lambda: Polygon([0, 0, 0], [1, 2, 0], [3, -1, 0], [0.5, -2, 0]),
+    lambda: Polygram([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[2, 2, 0], [3, 2, 0], [3, 3, 0]]),
+    lambda: RegularPolygon(7),
+    lambda: Star(),
+    lambda: Triangle(),
+]
+
+@pytest.mark.parametrize("index", range(len(CONSTRUCTORS)))
+def test_templated_geometry_is_bit_identical(index):
+    stock = CONSTRUCTORS[index]()
+    with primitive_templates():
+        # The second one comes from the template the first one left
+        first, second = CONSTRUCTORS[index](), CONSTRUCTORS[index]()
+    for templated in (first, second):
+        assert len(templated.get_family()) == len(stock.get_family())
+        for expected, actual in zip(stock.get_family(), templated.get_family()):
+            np.testing.assert_array_equal(actual.points, expected.points)
+            np.testing.assert_array_equal(actual.stroke_rgbas, expected.stroke_rgbas)
+            np.testing.assert_array_equal(actual.fill_rgbas, expected.fill_rgbas)
+
+def test_arcs_do_not_share_points_with_their_template():
+    with primitive_templates():
+        circle = Circle()
+        circle.points[0] = [9, 9, 9]
+        circle.shift(RIGHT)
+        again = Circle()
+    np.testing.assert_array_equal(again.points, Circle().points)
+    assert all(not template.flags.writeable for template in ARC_TEMPLATES.values())
+
+def test_polygon_points_match_add_points_as_corners():
+    vertices = np.array([[0, 0, 0], [1, 2, 0], [3, -1, 0]], dtype = float)
+    path = VMobject()
+    path.start_new_path(vertices[0])
+    path.add_points_as_corners([*vertices[1:], vertices[0]])
+    np.testing.assert_array_equal(polygon_points(vertices, path._bezier_t_values), path.points)
+
+def test_patches_are_removed_afterwards():
+    originals = (Arc.__dict__["generate_points"], Polygram.__dict__["__init__"])
+    with primitive_templates():
+        pass
+    assert (Arc.__dict__["generate_points"], Polygram.__dict__["__init__"]) == originals
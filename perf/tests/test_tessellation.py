@@ -0,0 +1,91 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+from manim import *
+
+from perf.tessellation import TESSELLATIONS, cached_tessellations
+
+CONSTRUCTORS = [
+    lambda: Sphere(resolution = (16, 16)),
+    lambda: Sphere(radius = 0.5, resolution = (16, 16), checkerboard_colors = [RED, GREEN]),
+    lambda: Cylinder(radius = 0.3, height = 2, resolution = (12, 4)),
+    lambda: Line3D(LEFT, UP + OUT, thickness = 0.05, color = YELLOW),
+    lambda: Cube(side_length = 1.5, fill_color = RED),
+    lambda: Prism(dimensions = [1, 2, 3]),
+]
+
+@pytest.fixture(autouse = True)
+def empty_cache():
+    TESSELLATIONS.clear()
+    yield
+    TESSELLATIONS.clear()
+
+def assert_same(actual, expected):
+    assert len(actual.get_family()) == len(expected.get_family())
+    for a, e in zip(actual.get_family(), expected.get_family()):
+        assert type(a) is type(e)
+        np.testing.assert_array_equal(a.points, e.points)
+        if isinstance(e, VMobject):
+            np.testing.assert_array_equal(a.fill_rgbas, e.fill_rgbas)
+            np.testing.assert_array_equal(a.stroke_rgbas, e.stroke_rgbas)
+            assert a.shade_in_3d == e.shade_in_3d
+        for attr in ("u_index", "v_index"):
+            assert getattr(a, attr, None) == getattr(e, attr, None)
+
+@pytest.mark.parametrize("index", range(len(CONSTRUCTORS)))
+def test_cached_shapes_match_fresh_ones(index):
+    stock = CONSTRUCTORS[index]()
+    with cached_tessellations():
+        first, second = CONSTRUCTORS[index](), CONSTRUCTORS[index]()
+    assert TESSELLATIONS
+    assert_same(first, stock)
+    assert_same(second, stock)
+
+def test_clones_share_no_arrays():
+    with cached_tessellations():
+        spheres = [Sphere(resolution = (8, 8)) for _ in range(3)]
+    cached = [face for faces in TESSELLATIONS.values() for face in faces]
+    faces = [face for sphere in spheres for face in sphere.submobjects]
+    for i, face in enumerate(faces):
+        for other in faces[i + 1:] + cached:
+            for attr in ("points", "fill_rgbas", "stroke_rgbas"):
+                assert not np.shares_memory(getattr(face, attr), getattr(other, attr))
+    spheres[1].submobjects[0].points[0] = [9, 9, 9]
+    assert_same(spheres[2], Sphere(resolution = (8, 8)))
+
+def test_prisms_and_cubes_share_the_cube_lookup_correctly():
+    with cached_tessellations():
+        # A Prism builds its cube first, then stretches it: the cached cube stays a cube
+        prism = Prism(dimensions = [1, 2, 3])
+        cube = Cube()
+        other = Prism(dimensions = [3, 1, 1])
+    assert_same(prism, Prism(dimensions = [1, 2, 3]))
+    assert_same(cube, Cube())
+    assert_same(other, Prism(dimensions = [3, 1, 1]))
+
+def test_surfaces_with_their_own_function_are_built_as_usual():
+    def wave(u, v):
+        return np.array([u, v, np.sin(u) * np.cos(v)])
+
+    stock = Surface(wave, u_range = [0, 3], v_range = [0, 3], resolution = 8)
+    with cached_tessellations():
+        surface = Surface(wave, u_range = [0, 3], v_range = [0, 3], resolution = 8)
+    assert not TESSELLATIONS
+    assert_same(surface, stock)
+
+def test_patches_are_removed_afterwards():
+    before = {
+        klass: {name: klass.__dict__.get(name) for name in ("_setup_in_uv_space", "apply_function", "generate_points", "init_points")}
+        for klass in (Surface, Cube, Prism)
+    }
+    with cached_tessellations():
+        assert "apply_function" in Surface.__dict__
+    after = {
+        klass: {name: klass.__dict__.get(name) for name in names}
+        for klass, names in before.items()
+    }
+    assert after == before
+    assert "apply_function" not in Surface.__dict__
+    assert "init_points" not in Prism.__dict__
@@ -0,0 +1,125 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cairo
+from manim import *
+
+from .compose import ComposedScene
+
+# Tiled rasterization: the usual Camera code builds every path and colour on
+# one thread, but instead of filling and stroking straight away each paint is
+# recorded. The frame is then cut into horizontal bands, and a thread pool
+# replays onto each band only the paints whose device bounding box touches it.
+# Pycairo releases the GIL around fill and stroke, so the bands rasterize in
+# parallel.
+
+# Fewer vmobjects than this in a batch are drawn the usual way
+MIN_TILED = 64
+
+class PaintOp():
+    __slots__ = ("fill", "path", "source", "line_width", "line_join", "line_cap", "top", "bottom")
+
+    def __init__(self, fill, path, source, line_width, line_join, line_cap, top, bottom):
+        self.fill = fill
+        self.path = path
+        self.source = source
+        self.line_width = line_width
+        self.line_join = line_join
+        self.line_cap = line_cap
+        self.top = top
+        self.bottom = bottom
+
+class RecordingContext():
+    """
+    Stands in for a cairo.Context in Camera.display_vectorized.
+
+    Path building and source setting go to a real context on a 1x1 surface
+    (with the camera's matrix); fill_preserve and stroke_preserve append a
+    PaintOp, with its vertical extent in device pixels, instead of painting.
+    """
+    def __init__(self, matrix):
+        self._ctx = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+        self._ctx.set_matrix(matrix)
+        self.ops = []
+        self._path = None
+
+    def __getattr__(self, name):
+        return getattr(self._ctx, name)
+
+    def new_path(self):
+        self._path = None
+        self._ctx.new_path()
+
+    def _record(self, fill, extents):
+        ctx = self._ctx
+        if self._path is None:
+            self._path = ctx.copy_path()
+        x0, y0, x1, y1 = extents
+        ys = [ctx.user_to_device(x, y)[1] for x, y in ((x0, y0), (x1, y1))]
+        self.ops.append(PaintOp(
+            fill, self._path, ctx.get_source(), ctx.get_line_width(),
+            ctx.get_line_join(), ctx.get_line_cap(), min(ys) - 1, max(ys) + 1,
+        ))
+
+    def fill_preserve(self):
+        self._record(True, self._ctx.fill_extents())
+
+    def stroke_preserve(self):
+        self._record(False, self._ctx.stroke_extents())
+
+def paint_band(pixel_array, top, bottom, matrix, ops):
+    """Replay the ops touching rows [top, bottom) of pixel_array onto those rows."""
+    height, width = bottom - top, pixel_array.shape[1]
+    surface = cairo.ImageSurface.create_for_data(
+        pixel_array[top:bottom], cairo.FORMAT_ARGB32, width, height, width * 4,
+    )
+    ctx = cairo.Context(surface)
+    ctx.set_matrix(cairo.Matrix(matrix.xx, matrix.yx, matrix.xy, matrix.yy, matrix.x0, matrix.y0 - top))
+    for op in ops:
+        if op.bottom < top or op.top > bottom:
+            continue
+        ctx.new_path()
+        ctx.append_path(op.path)
+        ctx.set_source(op.source)
+        if op.fill:
+            ctx.fill()
+        else:
+            ctx.set_line_width(op.line_width)
+            ctx.set_line_join(op.line_join)
+            ctx.set_line_cap(op.line_cap)
+            ctx.stroke()
+    surface.flush()
+    surface.finish()
+
+class TiledCamera():
+    """Camera mixin rasterizing large vmobject batches in parallel horizontal bands."""
+    tile_workers = os.cpu_count() or 1
+    _pool = None
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        if len(vmobjects) < MIN_TILED or self.tile_workers < 2:
+            return super().display_multiple_non_background_colored_vmobjects(vmobjects, pixel_array)
+        matrix = self.get_cairo_context(pixel_array).get_matrix()
+        recorder = RecordingContext(matrix)
+        for vmobject in vmobjects:
+            self.display_vectorized(vmobject, recorder)
+
+        # Flush pending drawing through the camera's own surface before
+        # writing the same pixels through the band surfaces
+        self.get_cairo_context(pixel_array).get_target().flush()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers = self.tile_workers, thread_name_prefix = "tile")
+        height = pixel_array.shape[0]
+        bands = 2 * self.tile_workers
+        edges = [height * i // bands for i in range(bands + 1)]
+        futures = [
+            self._pool.submit(paint_band, pixel_array, top, bottom, matrix, recorder.ops)
+            for top, bottom in zip(edges, edges[1:]) if bottom > top
+        ]
+        for future in futures:
+            future.result()
+        self.get_cairo_context(pixel_array).get_target().mark_dirty()
+
+class TiledMixin(ComposedScene):
+    """Scene mixin turning on tiled, multi-threaded rasterization (see TiledCamera)."""
+    camera_mixins = (TiledCamera,)
@@ -0,0 +1,118 @@
+import json
+from dataclasses import asdict, dataclass, field
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from .hooks import TexRecorder, describe_animations, family_stats, heaviest_mobject
+from .loader import default_camera_class, instrument, load_scenes
+
+# Dry-run timeline: run `construct` with every play skipped and no frame ever
+# rasterized, and report what each play call puts on screen.
+
+@dataclass
+class PlayRecord:
+    index: int
+    start: float
+    run_time: float
+    animations: str
+    mobjects: int
+    points: int
+    updaters: int
+    tex: list = field(default_factory = list)
+    heaviest: str = ""
+    heaviest_points: int = 0
+
+class DryRunRenderer(CairoRenderer):
+    """A Cairo renderer that keeps all of the play bookkeeping but never draws."""
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def get_frame(self):
+        return self.camera.pixel_array
+
+class TimelineMixin():
+    """
+    Scene mixin that records a PlayRecord for every play (and so every wait).
+
+    TeX strings are attributed to the play that follows them, since that is
+    where mobjects built in `construct` between two plays first appear.
+    """
+    def setup(self):
+        super().setup()
+        self.timeline = []
+        self.tex_recorder = TexRecorder().start()
+
+    def tear_down(self):
+        self.tex_recorder.stop()
+        super().tear_down()
+
+    def play(self, *args, **kwargs):
+        start = self.time
+        super().play(*args, **kwargs)
+        mobjects, points, updaters = family_stats(self)
+        heaviest, heaviest_points = heaviest_mobject(self)
+        self.timeline.append(PlayRecord(
+            index = len(self.timeline),
+            start = start,
+            run_time = self.time - start,
+            animations = describe_animations(self.animations or []),
+            mobjects = mobjects,
+            points = points,
+            updaters = updaters,
+            tex = self.tex_recorder.drain(),
+            heaviest = type(heaviest).__name__ if heaviest is not None else "",
+            heaviest_points = heaviest_points,
+        ))
+
+def dry_run(scene_cls, *mixins):
+    """Run a scene through the dry-run renderer and return the instrumented scene."""
+    cls = instrument(scene_cls, TimelineMixin, *mixins)
+    config.dry_run = True
+    renderer = DryRunRenderer(camera_class = default_camera_class(scene_cls), skip_animations = True)
+    scene = cls(renderer = renderer, skip_animations = True)
+    scene.render()
+    return scene
+
+def format_timeline(name, timeline):
+    """The timeline as a fixed-width table followed by the totals."""
+    header = f"{'#':>4} {'start':>8} {'run':>6} {'mobs':>6} {'points':>9} {'upd':>4} {'tex':>4}  {'heaviest':<24} animations"
+    lines = [name, header, "-" * len(header)]
+    for r in timeline:
+        heaviest = f"{r.heaviest} ({r.heaviest_points})" if r.heaviest else ""
+        lines.append(
+            f"{r.index:>4} {r.start:>8.2f} {r.run_time:>6.2f} {r.mobjects:>6} {r.points:>9} "
+            f"{r.updaters:>4} {len(r.tex):>4}  {heaviest:<24} {r.animations}"
+        )
+    if timeline:
+        peak_mobs = max(timeline, key = lambda r: r.mobjects)
+        peak_points = max(timeline, key = lambda r: r.points)
+        total = timeline[-1].start + timeline[-1].run_time
+        lines.append("-" * len(header))
+        lines.append(
+            f"total {total:.2f}s over {len(timeline)} plays, "
+            f"{sum(len(r.tex) for r in timeline)} TeX strings, "
+            f"peak {peak_mobs.mobjects} mobjects at play {peak_mobs.index}, "
+            f"peak {peak_points.points} points at play {peak_points.index}"
+        )
+    return "\n".join(lines)
+
+# ---------- command line ----------
+
+def register(subparsers):
+    parser = subparsers.add_parser("timeline", help = "dry-run scenes and print a per-play timeline")
+    parser.add_argument("file", help = "project script, e.g. pts/main.py")
+    parser.add_argument("scenes", nargs = "*", help = "scene names (default: every scene in the file)")
+    parser.add_argument("--json", help = "also write the timelines to this file")
+    parser.set_defaults(func = main, path_args = ["file", "json"])
+
+def main(args):
+    results = {}
+    for scene_cls in load_scenes(args.file, args.scenes):
+        scene = dry_run(scene_cls)
+        print(format_timeline(scene_cls.__name__, scene.timeline))
+        print()
+        results[scene_cls.__name__] = [asdict(r) for r in scene.timeline]
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent = 2)
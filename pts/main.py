@@ -4,6 +4,7 @@ import numpy as np
 import random
 import re
 from fractions import Fraction
+from functools import lru_cache
 
 ##### SETTINGS #####
 
@@ -47,6 +48,45 @@ NORMAL_BUFFER = 0.5
 
 ####################
 
+# Stand-in for always_redraw when only the extent of a shape changes: the template is built once,
+# and every frame its points are rewritten in place as (template points - about) * scale_func() + about,
+# so nothing is allocated, copied or re-styled
+class ScaledRedraw(VGroup):
+    def __init__(self, template, scale_func, about = ORIGIN):
+        super().__init__(template)
+        self.about = np.array(about, dtype = float)
+        self.base_points = [(mob, mob.points - self.about) for mob in template.get_family() if len(mob.points)]
+        self.redraw(scale_func())
+        self.add_updater(lambda m: m.redraw(scale_func()))
+
+    def redraw(self, scale):
+        for mob, base in self.base_points:
+            if mob.points.shape != base.shape:
+                mob.points = np.empty_like(base)
+            np.multiply(base, scale, out = mob.points)
+            mob.points += self.about
+        return self
+
+# always_redraw that only rebuilds when key_func() changes; the last max_cached builds are kept by key,
+# and the mobject becomes a copy of the cached one when an earlier key comes back.
+# The key has to capture everything func depends on, positions included.
+# become() still copies the cached build's points and colours on every key change; only frames
+# where the key stays the same are free of copies
+def keyed_redraw(func, key_func, max_cached = 64):
+    build = lru_cache(maxsize = max_cached)(lambda key: func())
+    key = key_func()
+    mob = build(key).copy()
+    last_key = [key]
+
+    def update(m):
+        key = key_func()
+        if key != last_key[0]:
+            m.become(build(key))
+            last_key[0] = key
+
+    mob.add_updater(update)
+    return mob
+
 # Some titles
 class all_text(Scene):
     def construct(self):
@@ -374,13 +414,9 @@ class DimensionLadderExtrude(ThreeDScene):
         # 1D
         L = ValueTracker(0.0) # length
 
-        line = always_redraw(
-            lambda: Line(
-                start = LEFT * (L.get_value() / 2),
-                end = RIGHT * (L.get_value() / 2),
-                color = COLOR,
-                stroke_width = 10,
-            )
+        line = ScaledRedraw(
+            Line(start = LEFT / 2, end = RIGHT / 2, color = COLOR, stroke_width = 10),
+            lambda: [L.get_value(), 1, 1],
         )
 
         self.add(line)
@@ -396,15 +432,16 @@ class DimensionLadderExtrude(ThreeDScene):
         # 2D
         H = ValueTracker(0.0)
 
-        square_fill = always_redraw(
-            lambda: Rectangle(
+        square_fill = ScaledRedraw(
+            Rectangle(
                 width = S,
-                height = max(H.get_value(), 1e-3),
+                height = 1,
                 stroke_width = 0,
                 fill_opacity = 0.95,
                 color = COLOR,
                 fill_color = COLOR,
-            )
+            ),
+            lambda: [1, max(H.get_value(), 1e-3), 1],
         )
 
         self.add(square_fill)
@@ -421,10 +458,9 @@ class DimensionLadderExtrude(ThreeDScene):
         # 3D
         D = ValueTracker(1e-3)
 
-        prism = always_redraw(
-            lambda: Prism(
-                dimensions = (S, S, max(D.get_value(), 1e-3))
-            ).set_fill(COLOR, opacity = 0.95).set_stroke(width = 0)
+        prism = ScaledRedraw(
+            Prism(dimensions = (S, S, 1)).set_fill(COLOR, opacity = 0.95).set_stroke(width = 0),
+            lambda: [1, 1, max(D.get_value(), 1e-3)],
         )
 
         self.add(prism)
@@ -981,7 +1017,11 @@ class Slider_C_Chart(Scene):
                 Y = ratios[ : n + 1]
                 return axes.plot_line_graph(X, Y, add_vertex_dots = False).set_stroke(YELLOW, 3)
             
-        graph = always_redraw(graph_up_to_n)
+        # The graph, brace and label only change with the integer part of n (and with the layout)
+        def n_key(anchor):
+            return lambda: (int(n_tracker.get_value()), tuple(anchor.get_center()))
+
+        graph = keyed_redraw(graph_up_to_n, n_key(axes))
 
         top = VGroup(title, axes, x_label, y_label, y0, y1, graph).to_edge(UP, buff = 0.6)
 
@@ -1005,11 +1045,13 @@ class Slider_C_Chart(Scene):
                 return Brace(dummy, DOWN, buff = 0.08).set_opacity(0)
             return Brace(grp, DOWN, buff = 0.08)
 
-        brace = always_redraw(make_brace)
-        brace_label = always_redraw(lambda:
+        brace = keyed_redraw(make_brace, n_key(digits))
+        # placed under a brace of its own, so it depends on nothing but n and the digits, like the brace
+        brace_label = keyed_redraw(lambda:
             MathTex(r"x \upharpoonright {" + str(int(np.clip(n_tracker.get_value(), 0, n_max))) + r"}")
             .scale(0.9)
-            .next_to(brace, DOWN, buff = 0.12)
+            .next_to(make_brace(), DOWN, buff = 0.12),
+            n_key(digits)
         )
 
         middle = VGroup(mid_line, brace, brace_label)
@@ -1074,7 +1116,7 @@ class Slider_C_Chart(Scene):
             line.set_points_smoothly(pts)
             return line
 
-        graph2 = always_redraw(graph2_fn)
+        graph2 = keyed_redraw(graph2_fn, n_key(axes2))
 
         new_top = VGroup(title2, axes2, xlab2, ylab2, graph2)
         new_top.move_to(top) 